@@ -0,0 +1,96 @@
+import logging
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, JSONResponse
+
+from api.v1.parsing import CAD_REQUEST_BODY, get_cad_request
+from core.deps import get_cad_processor, get_job_manager
+from jobs import JobManager, JobQueueFullError
+from processor import CADProcessor
+from shared.models.base import LevelOfDetail
+from shared.models.exceptions import CADServiceException
+from shared.models.requests import CADRequest
+from shared.models.responses import JobResponse, JobStatus
+
+jobs_router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+
+def _get_job_or_404(job_manager: JobManager, job_id: str):
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@jobs_router.post("/jobs", status_code=202, openapi_extra=CAD_REQUEST_BODY)
+async def submit_job(
+    request: CADRequest = Depends(get_cad_request),
+    lod: Optional[LevelOfDetail] = Query(None, description="Tessellation preset"),
+    processor: CADProcessor = Depends(get_cad_processor),
+    job_manager: JobManager = Depends(get_job_manager),
+) -> JobResponse:
+    """Queue a CAD model for generation and return the job to poll."""
+    if lod:
+        request.config = processor.with_lod(request.config, lod)
+
+    try:
+        job = job_manager.submit(request)
+    except JobQueueFullError as e:
+        logger.warning(str(e))
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except CADServiceException as e:
+        raise HTTPException(status_code=422, detail=e.message)
+
+    return job.to_response()
+
+
+@jobs_router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str, job_manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """Report the status and progress of a job."""
+    return _get_job_or_404(job_manager, job_id).to_response()
+
+
+@jobs_router.get("/jobs/{job_id}/result")
+async def get_job_result(
+    job_id: str,
+    processor: CADProcessor = Depends(get_cad_processor),
+    job_manager: JobManager = Depends(get_job_manager),
+):
+    """Stream the exported model of a finished job."""
+    job = _get_job_or_404(job_manager, job_id)
+
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=409, detail=f"Job {job_id} is {job.status.value}, no result yet"
+        )
+    if not job.model_path or not os.path.exists(job.model_path):
+        raise HTTPException(
+            status_code=410, detail=f"The result of job {job_id} is no longer available"
+        )
+
+    exporter = processor.get_exporter(job.file_type)
+    return FileResponse(
+        job.model_path,
+        media_type=exporter.media_type,
+        filename=f"model.{exporter.file_extension}",
+        content_disposition_type="inline",
+    )
+
+
+@jobs_router.delete("/jobs/{job_id}")
+async def cancel_job(
+    job_id: str, job_manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """Cancel a queued or running job."""
+    _get_job_or_404(job_manager, job_id)
+    return job_manager.cancel(job_id).to_response()
@@ -0,0 +1,57 @@
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from shared.models.requests import CADRequest
+
+_CAD_REQUEST_SCHEMA = CADRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+
+# OpenAPI body for routes that parse their CADRequest with get_cad_request
+CAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/CADRequest"}}
+        },
+    }
+}
+
+
+async def get_cad_request(request: Request) -> CADRequest:
+    """Parse the request body straight from JSON into a CADRequest.
+
+    FastAPI decodes a body to a dict and validates that; validating the raw JSON
+    skips building the intermediate dict, which adds up for configurations with
+    many shapes.
+    """
+    body = await request.body()
+    try:
+        return CADRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
+
+
+def register_request_schemas(app: FastAPI):
+    """Add the CADRequest schemas, which FastAPI cannot see through get_cad_request, to the OpenAPI document"""
+    default_openapi = app.openapi
+
+    def openapi() -> dict:
+        schema = default_openapi()
+        schemas = schema.setdefault("components", {}).setdefault("schemas", {})
+        definitions = {
+            **_CAD_REQUEST_SCHEMA.get("$defs", {}),
+            "CADRequest": {
+                key: value for key, value in _CAD_REQUEST_SCHEMA.items() if key != "$defs"
+            },
+        }
+        for name, definition in definitions.items():
+            schemas.setdefault(name, definition)
+        return schema
+
+    app.openapi = openapi
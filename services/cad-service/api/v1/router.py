@@ -1,9 +1,18 @@
+import asyncio
+import json
 import logging
+from contextlib import aclosing
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from api.v1.parsing import CAD_REQUEST_BODY, get_cad_request
 from core.deps import get_cad_processor
 from processor import CADProcessor
+from processor.gears.profiles import gear_profiles
+from shared.models.base import LevelOfDetail
+from shared.models.exceptions import CADServiceException
 from shared.models.requests import CADRequest
 from shared.models.responses import CADResponse
 
@@ -11,15 +20,22 @@ api_router = APIRouter()
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
 
-@api_router.post("/generate")
+
+@api_router.post("/generate", openapi_extra=CAD_REQUEST_BODY)
 async def generate(
-    request: CADRequest, processor: CADProcessor = Depends(get_cad_processor)
+    request: CADRequest = Depends(get_cad_request),
+    lod: Optional[LevelOfDetail] = Query(None, description="Tessellation preset"),
+    processor: CADProcessor = Depends(get_cad_processor),
 ) -> CADResponse:
     """Generate a CAD model based on the provided NER response."""
     try:
-        result = await processor.process_configuration(request.config)
-        file_path = processor.export_model(result, file_type="gltf")
+        if lod:
+            request.config = processor.with_lod(request.config, lod)
+
+        file_type = processor.export_format(request.config)
+        file_path = await processor.generate(request.config, file_type=file_type)
 
         logger.info(f"CAD model generation complete - saved to {file_path}")
 
@@ -27,3 +43,97 @@ async def generate(
     except Exception as e:
         logger.error(f"Error during CAD model generation: {e}")
         return CADResponse(model_path=None, error=str(e), warnings=None)
+
+
+@api_router.post("/generate/stream", openapi_extra=CAD_REQUEST_BODY)
+async def generate_stream(
+    request: CADRequest = Depends(get_cad_request),
+    lod: Optional[LevelOfDetail] = Query(None, description="Tessellation preset"),
+    processor: CADProcessor = Depends(get_cad_processor),
+):
+    """Generate a CAD model and stream the exported file back without saving it."""
+    try:
+        if lod:
+            request.config = processor.with_lod(request.config, lod)
+
+        file_type = processor.export_format(request.config)
+        exporter = processor.get_exporter(file_type)
+        data = await processor.generate_bytes(request.config, file_type=file_type)
+    except Exception as e:
+        logger.error(f"Error during CAD model generation: {e}")
+        status_code = 422 if isinstance(e, CADServiceException) else 500
+        return JSONResponse(
+            status_code=status_code,
+            content=CADResponse(model_path=None, error=str(e)).model_dump(),
+        )
+
+    logger.info(f"CAD model generation complete - streaming {len(data)} bytes")
+
+    def chunks():
+        view = memoryview(data)
+        for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+            yield bytes(view[offset : offset + STREAM_CHUNK_SIZE])
+
+    return StreamingResponse(
+        chunks(),
+        media_type=exporter.media_type,
+        headers={
+            "Content-Disposition": f'inline; filename="model.{exporter.file_extension}"',
+            "Content-Length": str(len(data)),
+        },
+    )
+
+
+@api_router.post("/generate/lods", openapi_extra=CAD_REQUEST_BODY)
+async def generate_lods(
+    http_request: Request,
+    request: CADRequest = Depends(get_cad_request),
+    levels: list[LevelOfDetail] = Query(
+        [LevelOfDetail.PREVIEW, LevelOfDetail.FINE], description="Levels of detail"
+    ),
+    processor: CADProcessor = Depends(get_cad_processor),
+):
+    """Generate a CAD model once and stream each level of detail as NDJSON as it is exported.
+
+    Remaining levels are skipped as soon as the client disconnects.
+    """
+
+    async def events():
+        try:
+            # Closing the generator promptly stops it before the next export starts
+            async with aclosing(processor.generate_lods(request.config, levels)) as stream:
+                async for event in stream:
+                    if await http_request.is_disconnected():
+                        logger.info(
+                            "Client disconnected, cancelling remaining levels of detail"
+                        )
+                        return
+                    yield json.dumps(event) + "\n"
+        except asyncio.CancelledError:
+            logger.info("Level of detail stream cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Error during CAD model generation: {e}")
+            yield json.dumps({"error": str(e)}) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@api_router.get("/cache/stats")
+async def cache_stats(processor: CADProcessor = Depends(get_cad_processor)) -> dict:
+    """Report hit/miss statistics for the geometry cache and coalesced requests."""
+    coalescing = processor.flights.stats() if processor.flights else None
+    if not processor.cache:
+        return {
+            "enabled": False,
+            "gear_profiles": gear_profiles.stats(),
+            "coalescing": coalescing,
+        }
+
+    return {
+        "enabled": True,
+        **processor.cache.stats(),
+        "shapes": processor.shape_memo.stats(),
+        "gear_profiles": gear_profiles.stats(),
+        "coalescing": coalescing,
+    }
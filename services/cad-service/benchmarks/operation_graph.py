@@ -0,0 +1,83 @@
+"""
+Time building a multi-part configuration in the worker pool, all in one worker
+against the operation graph scheduler, which builds each independent part (and
+each independent branch of a part) in its own worker.
+
+Every part is a plate with a slot cut through it and its edges filleted, e.g.
+
+    python -m benchmarks.operation_graph --parts 2 8 16 --workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from core.settings import settings
+from processor import CADProcessor
+from processor.executor import build_brep
+from processor.utils.brep import brep_to_workplane
+from shared.models.base import (
+    BooleanParameters,
+    CADConfiguration,
+    FilletParameters,
+    Operation,
+)
+from shared.models.helpers import create_box
+
+
+def make_config(parts: int) -> CADConfiguration:
+    """Slotted, filleted plates in a row, none touching the others"""
+    shapes, operations = [], []
+    for i in range(parts):
+        plate, slot = f"plate_{i}", f"slot_{i}"
+        shapes += [
+            create_box(40, 30, 6, True, id=plate, position=[i * 60, 0, 0]),
+            create_box(20, 4, 10, True, id=slot, position=[i * 60, 0, 0], rotation=[0, 0, 30]),
+        ]
+        operations += [
+            Operation(type="cut", targets=[plate], parameters=BooleanParameters(tool=slot)),
+            Operation(type="fillet", targets=[plate], parameters=FilletParameters(radius=0.8)),
+        ]
+    return CADConfiguration(shapes=shapes, operations=operations)
+
+
+async def timed(build) -> float:
+    start = time.perf_counter()
+    brep = await build()
+    elapsed = time.perf_counter() - start
+    assert all(val.isValid() for val in brep_to_workplane(brep).vals())
+    return elapsed
+
+
+async def run(parts: list[int], workers: int):
+    # Workers read their settings from the environment; keep their caches out of the timings
+    os.environ["GEOMETRY_CACHE_ENABLED"] = "false"
+    settings.CAD_POOL_WORKERS = workers
+    processor = CADProcessor(execution_mode="process", coalesce=False)
+    processor.cache = None
+
+    # Start every worker before timing anything
+    warm_up = make_config(workers)
+    await processor._build_in_pool(warm_up)
+
+    print(f"{'parts':>6} {'one worker':>12} {'graph':>12}")
+    for count in parts:
+        config = make_config(count)
+        one = await timed(lambda: processor.executor.run(build_brep, config.model_dump_json()))
+        graph = await timed(lambda: processor._build_in_pool(config))
+        print(f"{count:>6} {one:>11.3f}s {graph:>11.3f}s")
+
+    processor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, nargs="+", default=[2, 8, 16])
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args.parts, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Time array operations on a heat sink: a base plate with N fins arrayed across it.
+
+The fins are instanced copies of one solid. The fused model joins them to the
+base with the configured union strategy, so "multi" is a single boolean and
+"sequential" is one boolean per fin; the assembly keeps them as instances, e.g.
+
+    python -m benchmarks.patterns --counts 50 200 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from processor import CADProcessor
+from shared.models.base import (
+    ArrayParameters,
+    CADConfiguration,
+    Export,
+    Operation,
+    OutputMode,
+)
+from shared.models.helpers import create_box
+
+PITCH = 2.0
+
+
+def make_config(count: int, mode: OutputMode) -> CADConfiguration:
+    """A base plate with count fins standing on it"""
+    length = count * PITCH
+    base = create_box(length, 40, 3, True, id="base", position=[length / 2, 20, 1.5])
+    fin = create_box(1, 40, 20, True, id="fin", position=[PITCH / 2, 20, 12.5])
+    fins = Operation(
+        type="array",
+        targets=["fin"],
+        parameters=ArrayParameters(count=count, spacing=[PITCH, 0, 0]),
+    )
+    return CADConfiguration(
+        shapes=[base, fin], operations=[fins], export=Export(mode=mode)
+    )
+
+
+async def build_seconds(processor: CADProcessor, config: CADConfiguration) -> float:
+    start = time.perf_counter()
+    result = await processor.process_configuration(config)
+    elapsed = time.perf_counter() - start
+    assert all(val.isValid() for val in result.vals())
+    return elapsed
+
+
+async def run(counts: list[int], max_sequential: int):
+    processor = CADProcessor(execution_mode="inline", coalesce=False)
+    processor.cache = None
+    processor.shape_memo = None
+
+    columns = ["sequential", "multi", "assembly"]
+    print(f"{'fins':>6} " + " ".join(f"{c:>12}" for c in columns))
+    for count in counts:
+        timings = []
+        for column in columns:
+            if column == "sequential" and count > max_sequential:
+                timings.append(f"{'skipped':>12}")
+                continue
+
+            mode = OutputMode.ASSEMBLY if column == "assembly" else OutputMode.FUSED
+            processor.union_strategy = "multi" if column == "assembly" else column
+            elapsed = await build_seconds(processor, make_config(count, mode))
+            timings.append(f"{elapsed:>11.3f}s")
+
+        print(f"{count:>6} " + " ".join(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument(
+        "--max-sequential",
+        type=int,
+        default=50,
+        help="Skip the sequential strategy above this many fins",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.counts, args.max_sequential))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare the dict round-trip used to pass a CADRequest between services with the
+JSON fast path.
+
+The dict path is what the orchestrator and FastAPI did before: model_dump to a
+dict, json.dumps it, then json.loads and validate the dict on the CAD side. The
+JSON path serialises with model_dump_json and validates the raw bytes with
+model_validate_json, e.g.
+
+    python -m benchmarks.request_parsing --shapes 10 100 500
+"""
+
+import argparse
+import json
+import time
+
+from shared.models.base import CADConfiguration
+from shared.models.features import CircularHole
+from shared.models.helpers import create_box
+from shared.models.requests import CADRequest
+
+
+def make_request(count: int) -> CADRequest:
+    """A request for a row of drilled plates"""
+    holes = [CircularHole(diameter=4, position=position) for position in
+             [(20, 10), (-20, 10), (-20, -10), (20, -10)]]
+    shapes = [
+        create_box(50, 30, 5, centered=True, features=holes, id=f"plate_{i}", position=[i * 60, 0, 0])
+        for i in range(count)
+    ]
+    return CADRequest(prompt="plates", config=CADConfiguration(shapes=shapes))
+
+
+def per_call_ms(fn, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shapes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'shapes':>6} {'stage':>7} {'dict ms':>9} {'json ms':>9} {'speedup':>8}")
+    for count in args.shapes:
+        request = make_request(count)
+        body = json.dumps(request.model_dump(mode="json")).encode("utf-8")
+
+        stages = {
+            "encode": (
+                lambda: json.dumps(request.model_dump(mode="json")).encode("utf-8"),
+                lambda: request.model_dump_json(),
+            ),
+            "decode": (
+                lambda: CADRequest.model_validate(json.loads(body)),
+                lambda: CADRequest.model_validate_json(body),
+            ),
+        }
+
+        for stage, (dict_path, json_path) in stages.items():
+            dict_ms = per_call_ms(dict_path, args.repeat)
+            json_ms = per_call_ms(json_path, args.repeat)
+            print(f"{count:>6} {stage:>7} {dict_ms:>9.3f} {json_ms:>9.3f} {dict_ms / json_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
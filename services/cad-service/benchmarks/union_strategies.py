@@ -0,0 +1,61 @@
+"""
+Compare the union strategies in processor.utils.booleans.
+
+Builds N overlapping cylinders on a grid and times each strategy, e.g.
+
+    python -m benchmarks.union_strategies --counts 10 100 1000
+
+The sequential strategy is skipped above --max-sequential primitives by
+default: at 1000 it runs for well over an hour.
+"""
+
+import argparse
+import math
+import time
+
+from cadquery import cq
+
+from processor.utils.booleans import UNION_STRATEGIES, fuse_all
+
+
+def make_primitives(count: int) -> list[cq.Workplane]:
+    """Cylinders on a square grid, each overlapping its neighbours"""
+    side = math.ceil(math.sqrt(count))
+    return [
+        cq.Workplane("XY").cylinder(5, 6).translate(((i % side) * 10, (i // side) * 10, 0))
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--strategies", nargs="+", default=list(UNION_STRATEGIES))
+    parser.add_argument(
+        "--max-sequential",
+        type=int,
+        default=200,
+        help="Skip the sequential strategy above this many primitives",
+    )
+    args = parser.parse_args()
+
+    print(f"{'primitives':>10} " + " ".join(f"{s:>12}" for s in args.strategies))
+    for count in args.counts:
+        objs = make_primitives(count)
+        timings = []
+        for strategy in args.strategies:
+            if strategy == "sequential" and count > args.max_sequential:
+                timings.append(f"{'skipped':>12}")
+                continue
+
+            start = time.perf_counter()
+            result = fuse_all(objs, strategy)
+            elapsed = time.perf_counter() - start
+            assert result.val().isValid()
+            timings.append(f"{elapsed:>11.3f}s")
+
+        print(f"{count:>10} " + " ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
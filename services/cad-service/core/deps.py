@@ -1,10 +1,25 @@
 from functools import lru_cache
 
+from core.settings import settings
+from jobs import JobManager, create_job_store
 from processor import CADProcessor
 
 
 @lru_cache
 def get_cad_processor() -> CADProcessor:
     """Get the CAD processor from the cache or load it if not cached."""
-    processor = CADProcessor()
+    processor = CADProcessor(cache=settings.GEOMETRY_CACHE_ENABLED)
     return processor
+
+
+@lru_cache
+def get_job_manager() -> JobManager:
+    """Get the job manager, which runs CAD requests as background jobs."""
+    store = create_job_store(settings.CAD_JOB_STORE, settings.CAD_JOB_DB_PATH)
+    return JobManager(
+        get_cad_processor(),
+        store,
+        workers=settings.CAD_JOB_WORKERS,
+        max_queued=settings.CAD_JOB_MAX_QUEUED,
+        retry_after=settings.CAD_JOB_RETRY_AFTER,
+    )
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -21,6 +23,68 @@ class Settings(BaseSettings):
         default="/app/web/public", description="Path to export CAD models"
     )
 
+    CAD_EXECUTION_MODE: Literal["inline", "process"] = Field(
+        default="process",
+        description="Build geometry on the event loop or in a process pool",
+    )
+    CAD_POOL_WORKERS: Optional[int] = Field(
+        default=None, description="Number of geometry worker processes (CPU count)"
+    )
+    CAD_POOL_MAX_TASKS_PER_CHILD: Optional[int] = Field(
+        default=100, description="Tasks a worker runs before it is replaced"
+    )
+
+    CAD_UNION_STRATEGY: Literal["sequential", "tree", "multi"] = Field(
+        default="multi",
+        description="How shapes are unioned: one at a time, as a balanced tree "
+        "or with a single multi-argument boolean",
+    )
+    CAD_PARALLEL_UNION_THRESHOLD: int = Field(
+        default=64,
+        description="Shape count above which unions are split across pool workers",
+    )
+
+    GEOMETRY_CACHE_ENABLED: bool = Field(
+        default=True, description="Cache built models and exported files"
+    )
+    GEOMETRY_CACHE_SIZE: int = Field(
+        default=128, description="Maximum number of built models kept in memory"
+    )
+    SHAPE_MEMO_SIZE: int = Field(
+        default=256,
+        description="Maximum number of untransformed primitives memoised in memory",
+    )
+    GEAR_PROFILE_CACHE_SIZE: int = Field(
+        default=64,
+        description="Maximum number of gear tooth profiles and bevel gear bodies kept in memory",
+    )
+    EXPORT_CACHE_MAX_BYTES: int = Field(
+        default=512 * 1024 * 1024,
+        description="Maximum total size of cached exports under MODEL_EXPORT_PATH",
+    )
+
+    CAD_COALESCE_REQUESTS: bool = Field(
+        default=True,
+        description="Share one build between identical requests that are in flight together",
+    )
+
+    CAD_JOB_STORE: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="Where jobs are recorded, SQLite keeps queued jobs across restarts",
+    )
+    CAD_JOB_DB_PATH: str = Field(
+        default="jobs.sqlite3", description="SQLite database used by the sqlite job store"
+    )
+    CAD_JOB_WORKERS: int = Field(
+        default=2, description="Number of jobs built concurrently"
+    )
+    CAD_JOB_MAX_QUEUED: int = Field(
+        default=100, description="Queued jobs before new submissions are rejected with 503"
+    )
+    CAD_JOB_RETRY_AFTER: int = Field(
+        default=5, description="Retry-After seconds sent when the job queue is full"
+    )
+
     class Config:
         """Configuration for Pydantic settings."""
 
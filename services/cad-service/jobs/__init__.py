@@ -0,0 +1,18 @@
+from .manager import JobManager, JobQueueFullError
+from .store import (
+    Job,
+    JobStore,
+    InMemoryJobStore,
+    SQLiteJobStore,
+    create_job_store,
+)
+
+__all__ = [
+    "Job",
+    "JobManager",
+    "JobQueueFullError",
+    "JobStore",
+    "InMemoryJobStore",
+    "SQLiteJobStore",
+    "create_job_store",
+]
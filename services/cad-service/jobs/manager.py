@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import uuid
+from typing import Optional
+
+from jobs.store import Job, JobStore
+from processor import CADProcessor
+from shared.models.requests import CADRequest
+from shared.models.responses import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """Raised when too many jobs are waiting and new ones should be retried later"""
+
+    def __init__(self, queued: int, retry_after: int):
+        self.queued = queued
+        self.retry_after = retry_after
+        super().__init__(f"Job queue is full ({queued} jobs queued), retry in {retry_after}s")
+
+
+class JobManager:
+    """
+    Runs CAD generation requests as background jobs.
+
+    Jobs are recorded in a JobStore and picked up by a fixed number of worker tasks,
+    which bounds how many builds run at once (the builds themselves still go through
+    the processor's process pool). Jobs left queued or running by a previous process
+    are re-queued on start, so a persistent store lets them survive a restart.
+    """
+
+    def __init__(
+        self,
+        processor: CADProcessor,
+        store: JobStore,
+        workers: int = 2,
+        max_queued: int = 100,
+        retry_after: int = 5,
+    ):
+        self.processor = processor
+        self.store = store
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.retry_after = retry_after
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    async def start(self):
+        """Re-queue unfinished jobs and start the workers"""
+        self._stopping = False
+        self._queue = asyncio.Queue()
+
+        for job in self.store.unfinished():
+            self.store.update(job.id, status=JobStatus.QUEUED, progress=0.0, stage=None)
+            self._queue.put_nowait(job.id)
+            logger.info(f"Recovered job {job.id}")
+
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"cad-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Job manager started (workers: {self.workers})")
+
+    async def stop(self):
+        """Stop the workers, leaving interrupted jobs to be recovered on the next start"""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.store.close()
+        logger.info("Job manager stopped")
+
+    def submit(self, request: CADRequest) -> Job:
+        """Queue a CAD request and return its job"""
+        if self._queue is None:
+            raise RuntimeError("Job manager has not been started")
+
+        if self._queue.qsize() >= self.max_queued:
+            raise JobQueueFullError(self._queue.qsize(), self.retry_after)
+
+        file_type = self.processor.export_format(request.config)
+        self.processor.get_exporter(file_type)
+
+        job = self.store.create(
+            Job(
+                id=uuid.uuid4().hex,
+                request_json=request.model_dump_json(),
+                file_type=file_type,
+            )
+        )
+        self._queue.put_nowait(job.id)
+        logger.info(f"Queued job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id"""
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued or running job
+
+        A build already running in a worker process is not interrupted, but its
+        result is discarded.
+        """
+        job = self.store.get(job_id)
+        if not job or job.finished:
+            return job
+
+        task = self._running.get(job_id)
+        if task:
+            task.cancel()
+
+        return self.store.update(job_id, status=JobStatus.CANCELLED, stage="cancelled")
+
+    async def _work(self):
+        while True:
+            job_id = await self._queue.get()
+            job = self.store.get(job_id)
+            if not job or job.finished:
+                continue
+
+            task = asyncio.create_task(self._run(job))
+            self._running[job_id] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                # Only the job was cancelled, keep the worker going
+                if self._stopping:
+                    raise
+            finally:
+                self._running.pop(job_id, None)
+
+    async def _run(self, job: Job):
+        self.store.update(job.id, status=JobStatus.RUNNING, stage="building", progress=0.0)
+        logger.info(f"Running job {job.id}")
+
+        def progress(stage: str, fraction: float):
+            self.store.update(job.id, stage=stage, progress=fraction)
+
+        try:
+            request = CADRequest.model_validate_json(job.request_json)
+            model_path = await self.processor.generate(
+                request.config, job.file_type, progress=progress
+            )
+        except asyncio.CancelledError:
+            if self._stopping:
+                self.store.update(job.id, status=JobStatus.QUEUED, stage=None, progress=0.0)
+            else:
+                self.store.update(job.id, status=JobStatus.CANCELLED, stage="cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            self.store.update(job.id, status=JobStatus.FAILED, stage="failed", error=str(e))
+            return
+
+        self.store.update(
+            job.id,
+            status=JobStatus.SUCCEEDED,
+            stage="complete",
+            progress=1.0,
+            model_path=model_path,
+        )
+        logger.info(f"Job {job.id} complete - saved to {model_path}")
@@ -0,0 +1,216 @@
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timezone
+from typing import Optional
+
+from shared.models.responses import JobResponse, JobStatus
+
+FINISHED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    """A queued CAD generation request and its current state"""
+
+    id: str
+    request_json: str
+    file_type: str
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    stage: Optional[str] = None
+    model_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_response(self) -> JobResponse:
+        return JobResponse(
+            id=self.id,
+            status=self.status,
+            progress=self.progress,
+            stage=self.stage,
+            model_path=self.model_path,
+            error=self.error,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+class JobStore(ABC):
+    """Persistence for jobs, shared by the API and the job workers"""
+
+    @abstractmethod
+    def create(self, job: Job) -> Job:
+        """Store a new job"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it does not exist"""
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, **changes) -> Optional[Job]:
+        """Apply changes to a job and return the updated job"""
+        pass
+
+    @abstractmethod
+    def unfinished(self) -> list[Job]:
+        """Jobs that are queued or running, oldest first"""
+        pass
+
+    def close(self):
+        """Release any resources held by the store"""
+        pass
+
+
+class InMemoryJobStore(JobStore):
+    """Job store kept in process memory, jobs are lost when the service restarts"""
+
+    def __init__(self):
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: Job) -> Job:
+        with self._lock:
+            self._jobs[job.id] = replace(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job else None
+
+    def update(self, job_id: str, **changes) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return None
+            job = replace(job, updated_at=_now(), **changes)
+            self._jobs[job_id] = job
+            return replace(job)
+
+    def unfinished(self) -> list[Job]:
+        with self._lock:
+            jobs = [replace(job) for job in self._jobs.values() if not job.finished]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+
+class SQLiteJobStore(JobStore):
+    """Job store in a local SQLite database, so queued jobs survive a restart"""
+
+    COLUMNS = [f.name for f in fields(Job)]
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                request_json TEXT NOT NULL,
+                file_type TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL,
+                stage TEXT,
+                model_path TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+        self._db.commit()
+
+    @staticmethod
+    def _to_row(job: Job) -> tuple:
+        return (
+            job.id,
+            job.request_json,
+            job.file_type,
+            JobStatus(job.status).value,
+            job.progress,
+            job.stage,
+            job.model_path,
+            job.error,
+            job.created_at.isoformat(),
+            job.updated_at.isoformat(),
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Job:
+        values = dict(zip(SQLiteJobStore.COLUMNS, row))
+        values["status"] = JobStatus(values["status"])
+        values["created_at"] = datetime.fromisoformat(values["created_at"])
+        values["updated_at"] = datetime.fromisoformat(values["updated_at"])
+        return Job(**values)
+
+    def create(self, job: Job) -> Job:
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        with self._lock:
+            self._db.execute(
+                f"INSERT INTO jobs ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+                self._to_row(job),
+            )
+            self._db.commit()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def update(self, job_id: str, **changes) -> Optional[Job]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if not row:
+                return None
+
+            job = replace(self._from_row(row), updated_at=_now(), **changes)
+            assignments = ", ".join(f"{column} = ?" for column in self.COLUMNS[1:])
+            self._db.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                self._to_row(job)[1:] + (job_id,),
+            )
+            self._db.commit()
+        return job
+
+    def unfinished(self) -> list[Job]:
+        statuses = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs "
+                f"WHERE status IN (?, ?) ORDER BY created_at",
+                statuses,
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def create_job_store(backend: str, path: Optional[str] = None) -> JobStore:
+    """Build the configured job store backend"""
+    if backend == "memory":
+        return InMemoryJobStore()
+    if backend == "sqlite":
+        return SQLiteJobStore(path)
+    raise ValueError(f"Unknown job store {backend}")
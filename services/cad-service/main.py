@@ -1,8 +1,10 @@
 import logging
 from contextlib import asynccontextmanager
 
+from api.v1.jobs import jobs_router
+from api.v1.parsing import register_request_schemas
 from api.v1.router import api_router
-from core.deps import get_cad_processor
+from core.deps import get_cad_processor, get_job_manager
 from core.settings import settings
 from shared.utils.monitoring import create_monitored_app
 
@@ -12,21 +14,28 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(_):
-    """Load the NER model at startup and unload it at shutdown."""
+    """Initialise the CAD processor at startup and release its workers at shutdown."""
     try:
-        get_cad_processor()
-        logger.info(f"CAD Processor initialised")
+        processor = get_cad_processor()
+        logger.info(f"CAD Processor initialised (mode: {processor.execution_mode})")
     except Exception as e:
         logger.error(f"Failed to load CAD Processor: {e}")
         raise e
+
+    job_manager = get_job_manager()
+    await job_manager.start()
     yield
 
     logger.info("Shutting down CAD service...")
+    await job_manager.stop()
+    processor.shutdown()
 
 
-app = create_monitored_app(service_name="cad-service")
+app = create_monitored_app(service_name="cad-service", lifespan=lifespan)
 
 app.include_router(api_router, prefix="/api/v1", tags=["CAD Service"])
+app.include_router(jobs_router, prefix="/api/v1", tags=["CAD Jobs"])
+register_request_schemas(app)
 
 if __name__ == "__main__":
     import uvicorn
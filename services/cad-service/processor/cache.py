@@ -0,0 +1,228 @@
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from cadquery import cq
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter(
+    "cad_geometry_cache_requests_total",
+    "Geometry cache lookups by tier and result",
+    ["tier", "result"],
+)
+CACHE_EVICTIONS = Counter(
+    "cad_geometry_cache_evictions_total",
+    "Geometry cache evictions by tier",
+    ["tier"],
+)
+
+# Exported files are named after their 64 character SHA-256 cache key
+CACHED_FILE_PATTERN = re.compile(r"^(?P<key>[0-9a-f]{64})\.[\w.]+$")
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache bounded by number of entries"""
+
+    def __init__(self, max_items: int, name: str = "memory"):
+        self.max_items = max_items
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value and mark it as recently used"""
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                CACHE_REQUESTS.labels(tier=self.name, result="miss").inc()
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            CACHE_REQUESTS.labels(tier=self.name, result="hit").inc()
+            return self._items[key]
+
+    def put(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entries when full"""
+        if self.max_items <= 0:
+            return
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_items:
+                evicted, _ = self._items.popitem(last=False)
+                self.evictions += 1
+                CACHE_EVICTIONS.labels(tier=self.name).inc()
+                logger.debug(f"Evicted {evicted} from {self.name} cache")
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._items),
+            "max_entries": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+
+class ExportCache:
+    """On-disk cache of exported models, bounded by the total size of the files"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Running size of the directory, refreshed whenever eviction scans it
+        self._bytes: Optional[int] = None
+
+    def path_for(self, key: str, file_type: str) -> str:
+        """Return the path a model with the given cache key is exported to"""
+        return f"{self.directory}{os.path.sep}{key}.{file_type}"
+
+    def get(self, key: str, file_type: str) -> Optional[str]:
+        """Return the path of a previously exported model if it is still on disk"""
+        path = self.path_for(key, file_type)
+        if not os.path.isfile(path):
+            self.misses += 1
+            CACHE_REQUESTS.labels(tier="disk", result="miss").inc()
+            return None
+
+        # Refresh the modification time so eviction is least recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        CACHE_REQUESTS.labels(tier="disk", result="hit").inc()
+        return path
+
+    def register(self, path: str):
+        """Record a newly exported file and evict old entries if over budget"""
+        logger.debug(f"Cached export {path}")
+
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._total()
+            else:
+                try:
+                    self._bytes += os.path.getsize(path)
+                except OSError:
+                    pass
+            over_budget = self._bytes > self.max_bytes
+
+        # Only scan the directory once the running total says it is too big
+        if over_budget:
+            self.evict()
+
+    def evict(self):
+        """Delete the least recently used exports until the cache fits its budget"""
+        with self._lock:
+            entries = self._scan()
+            total = sum(size for size, _, _ in entries.values())
+            self._bytes = total
+            if total <= self.max_bytes:
+                return
+
+            for key, (size, _, paths) in sorted(
+                entries.items(), key=lambda item: item[1][1]
+            ):
+                if total <= self.max_bytes:
+                    break
+
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError as e:
+                        logger.warning(f"Failed to evict cached export {path}: {e}")
+
+                total -= size
+                self._bytes = total
+                self.evictions += 1
+                CACHE_EVICTIONS.labels(tier="disk").inc()
+                logger.debug(f"Evicted {key} from disk cache")
+
+    def _total(self) -> int:
+        return sum(size for size, _, _ in self._scan().values())
+
+    def _scan(self) -> dict[str, tuple[int, float, list[str]]]:
+        """Group cached files by key, e.g. a .gltf file and its .bin buffer"""
+        entries = {}
+        if not os.path.isdir(self.directory):
+            return entries
+
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                match = CACHED_FILE_PATTERN.match(entry.name)
+                if not match or not entry.is_file():
+                    continue
+
+                stat = entry.stat()
+                size, mtime, paths = entries.get(match.group("key"), (0, 0.0, []))
+                entries[match.group("key")] = (
+                    size + stat.st_size,
+                    max(mtime, stat.st_mtime),
+                    paths + [entry.path],
+                )
+
+        return entries
+
+    def stats(self) -> dict:
+        entries = self._scan()
+        return {
+            "entries": len(entries),
+            "bytes": sum(size for size, _, _ in entries.values()),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class GeometryCache:
+    """Two tier cache of built models (in memory) and exported files (on disk)"""
+
+    def __init__(self, max_models: int, export_path: str, max_export_bytes: int):
+        self.models = LRUCache(max_models, name="memory")
+        self.exports = ExportCache(export_path, max_export_bytes)
+
+    def get_model(self, key: str) -> Optional[cq.Workplane]:
+        return self.models.get(key)
+
+    def put_model(self, key: str, model: cq.Workplane):
+        self.models.put(key, model)
+
+    def get_export(self, key: str, file_type: str) -> Optional[str]:
+        return self.exports.get(key, file_type)
+
+    def put_export(self, path: str):
+        self.exports.register(path)
+
+    def export_path(self, key: str, file_type: str) -> str:
+        return self.exports.path_for(key, file_type)
+
+    def stats(self) -> dict:
+        return {"memory": self.models.stats(), "disk": self.exports.stats()}
@@ -1,15 +1,45 @@
+import asyncio
+import json
 import logging
+import math
 import os
 import uuid
-from typing import Optional
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional, Union
 
-from cadquery import cq, Assembly
+from cadquery import cq
 
 from core.settings import settings
+from processor.cache import GeometryCache, LRUCache
+from processor.executor import (
+    GeometryExecutor,
+    build_and_export,
+    build_and_export_bytes,
+    build_brep,
+    build_parts_brep,
+    export_brep,
+    fuse_breps,
+    join_breps,
+)
+from processor.exporters import get_exporters
+from processor.exporters.lod import LOD_ORDER, export_options
 from processor.gears import get_gear_handlers
+from processor.graph import Node, OperationGraph
 from processor.interfaces import ShapeHandler, OperationHandler, Exporter
+from processor.operations import get_operation_handlers
 from processor.shapes import get_shape_handlers
-from shared.models.base import CADConfiguration
+from processor.utils.booleans import fuse_all
+from processor.utils.brep import brep_to_workplane
+from processor.utils.hashing import geometry_key, export_key, shape_key
+from processor.utils.singleflight import SingleFlight
+from shared.models.base import (
+    CADConfiguration,
+    Export,
+    ExportFormat,
+    LevelOfDetail,
+    OutputMode,
+)
+from shared.models.exceptions import ExportError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +47,41 @@ logger = logging.getLogger(__name__)
 class CADProcessor:
     """Main processor that coordinates all CAD operations"""
 
-    def __init__(self, cache: bool = True):
+    def __init__(
+        self,
+        cache: bool = True,
+        execution_mode: Optional[str] = None,
+        coalesce: Optional[bool] = None,
+    ):
         self.shape_handlers: dict[str, ShapeHandler] = {}
         self.operation_handlers: dict[str, OperationHandler] = {}
         self.exporters: dict[str, Exporter] = {}
+        self.cache: Optional[GeometryCache] = None
+        self.shape_memo: Optional[LRUCache] = None
+
+        if cache:
+            self.cache = GeometryCache(
+                max_models=settings.GEOMETRY_CACHE_SIZE,
+                export_path=settings.MODEL_EXPORT_PATH,
+                max_export_bytes=settings.EXPORT_CACHE_MAX_BYTES,
+            )
+            self.shape_memo = LRUCache(settings.SHAPE_MEMO_SIZE, name="shape")
+
+        if coalesce is None:
+            coalesce = settings.CAD_COALESCE_REQUESTS
+        self.flights: Optional[SingleFlight] = SingleFlight() if coalesce else None
+
+        self.union_strategy = settings.CAD_UNION_STRATEGY
+        self.execution_mode = execution_mode or settings.CAD_EXECUTION_MODE
+        self.executor: Optional[GeometryExecutor] = None
+
+        if self.execution_mode == "process":
+            self.executor = GeometryExecutor(
+                max_workers=settings.CAD_POOL_WORKERS,
+                max_tasks_per_child=settings.CAD_POOL_MAX_TASKS_PER_CHILD,
+            )
+        elif self.execution_mode != "inline":
+            raise ValueError(f"Unknown execution mode {self.execution_mode}")
 
         self._register_handlers()
 
@@ -42,52 +103,403 @@ class CADProcessor:
                     f"Registered gear: {gear_type} (handler: {handler_class.__name__})"
                 )
 
+        for handler_class in get_operation_handlers():
+            handler = handler_class()
+            for operation_type in handler.supported_types:
+                self.operation_handlers[operation_type] = handler
+                logger.debug(
+                    f"Registered operation: {operation_type} (handler: {handler_class.__name__})"
+                )
+
+        for exporter_class in get_exporters():
+            exporter = exporter_class()
+            self.exporters[exporter.format_name] = exporter
+            logger.debug(
+                f"Registered exporter: {exporter.format_name} (exporter: {exporter_class.__name__})"
+            )
+
+    @staticmethod
+    def export_format(config: CADConfiguration) -> str:
+        """Return the export format requested by a configuration (glTF by default)"""
+        if not config.export:
+            return ExportFormat.GLTF.value
+
+        return ExportFormat(config.export.format).value
+
+    @staticmethod
+    def is_assembly(config: CADConfiguration) -> bool:
+        """Whether a configuration asks for its parts to be kept separate rather than fused"""
+        return bool(config.export) and OutputMode(config.export.mode) == OutputMode.ASSEMBLY
+
+    @staticmethod
+    def with_lod(config: CADConfiguration, lod: LevelOfDetail) -> CADConfiguration:
+        """Return a copy of a configuration exported at a named level of detail"""
+        export = config.export or Export(format=ExportFormat.GLTF)
+        export = export.model_copy(update={"lod": LevelOfDetail(lod)})
+        return config.model_copy(update={"export": export})
+
+    def get_exporter(self, file_type: str) -> Exporter:
+        """Return the exporter for a format or raise if it is not supported"""
+        exporter = self.exporters.get(file_type.lower())
+        if not exporter:
+            raise ExportError(
+                f"Unsupported export format {file_type}. Supported formats: {', '.join(self.exporters)}",
+                service="cad-service",
+            )
+        return exporter
+
+    async def generate(
+        self,
+        config: CADConfiguration,
+        file_type: str,
+        progress: Optional[Callable[[str, float], None]] = None,
+    ) -> str:
+        """Build and export a configuration, reusing a cached export if one exists
+
+        progress, when given, is called with a stage name and the fraction of work done
+        as the build moves between stages.
+        """
+        report = progress or (lambda stage, fraction: None)
+        self.get_exporter(file_type)
+        key = export_key(config, file_type) if self.cache or self.flights else None
+        cache_key = key if self.cache else None
+
+        if cache_key:
+            cached_path = self.cache.get_export(cache_key, file_type)
+            if cached_path:
+                logger.info(f"Serving cached export {cached_path}")
+                return cached_path
+
+        report("building", 0.1)
+
+        if not self.flights:
+            return await self._generate(config, file_type, cache_key, report)
+
+        # Identical requests arriving together share one build and export
+        return await self.flights.do(
+            "export", key, lambda: self._generate(config, file_type, cache_key, report)
+        )
+
+    async def _generate(
+        self,
+        config: CADConfiguration,
+        file_type: str,
+        key: Optional[str],
+        report: Callable[[str, float], None],
+    ) -> str:
+        if self.executor:
+            if self._plan_pool_build(config) is None:
+                return await self.executor.run(
+                    build_and_export, config.model_dump_json(), file_type
+                )
+
+            brep = await self._build_in_pool(config)
+            report("exporting", 0.7)
+            return await self.executor.run(
+                export_brep, brep, file_type, key, export_options(config.export)
+            )
+
+        result = await self.process_configuration(config)
+        report("exporting", 0.7)
+        return await self.export_model(
+            result, file_type, cache_key=key, **export_options(config.export)
+        )
+
+    async def generate_bytes(self, config: CADConfiguration, file_type: str) -> bytes:
+        """Build and export a configuration in memory, without writing any files"""
+        exporter = self.get_exporter(file_type)
+
+        async def build() -> bytes:
+            if self.executor:
+                return await self.executor.run(
+                    build_and_export_bytes, config.model_dump_json(), file_type
+                )
+
+            result = await self.process_configuration(config)
+            return await exporter.to_bytes(result, **export_options(config.export))
+
+        if not self.flights:
+            return await build()
+
+        return await self.flights.do("bytes", export_key(config, file_type), build)
+
+    async def generate_lods(
+        self, config: CADConfiguration, lods: list[LevelOfDetail]
+    ) -> AsyncIterator[dict]:
+        """Build a configuration once and export it at several levels of detail.
+
+        Levels are exported from coarsest to finest and yielded as soon as each
+        file is written, followed by a manifest describing all of them.
+        """
+        file_type = self.export_format(config)
+        if file_type == ExportFormat.STEP.value:
+            raise ExportError(
+                "Levels of detail require a mesh export format", service="cad-service"
+            )
+        self.get_exporter(file_type)
+
+        source: Optional[Union[cq.Workplane, bytes]] = None
+        levels = []
+
+        for lod in sorted(set(lods), key=LOD_ORDER.index):
+            lod_config = self.with_lod(config, lod)
+            key = export_key(lod_config, file_type) if self.cache else None
+            file_path = self.cache.get_export(key, file_type) if key else None
+
+            if not file_path:
+                if source is None:
+                    source = await self._build_source(config)
+
+                file_path = await self._export_source(
+                    source, file_type, key, export_options(lod_config.export)
+                )
+
+            level = {"lod": LevelOfDetail(lod).value, "model_path": file_path}
+            levels.append(level)
+            logger.info(f"Exported {level['lod']} level of detail to {file_path}")
+            yield level
+
+        yield {"levels": levels, "manifest_path": self._write_manifest(config, levels)}
+
+    async def _build_source(self, config: CADConfiguration) -> Union[cq.Workplane, bytes]:
+        """Build a configuration once for several exports (BREP bytes in process mode)"""
+        if self.executor:
+            return await self._build_in_pool(config)
+
+        return await self.process_configuration(config)
+
+    async def _export_source(
+        self,
+        source: Union[cq.Workplane, bytes],
+        file_type: str,
+        key: Optional[str],
+        options: dict,
+    ) -> str:
+        if self.executor:
+            return await self.executor.run(export_brep, source, file_type, key, options)
+
+        return await self.export_model(source, file_type, cache_key=key, **options)
+
+    def _write_manifest(self, config: CADConfiguration, levels: list[dict]) -> str:
+        """Write a JSON manifest listing the files for each level of detail"""
+        if self.cache:
+            names = "-".join(level["lod"] for level in levels)
+            key = export_key(config, f"lods-{names}")
+            file_path = self.cache.export_path(key, "lods.json")
+        else:
+            file_path = f"{settings.MODEL_EXPORT_PATH}{os.path.sep}{uuid.uuid4()}.lods.json"
+
+        os.makedirs(settings.MODEL_EXPORT_PATH, exist_ok=True)
+        with open(file_path, "w") as f:
+            json.dump({"levels": levels}, f)
+
+        if self.cache:
+            self.cache.put_export(file_path)
+
+        return file_path
+
     async def process_configuration(self, config: CADConfiguration) -> cq.Workplane:
         """Main processing entry point"""
+        key = geometry_key(config) if self.cache or self.flights else None
 
-        result = await self._process_components(config)
+        if key and self.cache:
+            cached = self.cache.get_model(key)
+            if cached is not None:
+                logger.info(f"Serving cached model {key}")
+                return cached
+
+        if not self.flights:
+            return await self._build_configuration(config, key)
+
+        return await self.flights.do(
+            "geometry", key, lambda: self._build_configuration(config, key)
+        )
+
+    async def _build_configuration(
+        self, config: CADConfiguration, key: Optional[str]
+    ) -> cq.Workplane:
+        if self.executor:
+            brep = await self._build_in_pool(config)
+            result = brep_to_workplane(brep)
+        else:
+            result = await self._process_components(config)
+
+        if key and self.cache:
+            self.cache.put_model(key, result)
 
         logger.info("CAD configuration processing complete")
         return result
 
-    def export_model(self, model: cq.Workplane, file_type: str) -> str:
+    def _partition_shapes(self, config: CADConfiguration) -> list[CADConfiguration]:
+        """Split a large union into one sub-configuration per worker"""
+        shapes = config.shapes
+        if (
+            config.operations
+            or self.is_assembly(config)
+            or len(shapes) < settings.CAD_PARALLEL_UNION_THRESHOLD
+        ):
+            return [config]
+
+        size = math.ceil(len(shapes) / self.executor.max_workers)
+        return [
+            config.model_copy(update={"shapes": shapes[i : i + size]})
+            for i in range(0, len(shapes), size)
+        ]
+
+    def _plan_pool_build(
+        self, config: CADConfiguration
+    ) -> Optional[tuple[OperationGraph, list[Node], list[CADConfiguration]]]:
+        """
+        The operation trees and chunks of untouched shapes to build side by
+        side, or None when there is nothing to parallelise and one worker
+        should build the whole configuration.
+        """
+        graph = OperationGraph(config)
+        trees = graph.trees()
+        leaves = graph.leaves()
+        chunks = self._partition_shapes(graph.subconfiguration(leaves)) if leaves else []
+
+        if len(trees) + len(chunks) == 1 and not (trees and len(trees[0].branches()) > 1):
+            return None
+        return graph, trees, chunks
+
+    async def _build_in_pool(self, config: CADConfiguration) -> bytes:
+        """
+        Build the independent parts of a configuration in parallel workers and
+        combine their results.
+
+        Shapes no operation touches are split into chunks as for a plain union.
+        Each tree of operations is built by its own worker, with its branches
+        farmed out in turn, so only the results that something downstream
+        consumes leave a worker.
+        """
+        plan = self._plan_pool_build(config)
+
+        # Nothing to run side by side, so build it all in one worker (and its cache)
+        if plan is None:
+            return await self.executor.run(build_brep, config.model_dump_json())
+
+        graph, trees, chunks = plan
+        logger.debug(
+            f"Building {len(chunks)} chunks of shapes and {len(trees)} operation trees in parallel"
+        )
+        breps = await asyncio.gather(
+            *(self.executor.run(build_brep, chunk.model_dump_json()) for chunk in chunks),
+            *(self._build_tree(graph, tree) for tree in trees),
+        )
+
+        if self.is_assembly(config):
+            return await self.executor.run(join_breps, list(breps))
+        return await self.executor.run(fuse_breps, list(breps), self.union_strategy)
+
+    async def _build_tree(self, graph: OperationGraph, node: Node) -> bytes:
+        """Build the parts a tree of operations leaves, branches concurrently"""
+        branches = node.branches()
+        if len(branches) < 2:
+            branches = []
+
+        results = await asyncio.gather(
+            *(self._build_tree(graph, branch) for branch in branches)
+        )
+        inputs = {branch.component: brep for branch, brep in zip(branches, results)}
+
+        config = graph.subconfiguration([node], stop=frozenset(branches))
+        return await self.executor.run(build_parts_brep, config.model_dump_json(), inputs)
+
+    def shutdown(self):
+        """Release the worker processes used for geometry work"""
+        if self.executor:
+            self.executor.shutdown()
+
+    async def export_model(
+        self,
+        model: cq.Workplane,
+        file_type: str,
+        cache_key: Optional[str] = None,
+        **options,
+    ) -> str:
         """Export the CAD model to a file"""
+        exporter = self.get_exporter(file_type)
+
         try:
-            assembly = Assembly()
-            assembly.add(model, name="main_shape")
-            file_name = f"{uuid.uuid4()}.{file_type}"
-            file_path = f"{settings.MODEL_EXPORT_PATH}{os.path.sep}{file_name}"
+            if cache_key and self.cache:
+                file_path = self.cache.export_path(cache_key, exporter.file_extension)
+            else:
+                file_name = f"{uuid.uuid4()}.{exporter.file_extension}"
+                file_path = f"{settings.MODEL_EXPORT_PATH}{os.path.sep}{file_name}"
             os.makedirs(settings.MODEL_EXPORT_PATH, exist_ok=True)
-            assembly.export(file_path)
+            await self._export_atomically(exporter, model, file_path, options)
             logger.info(f"Model exported successfully to {file_path}")
+
+            if cache_key and self.cache:
+                self.cache.put_export(file_path)
+
             return file_path
         except Exception as e:
             logger.error(f"Failed to export model: {e}")
-            raise RuntimeError(f"Model export failed: {str(e)}")
+            raise ExportError(f"Model export failed: {str(e)}", service="cad-service")
+
+    @staticmethod
+    async def _export_atomically(
+        exporter: Exporter, model: cq.Workplane, file_path: str, options: dict
+    ):
+        """
+        Export to a hidden scratch file beside file_path, then move it into
+        place, so nobody can find a half-written model at a cached path.
+        """
+        directory, name = os.path.split(file_path)
+        temp_path = os.path.join(directory, f".{uuid.uuid4().hex}.{name}")
+        try:
+            await exporter.export(model, Path(temp_path), **options)
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
     async def _process_components(self, config: CADConfiguration) -> cq.Workplane:
         """Process all components in the configuration."""
-        components = {}
-        result = None
+        components = await self._build_components(config)
+
+        # Keep each part as its own object, otherwise fuse them all together
+        parts = [
+            obj.newObject([val]) for obj in components.values() for val in obj.vals()
+        ]
+        if self.is_assembly(config):
+            return cq.Workplane("XY").newObject([part.val() for part in parts])
+
+        return fuse_all(parts, self.union_strategy)
+
+    async def build_parts(
+        self, config: CADConfiguration, components: dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """
+        Build a configuration on top of components already built elsewhere,
+        leaving the parts unfused for whoever combines them.
+        """
+        components = await self._build_components(config, components)
+        return cq.Workplane("XY").newObject(
+            [val for obj in components.values() for val in obj.vals()]
+        )
+
+    async def _build_components(
+        self, config: CADConfiguration, components: Optional[dict] = None
+    ) -> dict[str, cq.Workplane]:
+        """Build the shapes, then apply the operations to them in order"""
+        components = dict(components or {})
 
         # Process basic components (shapes and gears)
         for comp_type, items, handlers in [
             ("shape", config.shapes, self.shape_handlers),
         ]:
-            result = await self._process_entities(comp_type, items, handlers, components, result)
-
-        # Process operations (e.g., booleans, transforms)
-        if config.operations:
-            for operation in config.operations:
-                logger.debug(f"Processing operation (type: {operation.type})")
-
-                handler = self.operation_handlers.get(operation.type)
-                if not handler:
-                    raise ValueError(f"No handler for operation type {operation.type}")
+            await self._process_entities(
+                comp_type, items, handlers, components, share=self.is_assembly(config)
+            )
 
-                result = await handler.apply(result, operation, components)
+        # Process operations (e.g., booleans, transforms) on the separate components
+        for operation in config.operations or []:
+            await self._apply_operation(operation, components)
 
-        return result or cq.Workplane("XY")
+        return components
 
     async def _process_entities(
             self,
@@ -95,10 +507,15 @@ class CADProcessor:
             items: list,
             handlers: dict,
             components: dict,
-            result: Optional[cq.Workplane],
-    ) -> cq.Workplane:
+            share: bool = False,
+    ):
         if not items:
-            return result
+            return
+
+        # Assemblies share geometry between identical parts even without the shape memo
+        memo = self.shape_memo
+        if memo is None and share:
+            memo = LRUCache(len(items), name="assembly")
 
         for i, item in enumerate(items):
             entity_id = item.id or f"{entity_type}_{i}"
@@ -108,9 +525,50 @@ class CADProcessor:
             if not handler:
                 raise ValueError(f"No handler for {entity_type} type {item.type}")
 
-            obj = await handler.create(item.parameters, item.position, item.rotation)
-            components[entity_id] = obj
+            obj = await self._build_entity(handler, item.parameters, memo)
+            components[entity_id] = await handler.place(obj, item.position, item.rotation)
 
-            result = obj if result is None else result.union(obj)
+    async def _apply_operation(self, operation, components: dict):
+        """
+        Apply an operation to its target components. The result replaces the
+        first target; the other targets and any components the operation used
+        up (a boolean tool) are removed.
+        """
+        logger.debug(f"Processing operation (type: {operation.type})")
 
-        return result
+        handler = self.operation_handlers.get(operation.type)
+        if not handler:
+            raise ValueError(f"No handler for operation type {operation.type}")
+
+        missing = [target for target in operation.targets if target not in components]
+        if missing or not operation.targets:
+            raise ValidationError(
+                f"Unknown or missing targets {missing} for {operation.type} operation",
+                service="cad-service",
+            )
+
+        target = cq.Workplane("XY").newObject(
+            [val for target in operation.targets for val in components[target].vals()]
+        )
+        result = await handler.apply(target, operation, components)
+
+        for component_id in [*operation.targets[1:], *handler.consumed(operation)]:
+            components.pop(component_id, None)
+        components[operation.targets[0]] = result
+
+    async def _build_entity(
+        self, handler: ShapeHandler, parameters, memo: Optional[LRUCache] = None
+    ) -> cq.Workplane:
+        """Build an untransformed solid, reusing an identical one built earlier"""
+        if memo is None:
+            return await handler.build(parameters)
+
+        key = shape_key(handler, parameters)
+        obj = memo.get(key)
+        if obj is None:
+            obj = await handler.build(parameters)
+            memo.put(key, obj)
+        else:
+            logger.debug(f"Reusing memoised {type(handler).__name__} solid {key}")
+
+        return obj
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from cadquery import cq
+
+from core.settings import settings
+from processor.utils.booleans import fuse_all
+from processor.utils.brep import workplane_to_brep, brep_to_workplane
+from shared.models.base import CADConfiguration
+
+logger = logging.getLogger(__name__)
+
+# Processor owned by each worker process, created on first use
+_worker_processor = None
+
+
+def _get_worker_processor():
+    """Return the CAD processor for the current worker process"""
+    global _worker_processor
+
+    if _worker_processor is None:
+        from processor.core import CADProcessor
+
+        _worker_processor = CADProcessor(
+            cache=settings.GEOMETRY_CACHE_ENABLED, execution_mode="inline"
+        )
+
+    return _worker_processor
+
+
+def build_brep(config_json: str) -> bytes:
+    """Worker task: build a configuration and return the result as BREP bytes"""
+    processor = _get_worker_processor()
+    config = CADConfiguration.model_validate_json(config_json)
+    result = asyncio.run(processor.process_configuration(config))
+    return workplane_to_brep(result)
+
+
+def build_parts_brep(config_json: str, inputs: dict[str, bytes]) -> bytes:
+    """
+    Worker task: build part of a configuration's operation graph, given the
+    BREP results of the branches built elsewhere, and return its unfused parts
+    """
+    processor = _get_worker_processor()
+    config = CADConfiguration.model_validate_json(config_json)
+    components = {component: brep_to_workplane(brep) for component, brep in inputs.items()}
+    result = asyncio.run(processor.build_parts(config, components))
+    return workplane_to_brep(result)
+
+
+def build_and_export(config_json: str, file_type: str) -> str:
+    """Worker task: build and export a configuration and return the file path"""
+    processor = _get_worker_processor()
+    config = CADConfiguration.model_validate_json(config_json)
+    return asyncio.run(processor.generate(config, file_type))
+
+
+def build_and_export_bytes(config_json: str, file_type: str) -> bytes:
+    """Worker task: build and export a configuration in memory and return the bytes"""
+    processor = _get_worker_processor()
+    config = CADConfiguration.model_validate_json(config_json)
+    return asyncio.run(processor.generate_bytes(config, file_type))
+
+
+def fuse_breps(breps: list[bytes], strategy: str) -> bytes:
+    """Worker task: union BREP encoded solids and return the result as BREP bytes"""
+    objs = [
+        obj.newObject([val])
+        for obj in (brep_to_workplane(brep) for brep in breps if brep)
+        for val in obj.vals()
+    ]
+    return workplane_to_brep(fuse_all(objs, strategy))
+
+
+def join_breps(breps: list[bytes]) -> bytes:
+    """Worker task: gather BREP encoded parts into one model without fusing them"""
+    parts = [val for brep in breps for val in brep_to_workplane(brep).vals()]
+    return workplane_to_brep(cq.Workplane("XY").newObject(parts))
+
+
+def export_brep(
+    brep: bytes, file_type: str, cache_key: Optional[str], options: dict[str, Any]
+) -> str:
+    """Worker task: export a BREP encoded model and return the file path"""
+    processor = _get_worker_processor()
+    return asyncio.run(
+        processor.export_model(
+            brep_to_workplane(brep), file_type, cache_key=cache_key, **options
+        )
+    )
+
+
+class GeometryExecutor:
+    """Runs CadQuery/OCCT work in a pool of worker processes"""
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        kwargs = {}
+        if max_tasks_per_child:
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = max_tasks_per_child
+            else:
+                logger.warning(
+                    "max_tasks_per_child requires Python 3.11+, workers will not be recycled"
+                )
+
+        # OCCT is not fork safe once threads exist, so always start fresh interpreters
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            **kwargs,
+        )
+        logger.info(
+            f"Geometry process pool created (workers: {self.max_workers}, "
+            f"max tasks per child: {max_tasks_per_child or 'unlimited'})"
+        )
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """Run a picklable function in the pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, fn, *args)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Geometry process pool shut down")
@@ -0,0 +1,19 @@
+from .gltf import GltfExporter, GlbExporter
+from .step import StepExporter
+from .stl import StlExporter
+from .threemf import ThreeMFExporter
+
+
+def get_exporters():
+    """Return all available exporters"""
+    return [StepExporter, StlExporter, GltfExporter, GlbExporter, ThreeMFExporter]
+
+
+__all__ = [
+    "GltfExporter",
+    "GlbExporter",
+    "StepExporter",
+    "StlExporter",
+    "ThreeMFExporter",
+    "get_exporters",
+]
@@ -0,0 +1,36 @@
+import logging
+from abc import ABC
+from pathlib import Path
+
+from cadquery import cq
+
+from processor.interfaces import Exporter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 0.1
+DEFAULT_ANGULAR_TOLERANCE = 0.1
+
+
+class BaseExporter(Exporter, ABC):
+    """Base implementation for exporters which serialise in memory"""
+
+    async def export(self, target: cq.Workplane, output_path: Path, **kwargs) -> Path:
+        """Export model by writing its in-memory serialisation to disk"""
+        data = await self.to_bytes(target, **kwargs)
+        Path(output_path).write_bytes(data)
+        logger.debug(f"Wrote {len(data)} bytes of {self.format_name} to {output_path}")
+        return Path(output_path)
+
+    @staticmethod
+    def _shapes(target: cq.Workplane) -> list[cq.Shape]:
+        """Return the shapes on a workplane"""
+        return [val for val in target.vals() if isinstance(val, cq.Shape)]
+
+    @classmethod
+    def _compound(cls, target: cq.Workplane) -> cq.Shape:
+        """Combine the shapes on a workplane into a single shape"""
+        shapes = cls._shapes(target)
+        if len(shapes) == 1:
+            return shapes[0]
+        return cq.Compound.makeCompound(shapes)
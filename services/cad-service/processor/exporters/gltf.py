@@ -0,0 +1,235 @@
+import base64
+import json
+import struct
+from typing import Any, Optional
+
+import numpy as np
+from cadquery import cq
+
+from processor.exporters.base import (
+    BaseExporter,
+    DEFAULT_TOLERANCE,
+    DEFAULT_ANGULAR_TOLERANCE,
+)
+from processor.exporters.mesh import Mesh, tessellate
+from processor.placement import group_instances
+
+GLB_MAGIC = 0x46546C67
+GLB_JSON_CHUNK = 0x4E4F534A
+GLB_BIN_CHUNK = 0x004E4942
+
+FLOAT = 5126
+UNSIGNED_INT = 5125
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+# CadQuery is Z up, glTF is Y up, so the root node rotates -90 degrees about X
+Z_UP_TO_Y_UP = [-0.7071067811865476, 0.0, 0.0, 0.7071067811865476]
+
+
+def location_matrix(shape: cq.Shape) -> Optional[list[float]]:
+    """Column major glTF matrix for a shape's location, or None when it does not move it"""
+    trsf = shape.wrapped.Location().Transformation()
+    matrix = np.eye(4)
+    matrix[:3] = [[trsf.Value(row, col) for col in range(1, 5)] for row in range(1, 4)]
+    if np.allclose(matrix, np.eye(4)):
+        return None
+
+    return matrix.T.ravel().tolist()
+
+
+class GltfDocument:
+    """Minimal glTF 2.0 document builder with a single binary buffer"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.json: dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "think-cad cad-service"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"name": "root", "rotation": Z_UP_TO_Y_UP, "children": []}],
+            "meshes": [],
+            "materials": [
+                {
+                    "name": "default",
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": [0.8, 0.8, 0.8, 1.0],
+                        "metallicFactor": 0.1,
+                        "roughnessFactor": 0.6,
+                    },
+                }
+            ],
+            "accessors": [],
+            "bufferViews": [],
+            "buffers": [],
+        }
+
+    def _add_view(self, data: bytes, target: int) -> int:
+        # Keep every view 4 byte aligned as required for float and uint32 data
+        self.buffer.extend(b"\x00" * (-len(self.buffer) % 4))
+        self.json["bufferViews"].append(
+            {
+                "buffer": 0,
+                "byteOffset": len(self.buffer),
+                "byteLength": len(data),
+                "target": target,
+            }
+        )
+        self.buffer.extend(data)
+        return len(self.json["bufferViews"]) - 1
+
+    def _add_accessor(self, array: np.ndarray, target: int, **kwargs) -> int:
+        view = self._add_view(array.tobytes(), target)
+        self.json["accessors"].append({"bufferView": view, **kwargs})
+        return len(self.json["accessors"]) - 1
+
+    def add_mesh(self, mesh: Mesh, name: str) -> int:
+        """Add a mesh and return its index"""
+        vertices = mesh.vertices.astype(np.float32)
+        indices = mesh.triangles.astype(np.uint32).reshape(-1)
+
+        position = self._add_accessor(
+            vertices,
+            ARRAY_BUFFER,
+            componentType=FLOAT,
+            count=len(vertices),
+            type="VEC3",
+            min=vertices.min(axis=0).tolist(),
+            max=vertices.max(axis=0).tolist(),
+        )
+        normal = self._add_accessor(
+            mesh.normals(),
+            ARRAY_BUFFER,
+            componentType=FLOAT,
+            count=len(vertices),
+            type="VEC3",
+        )
+        index = self._add_accessor(
+            indices,
+            ELEMENT_ARRAY_BUFFER,
+            componentType=UNSIGNED_INT,
+            count=len(indices),
+            type="SCALAR",
+        )
+
+        self.json["meshes"].append(
+            {
+                "name": name,
+                "primitives": [
+                    {
+                        "attributes": {"POSITION": position, "NORMAL": normal},
+                        "indices": index,
+                        "material": 0,
+                    }
+                ],
+            }
+        )
+        return len(self.json["meshes"]) - 1
+
+    def add_node(
+        self,
+        name: str,
+        mesh: Optional[int] = None,
+        matrix: Optional[list[float]] = None,
+        parent: int = 0,
+    ) -> int:
+        """Add a node below the given parent (the root by default) and return its index"""
+        node: dict[str, Any] = {"name": name}
+        if mesh is not None:
+            node["mesh"] = mesh
+        if matrix is not None:
+            node["matrix"] = matrix
+
+        self.json["nodes"].append(node)
+        index = len(self.json["nodes"]) - 1
+        self.json["nodes"][parent].setdefault("children", []).append(index)
+        return index
+
+    def _finalise(self, uri: Optional[str] = None) -> dict[str, Any]:
+        document = dict(self.json)
+        buffer = {"byteLength": len(self.buffer)}
+        if uri:
+            buffer["uri"] = uri
+        document["buffers"] = [buffer] if self.buffer else []
+        return {key: value for key, value in document.items() if value != []}
+
+    def to_gltf(self) -> bytes:
+        """Serialise as a .gltf JSON document with an embedded buffer"""
+        uri = "data:application/octet-stream;base64," + base64.b64encode(
+            bytes(self.buffer)
+        ).decode("ascii")
+        return json.dumps(self._finalise(uri), separators=(",", ":")).encode("utf-8")
+
+    def to_glb(self) -> bytes:
+        """Serialise as a binary .glb container"""
+        content = json.dumps(self._finalise(), separators=(",", ":")).encode("utf-8")
+        content += b" " * (-len(content) % 4)
+        binary = bytes(self.buffer) + b"\x00" * (-len(self.buffer) % 4)
+
+        chunks = struct.pack("<II", len(content), GLB_JSON_CHUNK) + content
+        if binary:
+            chunks += struct.pack("<II", len(binary), GLB_BIN_CHUNK) + binary
+
+        header = struct.pack("<III", GLB_MAGIC, 2, 12 + len(chunks))
+        return header + chunks
+
+
+class GltfExporter(BaseExporter):
+    """Exporter for glTF 2.0 JSON documents"""
+
+    binary = False
+
+    async def to_bytes(
+        self,
+        target: cq.Workplane,
+        tolerance: float = DEFAULT_TOLERANCE,
+        angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+        **kwargs,
+    ) -> bytes:
+        document = GltfDocument()
+
+        # Mesh each distinct geometry once and point every placement of it at that mesh
+        for i, (base, instances) in enumerate(group_instances(self._shapes(target))):
+            mesh = tessellate(base, tolerance, angular_tolerance)
+            if mesh.is_empty:
+                continue
+            name = "main_shape" if i == 0 else f"shape_{i}"
+            index = document.add_mesh(mesh, name)
+            for j, instance in enumerate(instances):
+                document.add_node(
+                    name if j == 0 else f"{name}_{j}",
+                    mesh=index,
+                    matrix=location_matrix(instance),
+                )
+
+        return document.to_glb() if self.binary else document.to_gltf()
+
+    @property
+    def format_name(self) -> str:
+        return "gltf"
+
+    @property
+    def file_extension(self) -> str:
+        return "gltf"
+
+    @property
+    def media_type(self) -> str:
+        return "model/gltf+json"
+
+
+class GlbExporter(GltfExporter):
+    """Exporter for binary glTF 2.0 containers"""
+
+    binary = True
+
+    @property
+    def format_name(self) -> str:
+        return "glb"
+
+    @property
+    def file_extension(self) -> str:
+        return "glb"
+
+    @property
+    def media_type(self) -> str:
+        return "model/gltf-binary"
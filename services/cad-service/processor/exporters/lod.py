@@ -0,0 +1,42 @@
+from dataclasses import dataclass, asdict
+from typing import Any, Optional
+
+from shared.models.base import Export, LevelOfDetail
+
+
+@dataclass(frozen=True)
+class Tessellation:
+    """Linear deflection (mm) and angular deflection (radians) used when meshing"""
+
+    tolerance: float
+    angular_tolerance: float
+
+
+LOD_PRESETS: dict[str, Tessellation] = {
+    LevelOfDetail.PREVIEW.value: Tessellation(tolerance=1.0, angular_tolerance=0.5),
+    LevelOfDetail.STANDARD.value: Tessellation(tolerance=0.1, angular_tolerance=0.1),
+    LevelOfDetail.FINE.value: Tessellation(tolerance=0.01, angular_tolerance=0.05),
+}
+
+# Levels of detail from cheapest to most expensive to produce
+LOD_ORDER = [LevelOfDetail.PREVIEW, LevelOfDetail.STANDARD, LevelOfDetail.FINE]
+
+
+def tessellation_for(export: Optional[Export]) -> Tessellation:
+    """Resolve the tessellation settings for an export, preferring a named LOD preset"""
+    if not export:
+        return LOD_PRESETS[LevelOfDetail.STANDARD.value]
+
+    if export.lod:
+        return LOD_PRESETS[LevelOfDetail(export.lod).value]
+
+    return Tessellation(
+        tolerance=export.precision, angular_tolerance=export.angular_tolerance
+    )
+
+
+def export_options(export: Optional[Export]) -> dict[str, Any]:
+    """Keyword arguments passed to an exporter for the given export settings"""
+    options = asdict(tessellation_for(export))
+    options["binary"] = export.binary if export else True
+    return options
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+import numpy as np
+from OCP.BRepTools import BRepTools
+from cadquery import cq
+
+
+@dataclass
+class Mesh:
+    """Triangle mesh produced by tessellating a shape"""
+
+    vertices: np.ndarray
+    triangles: np.ndarray
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.triangles) == 0
+
+    def normals(self) -> np.ndarray:
+        """Per vertex normals, smoothed across each face but not across edges"""
+        corners = self.vertices[self.triangles]
+        face_normals = np.cross(
+            corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+        )
+
+        normals = np.zeros_like(self.vertices)
+        for i in range(3):
+            np.add.at(normals, self.triangles[:, i], face_normals)
+
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        lengths[lengths == 0] = 1
+        return (normals / lengths).astype(np.float32)
+
+    def welded(self, decimals: int = 6) -> "Mesh":
+        """Merge coincident vertices, e.g. where faces meet along an edge"""
+        unique, inverse = np.unique(
+            np.round(self.vertices, decimals), axis=0, return_inverse=True
+        )
+        return Mesh(
+            vertices=unique.astype(np.float32),
+            triangles=inverse.reshape(-1)[self.triangles].astype(np.uint32),
+        )
+
+
+def tessellate(shape: cq.Shape, tolerance: float, angular_tolerance: float) -> Mesh:
+    """Tessellate a shape into a triangle mesh"""
+    # OCCT keeps the finest triangulation stored on a shape and reuses it for
+    # coarser requests, so drop it to honour the requested tolerance
+    BRepTools.Clean_s(shape.wrapped)
+    vertices, triangles = shape.tessellate(tolerance, angular_tolerance)
+
+    return Mesh(
+        vertices=np.array([v.toTuple() for v in vertices], dtype=np.float32).reshape(-1, 3),
+        triangles=np.array(triangles, dtype=np.uint32).reshape(-1, 3),
+    )
@@ -0,0 +1,33 @@
+import tempfile
+from pathlib import Path
+
+from cadquery import cq
+
+from processor.exporters.base import BaseExporter
+
+
+class StepExporter(BaseExporter):
+    """Exporter for STEP files"""
+
+    async def export(self, target: cq.Workplane, output_path: Path, **kwargs) -> Path:
+        self._compound(target).exportStep(str(output_path))
+        return Path(output_path)
+
+    async def to_bytes(self, target: cq.Workplane, **kwargs) -> bytes:
+        # The OCCT STEP writer only accepts a file name, so go via a scratch file
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"model.{self.file_extension}"
+            await self.export(target, path)
+            return path.read_bytes()
+
+    @property
+    def format_name(self) -> str:
+        return "step"
+
+    @property
+    def file_extension(self) -> str:
+        return "step"
+
+    @property
+    def media_type(self) -> str:
+        return "model/step"
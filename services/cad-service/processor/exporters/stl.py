@@ -0,0 +1,72 @@
+import numpy as np
+from cadquery import cq
+
+from processor.exporters.base import (
+    BaseExporter,
+    DEFAULT_TOLERANCE,
+    DEFAULT_ANGULAR_TOLERANCE,
+)
+from processor.exporters.mesh import tessellate
+
+STL_TRIANGLE = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attributes", "<u2"),
+    ]
+)
+
+
+class StlExporter(BaseExporter):
+    """Exporter for STL meshes"""
+
+    async def to_bytes(
+        self,
+        target: cq.Workplane,
+        tolerance: float = DEFAULT_TOLERANCE,
+        angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+        binary: bool = True,
+        **kwargs,
+    ) -> bytes:
+        mesh = tessellate(self._compound(target), tolerance, angular_tolerance)
+        corners = mesh.vertices[mesh.triangles]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        lengths[lengths == 0] = 1
+        normals = normals / lengths
+
+        if not binary:
+            return self._ascii(corners, normals)
+
+        triangles = np.zeros(len(corners), dtype=STL_TRIANGLE)
+        triangles["normal"] = normals
+        triangles["vertices"] = corners
+
+        header = b"think-cad binary STL".ljust(80, b" ")
+        count = np.array([len(triangles)], dtype="<u4")
+        return header + count.tobytes() + triangles.tobytes()
+
+    @staticmethod
+    def _ascii(corners: np.ndarray, normals: np.ndarray) -> bytes:
+        lines = ["solid model"]
+        for normal, triangle in zip(normals, corners):
+            lines.append(f"facet normal {normal[0]:e} {normal[1]:e} {normal[2]:e}")
+            lines.append("  outer loop")
+            for x, y, z in triangle:
+                lines.append(f"    vertex {x:e} {y:e} {z:e}")
+            lines.append("  endloop")
+            lines.append("endfacet")
+        lines.append("endsolid model")
+        return "\n".join(lines).encode("ascii")
+
+    @property
+    def format_name(self) -> str:
+        return "stl"
+
+    @property
+    def file_extension(self) -> str:
+        return "stl"
+
+    @property
+    def media_type(self) -> str:
+        return "model/stl"
@@ -0,0 +1,38 @@
+from io import BytesIO
+
+from cadquery import cq
+from cadquery.occ_impl.exporters.threemf import ThreeMFWriter
+
+from processor.exporters.base import (
+    BaseExporter,
+    DEFAULT_TOLERANCE,
+    DEFAULT_ANGULAR_TOLERANCE,
+)
+
+
+class ThreeMFExporter(BaseExporter):
+    """Exporter for 3MF packages"""
+
+    async def to_bytes(
+        self,
+        target: cq.Workplane,
+        tolerance: float = DEFAULT_TOLERANCE,
+        angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+        **kwargs,
+    ) -> bytes:
+        writer = ThreeMFWriter(self._compound(target), tolerance, angular_tolerance)
+        buffer = BytesIO()
+        writer.write3mf(buffer)
+        return buffer.getvalue()
+
+    @property
+    def format_name(self) -> str:
+        return "3mf"
+
+    @property
+    def file_extension(self) -> str:
+        return "3mf"
+
+    @property
+    def media_type(self) -> str:
+        return "model/3mf"
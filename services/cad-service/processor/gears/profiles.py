@@ -0,0 +1,89 @@
+import logging
+
+import cq_gears
+from cadquery import cq
+
+from core.settings import settings
+from processor.cache import LRUCache
+from shared.models.base import BevelGearParameters, SpurGearParameters
+
+logger = logging.getLogger(__name__)
+
+# Nominal width the spur gear is built at to take its cross-section
+PROFILE_WIDTH = 1.0
+
+gear_profiles = LRUCache(settings.GEAR_PROFILE_CACHE_SIZE, name="gear_profile")
+
+
+def spur_profile_key(parameters: SpurGearParameters) -> str:
+    """The parameters which shape a spur gear's teeth, leaving out width, bore and hub"""
+    return repr((
+        "spur",
+        parameters.module,
+        parameters.teeth,
+        parameters.pressure_angle,
+        parameters.clearance,
+        parameters.backlash,
+    ))
+
+
+def bevel_body_key(parameters: BevelGearParameters) -> str:
+    """Everything which shapes a bevel gear except its bore"""
+    return repr(("bevel", *parameters.model_dump(exclude={"type", "bore"}).values()))
+
+
+def spur_profile(parameters: SpurGearParameters) -> cq.Face:
+    """
+    The cross-section of a spur gear with no bore, in the XY plane.
+
+    Straight teeth are the same all the way through, so the face is taken off a
+    thin gear once and then extruded to whatever width is asked for.
+    """
+    key = spur_profile_key(parameters)
+    profile = gear_profiles.get(key)
+    if profile is None:
+        gear = cq_gears.SpurGear(
+            module=parameters.module,
+            teeth_number=parameters.teeth,
+            width=PROFILE_WIDTH,
+            pressure_angle=parameters.pressure_angle,
+            clearance=parameters.clearance,
+            backlash=parameters.backlash,
+        )
+        face = cq.Workplane("XY").add(gear.build()).faces("<Z").val()
+        profile = face.translate(cq.Vector(0, 0, -face.Center().z))
+        gear_profiles.put(key, profile)
+        logger.debug(f"Built spur gear profile {key}")
+
+    return profile
+
+
+def bevel_body(parameters: BevelGearParameters) -> cq.Shape:
+    """A bevel gear with no bore, built once for each set of tooth parameters"""
+    key = bevel_body_key(parameters)
+    body = gear_profiles.get(key)
+    if body is None:
+        gear = cq_gears.BevelGear(
+            module=parameters.module,
+            teeth_number=parameters.teeth,
+            pressure_angle=parameters.pressure_angle,
+            cone_angle=parameters.cone_angle,
+            helix_angle=parameters.helix_angle,
+            clearance=parameters.clearance,
+            backlash=parameters.backlash,
+            face_width=parameters.face_width,
+        )
+        body = gear.build()
+        gear_profiles.put(key, body)
+        logger.debug(f"Built bevel gear body {key}")
+
+    return body
+
+
+def bore(body: cq.Shape, diameter: float) -> cq.Shape:
+    """Cut a bore along the Z axis all the way through a gear"""
+    box = body.BoundingBox()
+    hole = cq.Solid.makeCylinder(
+        diameter / 2, box.zlen + 2, cq.Vector(0, 0, box.zmin - 1)
+    )
+    return body.cut(hole)
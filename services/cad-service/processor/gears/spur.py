@@ -1,6 +1,6 @@
-import cq_gears
 from cadquery import cq
 
+from processor.gears.profiles import bore, spur_profile
 from processor.shapes.base import BaseShapeHandler
 from shared.models.base import SpurGearParameters
 from shared.models.exceptions import ValidationError
@@ -9,28 +9,27 @@ from shared.models.exceptions import ValidationError
 class SpurGearHandler(BaseShapeHandler):
     """Handler for spur gears"""
 
-    async def create(
-        self, parameters: SpurGearParameters, position: list, rotation: list
-    ) -> cq.Workplane:
+    async def build(self, parameters: SpurGearParameters) -> cq.Workplane:
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid parameters", service="cad-service")
 
-        wp = cq.Workplane("XY")
-        obj = wp.gear(
-            cq_gears.SpurGear(
-                module=parameters.module,
-                teeth_number=parameters.teeth,
-                width=parameters.width,
-                pressure_angle=parameters.pressure_angle,
-                clearance=parameters.clearance,
-                backlash=parameters.backlash,
-                bore_d=5.0,
-                hub_d=parameters.hub_diameter,
-                hub_length=parameters.hub_length,
-            ),
+        # Extrude the cached tooth profile, so only the width, hub and bore are new work
+        body = cq.Solid.extrudeLinear(
+            spur_profile(parameters), cq.Vector(0, 0, parameters.width)
         )
 
-        return await self._apply_transformations(obj, position, rotation)
+        if parameters.hub_diameter and parameters.hub_length:
+            hub = cq.Solid.makeCylinder(
+                parameters.hub_diameter / 2,
+                parameters.hub_length,
+                cq.Vector(0, 0, parameters.width),
+            )
+            body = body.fuse(hub).clean()
+
+        if parameters.bore:
+            body = bore(body, parameters.bore)
+
+        return cq.Workplane("XY").newObject([body])
 
     def validate_parameters(self, parameters: SpurGearParameters) -> bool:
         if not isinstance(parameters, SpurGearParameters):
@@ -0,0 +1,115 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from shared.models.base import BooleanParameters, CADConfiguration, Operation, Shape
+from shared.models.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def operation_inputs(operation: Operation) -> list[str]:
+    """Ids of the components an operation reads: its targets, then any boolean tool"""
+    inputs = list(operation.targets)
+    if isinstance(operation.parameters, BooleanParameters):
+        inputs.append(operation.parameters.tool)
+    return list(dict.fromkeys(inputs))
+
+
+@dataclass(eq=False)
+class Node:
+    """
+    One version of a component: either a shape as built, or the result of an
+    operation on the versions of the components it reads.
+    """
+
+    component: str
+    shape: Optional[Shape] = None
+    operation: Optional[Operation] = None
+    index: int = -1
+    inputs: list["Node"] = field(default_factory=list)
+
+    def subtree(self, stop: frozenset = frozenset()) -> Iterator["Node"]:
+        """This node and everything it depends on, not descending into stop"""
+        yield self
+        for node in self.inputs:
+            if node not in stop:
+                yield from node.subtree(stop)
+
+    def branches(self) -> list["Node"]:
+        """Inputs which carry operations of their own, so are worth building apart"""
+        return [node for node in self.inputs if node.operation is not None]
+
+
+class OperationGraph:
+    """
+    The dependency graph of a configuration's shapes and operations.
+
+    Every operation replaces its first target and uses up everything else it
+    reads, so each version of a component feeds at most one operation and the
+    graph is a forest. Its roots are the components left at the end; separate
+    trees, and separate branches of one tree, can be built independently.
+    """
+
+    def __init__(self, config: CADConfiguration):
+        self.config = config
+
+        latest: dict[str, Node] = {}
+        for i, shape in enumerate(config.shapes):
+            component = shape.id or f"shape_{i}"
+            latest[component] = Node(component, shape=shape)
+
+        for index, operation in enumerate(config.operations or []):
+            inputs = operation_inputs(operation)
+            missing = [component for component in inputs if component not in latest]
+            if missing or not operation.targets:
+                raise ValidationError(
+                    f"Unknown or missing targets {missing} for {operation.type} operation",
+                    service="cad-service",
+                )
+
+            node = Node(
+                operation.targets[0],
+                operation=operation,
+                index=index,
+                inputs=[latest.pop(component) for component in inputs],
+            )
+            latest[node.component] = node
+
+        self.roots = list(latest.values())
+        logger.debug(
+            f"Operation graph has {len(self.roots)} roots "
+            f"({len(self.trees())} with operations)"
+        )
+
+    def trees(self) -> list[Node]:
+        """Roots which are the result of operations"""
+        return [root for root in self.roots if root.operation is not None]
+
+    def leaves(self) -> list[Node]:
+        """Roots which are shapes no operation touches"""
+        return [root for root in self.roots if root.operation is None]
+
+    def subconfiguration(
+        self, nodes: list[Node], stop: frozenset = frozenset()
+    ) -> CADConfiguration:
+        """
+        The shapes and operations needed to build nodes, leaving out the parts
+        under stop, whose results are supplied separately by component id.
+        """
+        members = [member for node in nodes for member in node.subtree(stop)]
+        shapes = [
+            member.shape.model_copy(update={"id": member.component})
+            for member in members
+            if member.shape is not None
+        ]
+        operations = sorted(
+            (member for member in members if member.operation is not None),
+            key=lambda member: member.index,
+        )
+        return self.config.model_copy(
+            update={
+                "shapes": shapes,
+                "operations": [member.operation for member in operations] or None,
+            }
+        )
@@ -5,6 +5,8 @@ from typing import Any, Dict
 
 from cadquery import cq
 
+from processor.placement import place
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,11 +14,22 @@ class ShapeHandler(ABC):
     """Abstract base class for shape handlers"""
 
     @abstractmethod
+    async def build(self, parameters: Any) -> cq.Workplane:
+        """Build an untransformed shape from the given parameters"""
+        pass
+
     async def create(
         self, parameters: Any, position: list, rotation: list
     ) -> cq.Workplane:
         """Create a shape with given parameters and transformations"""
-        pass
+        obj = await self.build(parameters)
+        return await self.place(obj, position, rotation)
+
+    async def place(
+        self, obj: cq.Workplane, position: list, rotation: list
+    ) -> cq.Workplane:
+        """Place a shape built by this handler at the given position and rotation"""
+        return await self._apply_transformations(obj, position, rotation)
 
     @abstractmethod
     def validate_parameters(self, parameters: dict[str, Any]) -> bool:
@@ -32,23 +45,8 @@ class ShapeHandler(ABC):
     async def _apply_transformations(
         self, obj: cq.Workplane, position: list, rotation: list
     ) -> cq.Workplane:
-        """Apply position and rotation transformations"""
-        if position != [0, 0, 0]:
-            obj = obj.translate(tuple(position))
-            logger.debug(f"Applied translation: {position}")
-
-        if rotation != [0, 0, 0]:
-            rx, ry, rz = rotation
-            if rx != 0:
-                obj = obj.rotate((0, 0, 0), (1, 0, 0), rx)
-            if ry != 0:
-                obj = obj.rotate((0, 0, 1), (0, 1, 0), ry)
-            if rz != 0:
-                obj = obj.rotate((0, 0, 2), (0, 0, 1), rz)
-
-            logger.debug(f"Applied rotation: {rotation}")
-
-        return obj
+        """Rotate a shape about its own origin (X, then Y, then Z) and then move it to position"""
+        return place(obj, position, rotation)
 
 
 class GearHandler(ABC):
@@ -82,6 +80,10 @@ class OperationHandler(ABC):
         """Apply operation to target object"""
         pass
 
+    def consumed(self, operation: Any) -> list[str]:
+        """Ids of the other components the operation uses up, such as a boolean tool"""
+        return []
+
     @property
     @abstractmethod
     def supported_types(self) -> list[str]:
@@ -93,12 +95,15 @@ class Exporter(ABC):
     """Abstract base class for exporters"""
 
     @abstractmethod
-    async def export(
-        self, target: cq.Workplane, output_path: Path, **kwargs
-    ) -> cq.Workplane:
+    async def export(self, target: cq.Workplane, output_path: Path, **kwargs) -> Path:
         """Export model to specified format"""
         pass
 
+    @abstractmethod
+    async def to_bytes(self, target: cq.Workplane, **kwargs) -> bytes:
+        """Export model to specified format in memory"""
+        pass
+
     @property
     @abstractmethod
     def format_name(self) -> str:
@@ -110,3 +115,9 @@ class Exporter(ABC):
     def file_extension(self) -> str:
         """Return file extension of export format"""
         pass
+
+    @property
+    @abstractmethod
+    def media_type(self) -> str:
+        """Return the MIME type of export format"""
+        pass
@@ -0,0 +1,28 @@
+from .booleans import BooleanHandler
+from .modifiers import ChamferHandler, FilletHandler, ShellHandler
+from .patterns import ArrayHandler, MirrorHandler, PatternHandler
+
+
+def get_operation_handlers():
+    """Return all available handlers"""
+    return [
+        BooleanHandler,
+        FilletHandler,
+        ChamferHandler,
+        ShellHandler,
+        MirrorHandler,
+        ArrayHandler,
+        PatternHandler,
+    ]
+
+
+__all__ = [
+    "ArrayHandler",
+    "BooleanHandler",
+    "ChamferHandler",
+    "FilletHandler",
+    "MirrorHandler",
+    "PatternHandler",
+    "ShellHandler",
+    "get_operation_handlers",
+]
@@ -0,0 +1,81 @@
+import logging
+from abc import ABC
+from typing import Callable, Iterable, Optional, Type, TypeVar
+
+from cadquery import cq
+
+from processor.interfaces import OperationHandler
+from processor.placement import group_instances
+from shared.models.base import Operation
+from shared.models.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P")
+
+
+class BaseOperationHandler(OperationHandler, ABC):
+    """Base implementation for operation handlers"""
+
+    @staticmethod
+    def _parameters(operation: Operation, parameter_type: Type[P]) -> P:
+        """The operation's parameters, which must be of the given type"""
+        if not isinstance(operation.parameters, parameter_type):
+            raise ValidationError(
+                f"Invalid parameters for {operation.type} operation", service="cad-service"
+            )
+        return operation.parameters
+
+    @staticmethod
+    def _shapes(obj: cq.Workplane) -> list[cq.Shape]:
+        return [val for val in obj.vals() if isinstance(val, cq.Shape)]
+
+    @staticmethod
+    def _select(
+        shape: cq.Shape, kind: str, selectors: Optional[list[str]]
+    ) -> list[cq.Shape]:
+        """Edges or faces of a shape matching any of the selectors, or all of them"""
+        if not selectors:
+            return shape.Edges() if kind == "edges" else shape.Faces()
+
+        wp = cq.Workplane("XY").add(shape)
+        selected = {}
+        for selector in selectors:
+            for sub_shape in getattr(wp, kind)(selector).vals():
+                selected.setdefault(sub_shape, sub_shape)
+
+        if not selected:
+            raise ValidationError(
+                f"No {kind} match {selectors}", service="cad-service"
+            )
+        return list(selected)
+
+    def _each(
+        self,
+        target: cq.Workplane,
+        fn: Callable[[cq.Shape], cq.Shape],
+        per_instance: bool = True,
+    ) -> cq.Workplane:
+        """
+        Apply fn to every shape on the target.
+
+        When fn does not depend on where a shape is (per_instance is False), it
+        runs once for each distinct geometry and the result is moved to every
+        placement of it, so patterned copies keep sharing their geometry.
+        """
+        shapes = self._shapes(target)
+        if per_instance:
+            return cq.Workplane("XY").newObject([fn(shape) for shape in shapes])
+
+        groups = group_instances(shapes)
+        built = {base: fn(base) for base, _ in groups}
+        logger.debug(f"Applied once per geometry to {len(groups)} of {len(shapes)} shapes")
+
+        return cq.Workplane("XY").newObject(
+            [built[shape.located(cq.Location())].moved(shape.location()) for shape in shapes]
+        )
+
+    @staticmethod
+    def _compound(shapes: Iterable[cq.Shape]) -> cq.Shape:
+        shapes = list(shapes)
+        return shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
@@ -0,0 +1,59 @@
+from typing import Dict, Optional
+
+from cadquery import cq
+
+from processor.operations.base import BaseOperationHandler
+from processor.utils.booleans import fuse_multi
+from shared.models.base import BooleanParameters, Operation
+from shared.models.exceptions import ValidationError
+
+
+class BooleanHandler(BaseOperationHandler):
+    """Handler for union, cut and intersect operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Combine the targets with the tool component in a single boolean"""
+        tool = self._tool(operation, objects)
+
+        if operation.type == "union":
+            return fuse_multi([target] if tool is None else [target, tool])
+
+        if tool is None:
+            raise ValidationError(
+                f"A {operation.type} operation needs a tool", service="cad-service"
+            )
+
+        shape = self._compound(self._shapes(target))
+        tools = self._shapes(tool)
+        if operation.type == "cut":
+            result = shape.cut(*tools)
+        else:
+            result = shape.intersect(*tools)
+
+        return cq.Workplane("XY").newObject([result.clean()])
+
+    def consumed(self, operation: Operation) -> list[str]:
+        if isinstance(operation.parameters, BooleanParameters):
+            return [operation.parameters.tool]
+        return []
+
+    def _tool(
+        self, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> Optional[cq.Workplane]:
+        if operation.parameters is None:
+            return None
+
+        parameters = self._parameters(operation, BooleanParameters)
+        tool = objects.get(parameters.tool)
+        if tool is None:
+            raise ValidationError(
+                f"Unknown tool {parameters.tool} for {operation.type} operation",
+                service="cad-service",
+            )
+        return tool
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["union", "cut", "intersect"]
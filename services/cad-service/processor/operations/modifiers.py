@@ -0,0 +1,79 @@
+from typing import Dict
+
+from cadquery import cq
+
+from processor.operations.base import BaseOperationHandler
+from shared.models.base import (
+    ChamferParameters,
+    FilletParameters,
+    Operation,
+    ShellParameters,
+)
+
+
+class FilletHandler(BaseOperationHandler):
+    """Handler for fillet operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Round the selected edges, or every edge, of each target"""
+        parameters = self._parameters(operation, FilletParameters)
+        return self._each(
+            target,
+            lambda shape: shape.fillet(
+                parameters.radius, self._select(shape, "edges", parameters.edges)
+            ),
+            per_instance=bool(parameters.edges),
+        )
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["fillet"]
+
+
+class ChamferHandler(BaseOperationHandler):
+    """Handler for chamfer operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Bevel the selected edges, or every edge, of each target"""
+        parameters = self._parameters(operation, ChamferParameters)
+        return self._each(
+            target,
+            lambda shape: shape.chamfer(
+                parameters.length, None, self._select(shape, "edges", parameters.edges)
+            ),
+            per_instance=bool(parameters.edges),
+        )
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["chamfer"]
+
+
+class ShellHandler(BaseOperationHandler):
+    """Handler for shell operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """
+        Hollow each target inwards, keeping its outer size. The selected faces
+        are removed to open the shell; without faces the result is a closed
+        hollow solid.
+        """
+        parameters = self._parameters(operation, ShellParameters)
+        return self._each(
+            target,
+            lambda shape: shape.hollow(
+                self._select(shape, "faces", parameters.faces) if parameters.faces else [],
+                -parameters.thickness,
+            ),
+            per_instance=bool(parameters.faces),
+        )
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["shell"]
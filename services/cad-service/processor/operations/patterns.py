@@ -0,0 +1,148 @@
+import logging
+from typing import Dict
+
+import numpy as np
+from cadquery import cq
+
+from processor.operations.base import BaseOperationHandler
+from processor.placement import matrix_location, rotation_matrix
+from shared.models.base import (
+    ArrayParameters,
+    MirrorParameters,
+    Operation,
+    PatternParameters,
+)
+from shared.models.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def translation(offset) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, 3] = offset
+    return matrix
+
+
+def rotation_about_z(angle: float, center) -> np.ndarray:
+    """Rotation by angle degrees about the Z axis through center"""
+    matrix = translation(center)
+    matrix[:3, :3] = rotation_matrix([0, 0, angle])
+    return matrix @ translation(-np.asarray(center, dtype=float))
+
+
+def array_transforms(parameters: ArrayParameters) -> list[np.ndarray]:
+    """One translation per copy, the first being the original"""
+    spacing = np.asarray(parameters.spacing, dtype=float)
+    return [translation(i * spacing) for i in range(parameters.count)]
+
+
+def pattern_transforms(parameters: PatternParameters) -> list[np.ndarray]:
+    """
+    One transform per copy, the first being the original.
+
+    linear: count copies spacing apart, in the XY direction angle degrees from X.
+    rectangular: a count by count grid, spacing apart along that direction and
+    the one perpendicular to it.
+    circular: count copies about the Z axis through center (the origin by
+    default) spread over angle degrees, where 0 or 360 is a full turn.
+    """
+    count = parameters.count
+
+    if parameters.pattern_type == "circular":
+        center = parameters.center or [0, 0, 0]
+        sweep = parameters.angle % 360
+        step = 360 / count if sweep == 0 else sweep / max(count - 1, 1)
+        return [rotation_about_z(i * step, center) for i in range(count)]
+
+    if parameters.spacing is None:
+        raise ValidationError(
+            f"A {parameters.pattern_type} pattern needs a spacing", service="cad-service"
+        )
+
+    u = rotation_matrix([0, 0, parameters.angle])[:, 0] * parameters.spacing
+    if parameters.pattern_type == "linear":
+        return [translation(i * u) for i in range(count)]
+
+    v = rotation_matrix([0, 0, parameters.angle + 90])[:, 0] * parameters.spacing
+    return [translation(i * u + j * v) for j in range(count) for i in range(count)]
+
+
+def copies(target: cq.Workplane, transforms: list[np.ndarray]) -> cq.Workplane:
+    """
+    Every shape on the target under every transform.
+
+    The copies are moved by location, so they share the original's geometry:
+    nothing is rebuilt, and the result is one compound of instances that the
+    final fuse combines in a single boolean (or an assembly keeps as instances).
+    """
+    shapes = [val for val in target.vals() if isinstance(val, cq.Shape)]
+    locations = [
+        None if np.allclose(matrix, np.eye(4)) else matrix_location(matrix)
+        for matrix in transforms
+    ]
+
+    logger.debug(f"Instancing {len(shapes)} shapes {len(locations)} times")
+    return cq.Workplane("XY").newObject(
+        [
+            shape if location is None else shape.moved(location)
+            for location in locations
+            for shape in shapes
+        ]
+    )
+
+
+class ArrayHandler(BaseOperationHandler):
+    """Handler for array operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Repeat the targets count times, each copy offset by spacing from the last"""
+        parameters = self._parameters(operation, ArrayParameters)
+        return copies(target, array_transforms(parameters))
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["array"]
+
+
+class PatternHandler(BaseOperationHandler):
+    """Handler for linear, rectangular and circular patterns"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Repeat the targets along the pattern"""
+        parameters = self._parameters(operation, PatternParameters)
+        return copies(target, pattern_transforms(parameters))
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["pattern"]
+
+
+class MirrorHandler(BaseOperationHandler):
+    """Handler for mirror operations"""
+
+    async def apply(
+        self, target: cq.Workplane, operation: Operation, objects: Dict[str, cq.Workplane]
+    ) -> cq.Workplane:
+        """Reflect the targets in a plane, keeping the originals unless asked not to"""
+        parameters = (
+            self._parameters(operation, MirrorParameters)
+            if operation.parameters
+            else MirrorParameters()
+        )
+
+        mirrored = [
+            shape.mirror(parameters.plane.value, cq.Vector(*parameters.base_point))
+            for shape in self._shapes(target)
+        ]
+        if parameters.keep_original:
+            mirrored = self._shapes(target) + mirrored
+
+        return cq.Workplane("XY").newObject(mirrored)
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["mirror"]
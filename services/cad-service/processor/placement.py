@@ -0,0 +1,83 @@
+import logging
+from typing import Sequence
+
+import numpy as np
+from OCP.gp import gp_Trsf
+from cadquery import cq
+
+logger = logging.getLogger(__name__)
+
+
+def rotation_matrix(rotation: Sequence[float]) -> np.ndarray:
+    """
+    3x3 matrix for a rotation given as degrees about X, Y and Z.
+
+    The rotations are extrinsic: about the fixed X axis first, then the fixed Y
+    axis, then the fixed Z axis, so the matrix is Rz @ Ry @ Rx.
+    """
+    rx, ry, rz = np.radians(rotation)
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+
+    rot_x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    rot_y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rot_z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rot_z @ rot_y @ rot_x
+
+
+def placement_matrix(position: Sequence[float], rotation: Sequence[float]) -> np.ndarray:
+    """
+    4x4 homogeneous matrix placing a shape: rotate it about its own origin, then
+    move that origin to position.
+    """
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation_matrix(rotation)
+    matrix[:3, 3] = position
+    return matrix
+
+
+def matrix_location(matrix: np.ndarray) -> cq.Location:
+    """A 4x4 rigid transform as an OCCT location"""
+    trsf = gp_Trsf()
+    trsf.SetValues(*matrix[:3].ravel())
+    return cq.Location(trsf)
+
+
+def placement_location(position: Sequence[float], rotation: Sequence[float]) -> cq.Location:
+    """The placement as a single OCCT location"""
+    return matrix_location(placement_matrix(position, rotation))
+
+
+def is_identity(position: Sequence[float], rotation: Sequence[float]) -> bool:
+    return not any(position) and not any(rotation)
+
+
+def place(
+    obj: cq.Workplane, position: Sequence[float], rotation: Sequence[float]
+) -> cq.Workplane:
+    """
+    Place every shape on a workplane with one composed transform.
+
+    The shapes are moved by location rather than copied, so they share their
+    geometry with the originals, which are left untouched.
+    """
+    if is_identity(position, rotation):
+        return obj
+
+    location = placement_location(position, rotation)
+    logger.debug(f"Placed at {list(position)} rotated {list(rotation)}")
+    return obj.newObject(
+        [o.moved(location) if isinstance(o, cq.Shape) else o for o in obj.objects]
+    )
+
+
+def group_instances(shapes: list[cq.Shape]) -> list[tuple[cq.Shape, list[cq.Shape]]]:
+    """
+    Group shapes which are placements of the same geometry, returning each
+    underlying shape (at its own origin) with the placed shapes that use it.
+    """
+    groups: dict[cq.Shape, list[cq.Shape]] = {}
+    for shape in shapes:
+        groups.setdefault(shape.located(cq.Location()), []).append(shape)
+    return list(groups.items())
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC
-from typing import Any
+from typing import Any, Optional
 
 from cadquery import cq
 
@@ -17,17 +17,43 @@ class BaseShapeHandler(ShapeHandler, ABC):
         self, obj: cq.Workplane, features: list[FeatureUnion]
     ) -> cq.Workplane:
         """Apply features to workplane"""
+        groups = self._group_holes(features)
+
+        # Hole positions are relative to each face's centre on the uncut solid,
+        # so earlier cuts do not shift the groups placed after them
+        origins = {
+            face: obj.faces(face).workplane(centerOption="CenterOfMass").plane.origin
+            for face in {face for face, _, _ in groups}
+        }
+
+        for (face, diameter, depth), holes in groups.items():
+            positions = [hole.position for hole in holes]
+
+            # One face selection and one boolean cut per group of identical holes
+            obj = (
+                obj.faces(face)
+                .workplane(origin=origins[face])
+                .pushPoints(positions)
+                .hole(diameter=diameter, depth=depth)
+            )
+            logger.debug(
+                f"Applied {len(positions)} circular holes on {face} (diameter: {diameter}, depth: {depth})"
+            )
+
+        return obj
+
+    @staticmethod
+    def _group_holes(
+        features: list[FeatureUnion],
+    ) -> dict[tuple[str, float, Optional[float]], list[CircularHole]]:
+        """Group circular holes which share a face, diameter and depth"""
+        groups = {}
         for feature in features:
-            face_wp = obj.faces(feature.face).workplane(centerOption="CenterOfMass")
             if isinstance(feature, CircularHole):
-                obj = face_wp.move(*feature.position).hole(
-                    diameter=feature.diameter, depth=feature.depth
-                )
-                logger.debug(
-                    f"Applied circular hole at {feature.position} (diameter: {feature.diameter}, depth: {feature.depth})"
-                )
+                key = (feature.face, feature.diameter, feature.depth)
+                groups.setdefault(key, []).append(feature)
 
-        return obj
+        return groups
 
     def validate_parameters(self, parameters: dict[str, Any]) -> bool:
         """Default validation"""
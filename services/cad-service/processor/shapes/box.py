@@ -8,10 +8,8 @@ from shared.models.exceptions import ValidationError
 class BoxHandler(BaseShapeHandler):
     """Handler for box shapes"""
 
-    async def create(
-        self, parameters: BoxParameters, position: list, rotation: list
-    ) -> cq.Workplane:
-        """Create a box shape"""
+    async def build(self, parameters: BoxParameters) -> cq.Workplane:
+        """Build an untransformed box shape"""
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid parameters", service="cad-service")
 
@@ -26,7 +24,7 @@ class BoxHandler(BaseShapeHandler):
         if parameters.features:
             obj = await self._apply_features(obj, parameters.features)
 
-        return await self._apply_transformations(obj, position, rotation)
+        return obj
 
     def validate_parameters(self, parameters: BoxParameters) -> bool:
         """Validate box parameters"""
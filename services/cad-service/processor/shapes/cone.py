@@ -8,9 +8,7 @@ from shared.models.exceptions import ValidationError
 class ConeHandler(BaseShapeHandler):
     """Handler for cone shapes"""
 
-    async def create(
-        self, parameters: ConeParameters, position: list, rotation: list
-    ) -> cq.Workplane:
+    async def build(self, parameters: ConeParameters) -> cq.Workplane:
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid cone parameters", service="cad-service")
 
@@ -21,7 +19,7 @@ class ConeHandler(BaseShapeHandler):
         if parameters.features:
             obj = await self._apply_features(obj, parameters.features)
 
-        return await self._apply_transformations(obj, position, rotation)
+        return obj
 
     def validate_parameters(self, parameters: ConeParameters) -> bool:
         if not isinstance(parameters, ConeParameters):
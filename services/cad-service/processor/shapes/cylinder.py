@@ -8,10 +8,8 @@ from shared.models.exceptions import ValidationError
 class CylinderHandler(BaseShapeHandler):
     """Handler for cylinder shapes"""
 
-    async def create(
-        self, parameters: CylinderParameters, position: list, rotation: list
-    ) -> cq.Workplane:
-        """Create a cylinder shape"""
+    async def build(self, parameters: CylinderParameters) -> cq.Workplane:
+        """Build an untransformed cylinder shape"""
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid parameters", service="cad-service")
 
@@ -26,7 +24,7 @@ class CylinderHandler(BaseShapeHandler):
         if parameters.features:
             obj = await self._apply_features(obj, parameters.features)
 
-        return await self._apply_transformations(obj, position, rotation)
+        return obj
 
     def validate_parameters(self, parameters: CylinderParameters) -> bool:
         """Validate cylinder parameters"""
@@ -8,9 +8,7 @@ from shared.models.exceptions import ValidationError
 class SphereHandler(BaseShapeHandler):
     """Handler for sphere shape"""
 
-    async def create(
-        self, parameters: SphereParameters, position: list, rotation: list
-    ) -> cq.Workplane:
+    async def build(self, parameters: SphereParameters) -> cq.Workplane:
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid parameters", service="cad-service")
 
@@ -26,7 +24,7 @@ class SphereHandler(BaseShapeHandler):
         if parameters.features:
             obj = await self._apply_features(obj, parameters.features)
 
-        return await self._apply_transformations(obj, position, rotation)
+        return obj
 
     def validate_parameters(self, parameters: SphereParameters) -> bool:
         if not isinstance(parameters, SphereParameters):
@@ -8,9 +8,7 @@ from shared.models.exceptions import ValidationError
 class WedgeHandler(BaseShapeHandler):
     """Handler for wedge shapes"""
 
-    async def create(
-        self, parameters: WedgeParameters, position: list, rotation: list
-    ) -> cq.Workplane:
+    async def build(self, parameters: WedgeParameters) -> cq.Workplane:
         if not self.validate_parameters(parameters):
             raise ValidationError("Invalid parameters", service="cad-service")
 
@@ -28,7 +26,7 @@ class WedgeHandler(BaseShapeHandler):
         if parameters.features:
             obj = await self._apply_features(obj, parameters.features)
 
-        return await self._apply_transformations(obj, position, rotation)
+        return obj
 
     def validate_parameters(self, parameters: WedgeParameters) -> bool:
         if not isinstance(parameters, WedgeParameters):
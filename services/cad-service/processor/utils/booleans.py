@@ -0,0 +1,59 @@
+import logging
+
+from cadquery import cq
+
+logger = logging.getLogger(__name__)
+
+UNION_STRATEGIES = ("sequential", "tree", "multi")
+
+
+def _solids(objs: list[cq.Workplane]) -> list[cq.Shape]:
+    return [val for obj in objs for val in obj.vals() if isinstance(val, cq.Shape)]
+
+
+def fuse_sequential(objs: list[cq.Workplane]) -> cq.Workplane:
+    """Fold shapes into one accumulated solid, one boolean per shape"""
+    result = objs[0]
+    for obj in objs[1:]:
+        result = result.union(obj)
+    return result
+
+
+def fuse_tree(objs: list[cq.Workplane]) -> cq.Workplane:
+    """Fuse shapes pairwise as a balanced binary tree"""
+    level = list(objs)
+    while len(level) > 1:
+        paired = [a.union(b) for a, b in zip(level[0::2], level[1::2])]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def fuse_multi(objs: list[cq.Workplane]) -> cq.Workplane:
+    """Fuse all shapes with a single multi-argument boolean"""
+    solids = _solids(objs)
+    if len(solids) < 2:
+        return objs[0]
+
+    fused = solids[0].fuse(*solids[1:]).clean()
+    return cq.Workplane("XY").newObject([fused])
+
+
+def fuse_all(objs: list[cq.Workplane], strategy: str = "multi") -> cq.Workplane:
+    """Union a list of workplanes using the given strategy"""
+    if not objs:
+        return cq.Workplane("XY")
+    if len(objs) == 1:
+        return objs[0]
+
+    logger.debug(f"Fusing {len(objs)} shapes (strategy: {strategy})")
+
+    if strategy == "sequential":
+        return fuse_sequential(objs)
+    if strategy == "tree":
+        return fuse_tree(objs)
+    if strategy == "multi":
+        return fuse_multi(objs)
+
+    raise ValueError(f"Unknown union strategy {strategy}")
@@ -0,0 +1,25 @@
+from io import BytesIO
+
+from cadquery import cq
+
+
+def workplane_to_brep(obj: cq.Workplane) -> bytes:
+    """Serialise the shapes on a workplane to BREP bytes"""
+    shapes = [val for val in obj.vals() if isinstance(val, cq.Shape)]
+    if not shapes:
+        return b""
+
+    # Always wrap in a compound so each shape, and any geometry shared between
+    # them, comes back as a separate object
+    buffer = BytesIO()
+    cq.Compound.makeCompound(shapes).exportBrep(buffer)
+    return buffer.getvalue()
+
+
+def brep_to_workplane(data: bytes) -> cq.Workplane:
+    """Load BREP bytes produced by workplane_to_brep back onto a workplane"""
+    if not data:
+        return cq.Workplane("XY")
+
+    compound = cq.Shape.importBrep(BytesIO(data))
+    return cq.Workplane("XY").newObject(list(compound))
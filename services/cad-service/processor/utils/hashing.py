@@ -0,0 +1,65 @@
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+from shared.models.base import CADConfiguration, OutputMode
+
+# Fields which do not influence the generated geometry
+NON_GEOMETRIC_FIELDS = {"metadata", "export"}
+
+
+def _digest(payload: Any) -> str:
+    """Return a stable SHA-256 digest of a JSON-serialisable payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _canonical_payload(config: CADConfiguration, exclude: set[str]) -> dict:
+    """Dump a configuration with its random component ids replaced by positional aliases."""
+    payload = config.model_dump(mode="json", exclude=exclude)
+
+    aliases = {}
+    for collection in ("shapes", "gears"):
+        for i, item in enumerate(payload.get(collection) or []):
+            alias = f"{collection}_{i}"
+            if item.get("id") is not None:
+                aliases[item["id"]] = alias
+            item["id"] = alias
+
+    # Operations reference components by id, so rewrite those references too
+    for operation in payload.get("operations") or []:
+        operation["targets"] = [aliases.get(t, t) for t in operation["targets"]]
+        parameters = operation.get("parameters") or {}
+        if parameters.get("tool") in aliases:
+            parameters["tool"] = aliases[parameters["tool"]]
+
+    return payload
+
+
+def geometry_key(config: CADConfiguration) -> str:
+    """Canonical hash of the geometry described by a configuration, ignoring Shape ids."""
+    payload = _canonical_payload(config, exclude=NON_GEOMETRIC_FIELDS)
+
+    # Assemblies keep their parts separate, so they are different geometry from the fused model
+    if config.export and OutputMode(config.export.mode) == OutputMode.ASSEMBLY:
+        payload["mode"] = OutputMode.ASSEMBLY.value
+
+    return _digest(payload)
+
+
+def export_key(config: CADConfiguration, file_type: str) -> str:
+    """Canonical hash of a configuration together with its export settings."""
+    payload = _canonical_payload(config, exclude={"metadata"})
+    return _digest({"config": payload, "file_type": file_type.lower()})
+
+
+def shape_key(handler: Any, parameters: BaseModel) -> str:
+    """Canonical hash of the untransformed solid a handler builds from its parameters."""
+    return _digest(
+        {
+            "handler": type(handler).__name__,
+            "parameters": parameters.model_dump(mode="json"),
+        }
+    )
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+FLIGHT_REQUESTS = Counter(
+    "cad_singleflight_requests_total",
+    "Requests that started a build (leader) or joined one already in flight (coalesced)",
+    ["operation", "role"],
+)
+FLIGHTS_IN_PROGRESS = Gauge(
+    "cad_singleflight_in_flight",
+    "Builds currently in flight",
+    ["operation"],
+)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls for the same key.
+
+    The first caller for a key starts the work; anyone asking for the same key
+    while it is running awaits that work instead of repeating it, and every
+    caller receives the same result or exception. Once the work finishes the key
+    is forgotten, so later calls start afresh (and usually hit a cache).
+    """
+
+    def __init__(self):
+        self._flights: dict[tuple[str, str], asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(
+        self, operation: str, key: str, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run fn for a key, or join the run already in flight for it"""
+        flight = (operation, key)
+        task = self._flights.get(flight)
+
+        if task is None:
+            self.leaders += 1
+            FLIGHT_REQUESTS.labels(operation=operation, role="leader").inc()
+            FLIGHTS_IN_PROGRESS.labels(operation=operation).inc()
+
+            task = asyncio.ensure_future(fn())
+            self._flights[flight] = task
+            task.add_done_callback(lambda _: self._land(flight, task))
+        else:
+            self.coalesced += 1
+            FLIGHT_REQUESTS.labels(operation=operation, role="coalesced").inc()
+            logger.debug(f"Coalescing {operation} request onto in-flight build {key}")
+
+        # Shield the shared work so one caller going away does not cancel it for the rest
+        return await asyncio.shield(task)
+
+    def _land(self, flight: tuple[str, str], task: asyncio.Task):
+        if self._flights.get(flight) is task:
+            del self._flights[flight]
+        FLIGHTS_IN_PROGRESS.labels(operation=flight[0]).dec()
+
+        # Retrieve the exception so an abandoned flight does not log "never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight(),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
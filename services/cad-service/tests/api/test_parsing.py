@@ -0,0 +1,45 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.parsing import CAD_REQUEST_BODY, get_cad_request, register_request_schemas
+from shared.models.base import CADConfiguration
+from shared.models.helpers import create_box
+from shared.models.requests import CADRequest
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/echo", openapi_extra=CAD_REQUEST_BODY)
+    async def echo(request: CADRequest = Depends(get_cad_request)) -> CADRequest:
+        return request
+
+    register_request_schemas(app)
+    return app
+
+
+def test_body_is_parsed_into_a_cad_request():
+    request = CADRequest(
+        prompt="box",
+        config=CADConfiguration(shapes=[create_box(10, 10, 10, centered=True, id="a")]),
+    )
+
+    response = TestClient(make_app()).post("/echo", content=request.model_dump_json())
+
+    assert response.status_code == 200
+    assert CADRequest.model_validate(response.json()) == request
+
+
+def test_invalid_body_is_a_validation_error():
+    response = TestClient(make_app()).post("/echo", content=b'{"prompt": 1}')
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "prompt"]
+
+
+def test_request_schema_is_documented():
+    schema = make_app().openapi()
+
+    body = schema["paths"]["/echo"]["post"]["requestBody"]
+    assert body["content"]["application/json"]["schema"]["$ref"] == "#/components/schemas/CADRequest"
+    assert "BoxParameters" in schema["components"]["schemas"]
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from jobs import Job, JobManager, JobQueueFullError, SQLiteJobStore, InMemoryJobStore
+from processor import CADProcessor
+from shared.models.base import CADConfiguration
+from shared.models.helpers import create_box
+from shared.models.requests import CADRequest
+from shared.models.responses import JobStatus
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setattr("processor.core.settings.MODEL_EXPORT_PATH", str(tmp_path))
+    return CADProcessor(cache=True, execution_mode="inline")
+
+
+def box_request() -> CADRequest:
+    config = CADConfiguration(
+        shapes=[create_box(10, 10, 10, centered=True, features=[], id="a")]
+    )
+    return CADRequest(prompt="box", config=config)
+
+
+async def wait_for(manager: JobManager, job_id: str) -> Job:
+    for _ in range(200):
+        job = manager.get(job_id)
+        if job.finished:
+            return job
+        await asyncio.sleep(0.05)
+    raise TimeoutError(job_id)
+
+
+@pytest.mark.asyncio
+async def test_job_runs_to_completion(processor):
+    manager = JobManager(processor, InMemoryJobStore(), workers=1)
+    await manager.start()
+
+    job = manager.submit(box_request())
+    assert job.status == JobStatus.QUEUED
+
+    job = await wait_for(manager, job.id)
+    await manager.stop()
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == 1.0
+    assert job.model_path.endswith(".gltf")
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded(processor):
+    manager = JobManager(processor, InMemoryJobStore(), workers=1, max_queued=1)
+    await manager.start()
+    for worker in manager._workers:
+        worker.cancel()
+
+    manager.submit(box_request())
+    with pytest.raises(JobQueueFullError):
+        manager.submit(box_request())
+
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_queued_job_can_be_cancelled(processor):
+    manager = JobManager(processor, InMemoryJobStore(), workers=1)
+    await manager.start()
+    for worker in manager._workers:
+        worker.cancel()
+
+    job = manager.submit(box_request())
+    assert manager.cancel(job.id).status == JobStatus.CANCELLED
+
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_unfinished_jobs_are_recovered_on_start(processor, tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = SQLiteJobStore(path)
+    store.create(
+        Job(id="left-over", request_json=box_request().model_dump_json(), file_type="stl")
+    )
+    store.update("left-over", status=JobStatus.RUNNING, progress=0.5)
+    store.close()
+
+    manager = JobManager(processor, SQLiteJobStore(path), workers=1)
+    await manager.start()
+    job = await wait_for(manager, "left-over")
+    await manager.stop()
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.model_path.endswith(".stl")
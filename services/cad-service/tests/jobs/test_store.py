@@ -0,0 +1,49 @@
+import pytest
+
+from jobs import InMemoryJobStore, Job, SQLiteJobStore
+from shared.models.responses import JobStatus
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = InMemoryJobStore()
+    else:
+        store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    yield store
+    store.close()
+
+
+def test_create_get_and_update(store):
+    store.create(Job(id="a", request_json="{}", file_type="gltf"))
+
+    job = store.update("a", status=JobStatus.RUNNING, stage="building", progress=0.1)
+
+    assert job.status == JobStatus.RUNNING
+    assert store.get("a").progress == pytest.approx(0.1)
+    assert store.get("missing") is None
+    assert store.update("missing", progress=1.0) is None
+
+
+def test_unfinished_jobs_are_listed_oldest_first(store):
+    for job_id in ("a", "b", "c"):
+        store.create(Job(id=job_id, request_json="{}", file_type="gltf"))
+    store.update("b", status=JobStatus.SUCCEEDED)
+
+    assert [job.id for job in store.unfinished()] == ["a", "c"]
+
+
+def test_sqlite_jobs_survive_reopening(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = SQLiteJobStore(path)
+    store.create(Job(id="a", request_json='{"prompt": "box"}', file_type="stl"))
+    store.update("a", status=JobStatus.RUNNING)
+    store.close()
+
+    reopened = SQLiteJobStore(path)
+    job = reopened.get("a")
+    reopened.close()
+
+    assert job.status == JobStatus.RUNNING
+    assert job.request_json == '{"prompt": "box"}'
+    assert job.file_type == "stl"
@@ -0,0 +1,99 @@
+import json
+import struct
+import zipfile
+from io import BytesIO
+
+import numpy as np
+import pytest
+from cadquery import cq
+
+from processor.exporters import (
+    GltfExporter,
+    GlbExporter,
+    StepExporter,
+    StlExporter,
+    ThreeMFExporter,
+)
+
+
+@pytest.fixture
+def box() -> cq.Workplane:
+    return cq.Workplane("XY").box(10, 20, 30)
+
+
+@pytest.mark.asyncio
+async def test_step_export(box):
+    data = await StepExporter().to_bytes(box)
+    assert data.startswith(b"ISO-10303-21")
+
+
+@pytest.mark.asyncio
+async def test_binary_stl_export(box):
+    data = await StlExporter().to_bytes(box)
+
+    (count,) = struct.unpack("<I", data[80:84])
+    assert count == 12  # two triangles per box face
+    assert len(data) == 84 + count * 50
+
+
+@pytest.mark.asyncio
+async def test_ascii_stl_export(box):
+    data = await StlExporter().to_bytes(box, binary=False)
+    assert data.startswith(b"solid model")
+    assert data.count(b"facet normal") == 12
+
+
+@pytest.mark.asyncio
+async def test_glb_export(box):
+    data = await GlbExporter().to_bytes(box)
+
+    magic, version, length = struct.unpack("<III", data[:12])
+    assert magic == 0x46546C67
+    assert version == 2
+    assert length == len(data)
+
+    json_length, _ = struct.unpack("<II", data[12:20])
+    document = json.loads(data[20 : 20 + json_length])
+    assert document["meshes"][0]["name"] == "main_shape"
+    position = document["accessors"][0]
+    assert position["max"] == pytest.approx([5, 10, 15])
+
+
+@pytest.mark.asyncio
+async def test_gltf_export_embeds_buffer(box):
+    document = json.loads(await GltfExporter().to_bytes(box))
+
+    assert document["buffers"][0]["uri"].startswith("data:application/octet-stream;base64,")
+    assert len(document["meshes"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_3mf_export(box):
+    data = await ThreeMFExporter().to_bytes(box)
+
+    with zipfile.ZipFile(BytesIO(data)) as package:
+        assert "3D/3dmodel.model" in package.namelist()
+
+
+@pytest.mark.asyncio
+async def test_export_writes_file(box, tmp_path):
+    path = await GlbExporter().export(box, tmp_path / "model.glb")
+    assert path.read_bytes() == await GlbExporter().to_bytes(box)
+
+
+@pytest.mark.asyncio
+async def test_gltf_instances_repeated_geometry(box):
+    solid = box.val()
+    parts = cq.Workplane("XY").newObject(
+        [solid, solid.moved(cq.Location((50, 0, 0))), cq.Workplane("XY").sphere(5).val()]
+    )
+
+    document = json.loads(await GltfExporter().to_bytes(parts))
+
+    assert len(document["meshes"]) == 2
+    nodes = document["nodes"][1:]
+    assert [node["mesh"] for node in nodes] == [0, 0, 1]
+    first = np.array(nodes[0].get("matrix", np.eye(4).ravel())).reshape(4, 4)
+    second = np.array(nodes[1]["matrix"]).reshape(4, 4)
+    assert second[3, :3] - first[3, :3] == pytest.approx([50, 0, 0])
+    assert "matrix" not in nodes[2]
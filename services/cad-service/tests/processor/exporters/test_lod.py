@@ -0,0 +1,44 @@
+import struct
+
+import pytest
+from cadquery import cq
+
+from processor.exporters import StlExporter
+from processor.exporters.lod import LOD_PRESETS, export_options, tessellation_for
+from shared.models.base import Export
+
+
+def _triangle_count(stl: bytes) -> int:
+    return struct.unpack("<I", stl[80:84])[0]
+
+
+def test_export_precision_is_used_without_preset():
+    settings = tessellation_for(Export(precision=0.5, angular_tolerance=0.3))
+
+    assert settings.tolerance == 0.5
+    assert settings.angular_tolerance == 0.3
+
+
+def test_lod_preset_overrides_precision():
+    settings = tessellation_for(Export(precision=0.5, lod="preview"))
+    assert settings == LOD_PRESETS["preview"]
+
+
+def test_default_options_match_standard_preset():
+    options = export_options(None)
+
+    assert options["tolerance"] == LOD_PRESETS["standard"].tolerance
+    assert options["binary"] is True
+
+
+@pytest.mark.asyncio
+async def test_coarser_presets_produce_fewer_triangles():
+    sphere = cq.Workplane("XY").sphere(20)
+    exporter = StlExporter()
+
+    counts = [
+        _triangle_count(await exporter.to_bytes(sphere, **export_options(Export(lod=lod))))
+        for lod in ("preview", "standard", "fine")
+    ]
+
+    assert counts[0] < counts[1] < counts[2]
@@ -0,0 +1,98 @@
+import math
+
+import pytest
+
+cq_gears = pytest.importorskip("cq_gears")
+
+from cadquery import cq  # noqa: E402
+
+from processor.gears import BevelGearHandler, SpurGearHandler  # noqa: E402
+from processor.gears.profiles import gear_profiles  # noqa: E402
+from shared.models.base import BevelGearParameters, SpurGearParameters  # noqa: E402
+
+
+def spur(**kwargs) -> SpurGearParameters:
+    return SpurGearParameters(**{"module": 1.0, "teeth": 20, "width": 5.0, "bore": 0, **kwargs})
+
+
+@pytest.fixture(autouse=True)
+def empty_profiles():
+    gear_profiles.clear()
+    yield
+    gear_profiles.clear()
+
+
+@pytest.mark.asyncio
+async def test_spur_gears_of_other_widths_and_bores_reuse_the_profile():
+    handler = SpurGearHandler()
+
+    thin = (await handler.build(spur())).val()
+    thick = (await handler.build(spur(width=10.0))).val()
+    bored = (await handler.build(spur(width=10.0, bore=4.0))).val()
+
+    assert len(gear_profiles) == 1
+    assert gear_profiles.stats()["hits"] == 2
+    assert thick.Volume() == pytest.approx(2 * thin.Volume())
+    assert thick.Volume() - bored.Volume() == pytest.approx(math.pi * 2.0**2 * 10.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "extra",
+    [{"bore": 5.0}, {"bore": 4.0, "hub_diameter": 12.0, "hub_length": 4.0}],
+)
+async def test_spur_gear_from_the_profile_matches_cq_gears(extra):
+    parameters = spur(width=8.0, clearance=0.1, backlash=0.05, **extra)
+
+    built = (await SpurGearHandler().build(parameters)).val()
+    gear = cq_gears.SpurGear(
+        module=parameters.module,
+        teeth_number=parameters.teeth,
+        width=parameters.width,
+        pressure_angle=parameters.pressure_angle,
+        clearance=parameters.clearance,
+        backlash=parameters.backlash,
+        bore_d=parameters.bore,
+        hub_d=parameters.hub_diameter,
+        hub_length=parameters.hub_length,
+    )
+    expected = cq.Workplane("XY").add(gear.build()).val()
+
+    assert built.Volume() == pytest.approx(expected.Volume(), rel=1e-6)
+    box, expected_box = built.BoundingBox(), expected.BoundingBox()
+    for bound in ("xmin", "xmax", "ymin", "ymax", "zmin", "zmax"):
+        assert getattr(box, bound) == pytest.approx(getattr(expected_box, bound), abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_spur_gear_teeth_parameters_get_their_own_profile():
+    handler = SpurGearHandler()
+
+    await handler.build(spur())
+    await handler.build(spur(teeth=30))
+    await handler.build(spur(pressure_angle=25))
+
+    assert len(gear_profiles) == 3
+
+
+@pytest.mark.asyncio
+async def test_spur_gear_hub_stands_on_the_gear():
+    handler = SpurGearHandler()
+
+    gear = (await handler.build(spur(hub_diameter=8.0, hub_length=3.0))).val()
+
+    assert gear.BoundingBox().zmax == pytest.approx(8.0)
+
+
+@pytest.mark.asyncio
+async def test_bevel_gears_of_other_bores_reuse_the_body():
+    handler = BevelGearHandler()
+    parameters = BevelGearParameters(
+        module=1.5, teeth=30, cone_angle=45.0, face_width=10.0, bore=0
+    )
+
+    solid = (await handler.build(parameters)).val()
+    bored = (await handler.build(parameters.model_copy(update={"bore": 5.0}))).val()
+
+    assert len(gear_profiles) == 1
+    assert bored.Volume() < solid.Volume()
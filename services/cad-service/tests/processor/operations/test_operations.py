@@ -0,0 +1,218 @@
+from unittest.mock import patch
+
+import pytest
+from cadquery import cq
+
+from processor import CADProcessor
+from processor.operations import (
+    ArrayHandler,
+    BooleanHandler,
+    FilletHandler,
+    MirrorHandler,
+    PatternHandler,
+    ShellHandler,
+)
+from processor.utils.booleans import fuse_multi
+from shared.models.base import (
+    ArrayParameters,
+    BooleanParameters,
+    CADConfiguration,
+    Export,
+    FilletParameters,
+    Operation,
+    OutputMode,
+    PatternParameters,
+    ShellParameters,
+)
+from shared.models.exceptions import ValidationError
+from shared.models.helpers import create_box
+
+
+def volume(obj: cq.Workplane) -> float:
+    return sum(val.Volume() for val in obj.vals())
+
+
+def cube(size: float, position=(0, 0, 0)) -> cq.Workplane:
+    return cq.Workplane("XY").box(size, size, size).translate(position)
+
+
+@pytest.mark.asyncio
+async def test_cut_removes_the_tool_and_consumes_it():
+    handler = BooleanHandler()
+    operation = Operation(
+        type="cut", targets=["a"], parameters=BooleanParameters(tool="b")
+    )
+    objects = {"a": cube(10), "b": cube(10, (5, 0, 0))}
+
+    result = await handler.apply(objects["a"], operation, objects)
+
+    assert volume(result) == pytest.approx(500)
+    assert handler.consumed(operation) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_cut_needs_a_known_tool():
+    operation = Operation(
+        type="cut", targets=["a"], parameters=BooleanParameters(tool="missing")
+    )
+
+    with pytest.raises(ValidationError):
+        await BooleanHandler().apply(cube(10), operation, {"a": cube(10)})
+
+
+@pytest.mark.asyncio
+async def test_fillet_runs_once_per_geometry_for_instances():
+    base = cube(10).val()
+    target = cq.Workplane("XY").newObject(
+        [base, base.moved(cq.Location(cq.Vector(20, 0, 0)))]
+    )
+    operation = Operation(
+        type="fillet", targets=["a"], parameters=FilletParameters(radius=1)
+    )
+
+    filleted = []
+    fillet = cq.Solid.fillet
+
+    def spy(shape, *args):
+        filleted.append(shape)
+        return fillet(shape, *args)
+
+    with patch.object(cq.Solid, "fillet", spy):
+        result = await FilletHandler().apply(target, operation, {})
+
+    assert len(filleted) == 1
+    first, second = result.vals()
+    assert volume(result) < 2000
+    assert second.wrapped.IsPartner(first.wrapped)
+    assert second.Center().x == pytest.approx(first.Center().x + 20)
+
+
+@pytest.mark.asyncio
+async def test_shell_without_faces_is_closed_and_hollow():
+    operation = Operation(
+        type="shell", targets=["a"], parameters=ShellParameters(thickness=1)
+    )
+
+    result = await ShellHandler().apply(cube(10), operation, {})
+
+    assert volume(result) == pytest.approx(1000 - 8**3)
+
+
+@pytest.mark.asyncio
+async def test_mirror_keeps_the_original_by_default():
+    operation = Operation(type="mirror", targets=["a"])
+
+    result = await MirrorHandler().apply(cube(2, (5, 0, 0)), operation, {})
+
+    assert sorted(val.Center().x for val in result.vals()) == pytest.approx([-5, 5])
+
+
+@pytest.mark.asyncio
+async def test_array_copies_share_the_original_geometry():
+    operation = Operation(
+        type="array",
+        targets=["a"],
+        parameters=ArrayParameters(count=4, spacing=[0, 5, 0]),
+    )
+    target = cube(2)
+
+    copies = (await ArrayHandler().apply(target, operation, {})).vals()
+
+    assert copies[0] is target.val()
+    assert [copy.Center().y for copy in copies] == pytest.approx([0, 5, 10, 15])
+    assert all(copy.wrapped.IsPartner(target.val().wrapped) for copy in copies)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "parameters, centers",
+    [
+        (
+            PatternParameters(pattern_type="linear", count=3, spacing=10, angle=90),
+            [(10, 0), (10, 10), (10, 20)],
+        ),
+        (
+            PatternParameters(pattern_type="rectangular", count=2, spacing=5),
+            [(10, 0), (15, 0), (10, 5), (15, 5)],
+        ),
+        (
+            PatternParameters(pattern_type="circular", count=4),
+            [(10, 0), (0, 10), (-10, 0), (0, -10)],
+        ),
+        (
+            PatternParameters(
+                pattern_type="circular", count=3, angle=180, center=[10, 10, 0]
+            ),
+            [(10, 0), (20, 10), (10, 20)],
+        ),
+    ],
+)
+async def test_pattern_placements(parameters, centers):
+    operation = Operation(type="pattern", targets=["a"], parameters=parameters)
+
+    result = await PatternHandler().apply(cube(2, (10, 0, 0)), operation, {})
+
+    placed = [(val.Center().x, val.Center().y) for val in result.vals()]
+    assert placed == [pytest.approx(center, abs=1e-9) for center in centers]
+
+
+@pytest.mark.asyncio
+async def test_linear_pattern_needs_a_spacing():
+    operation = Operation(
+        type="pattern",
+        targets=["a"],
+        parameters=PatternParameters(pattern_type="linear", count=3),
+    )
+
+    with pytest.raises(ValidationError):
+        await PatternHandler().apply(cube(2), operation, {})
+
+
+def heat_sink(count: int, mode: OutputMode = OutputMode.FUSED) -> CADConfiguration:
+    base = create_box(count * 2, 10, 2, True, id="base", position=[count, 0, 1])
+    fin = create_box(1, 10, 10, True, id="fin", position=[1, 0, 6])
+    fins = Operation(
+        type="array",
+        targets=["fin"],
+        parameters=ArrayParameters(count=count, spacing=[2, 0, 0]),
+    )
+    return CADConfiguration(
+        shapes=[base, fin], operations=[fins], export=Export(mode=mode)
+    )
+
+
+@pytest.mark.asyncio
+async def test_array_is_fused_with_one_boolean():
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    processor.union_strategy = "multi"
+
+    with patch("processor.utils.booleans.fuse_multi", wraps=fuse_multi) as fuse:
+        model = await processor.process_configuration(heat_sink(20))
+
+    fuse.assert_called_once()
+    assert len(fuse.call_args.args[0]) == 21
+    assert len(model.vals()) == 1
+    assert model.val().Volume() == pytest.approx(40 * 10 * 2 + 20 * 10 * 9)
+
+
+@pytest.mark.asyncio
+async def test_assembly_keeps_array_copies_as_instances():
+    processor = CADProcessor(cache=False, execution_mode="inline")
+
+    parts = (await processor.process_configuration(heat_sink(20, OutputMode.ASSEMBLY))).vals()
+
+    fins = parts[1:]
+    assert len(fins) == 20
+    assert all(fin.wrapped.IsPartner(fins[0].wrapped) for fin in fins)
+
+
+@pytest.mark.asyncio
+async def test_operations_need_known_targets():
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    config = CADConfiguration(
+        shapes=[create_box(10, 10, 10, True, id="a")],
+        operations=[Operation(type="fillet", targets=["b"], parameters=FilletParameters(radius=1))],
+    )
+
+    with pytest.raises(ValidationError):
+        await processor.process_configuration(config)
@@ -0,0 +1,114 @@
+import pytest
+from cadquery import cq
+
+from processor.shapes.box import BoxHandler
+from shared.models.base import BoxParameters
+from shared.models.features import CircularHole
+
+
+def assert_holes_placed(result, holes, length, width, height):
+    """Each hole has a cylinder at its position, measured from the centre of the uncut face"""
+    blank = cq.Workplane("XY").box(length, width, height)
+    cylinders = [
+        (face.Center(), max(edge.radius() for edge in face.Edges() if edge.geomType() == "CIRCLE"))
+        for face in result.faces("%CYLINDER").vals()
+    ]
+    assert len(cylinders) == len(holes)
+
+    for hole in holes:
+        plane = blank.faces(hole.face).workplane(centerOption="CenterOfMass").plane
+        placed = [
+            (plane.toLocalCoords(centre).x, plane.toLocalCoords(centre).y)
+            for centre, radius in cylinders
+            if radius == pytest.approx(hole.diameter / 2)
+        ]
+        assert any(
+            position == pytest.approx(hole.position, abs=1e-6) for position in placed
+        ), f"no {hole.diameter} hole at {hole.position} on {hole.face}, found {placed}"
+
+
+@pytest.mark.asyncio
+async def test_corner_holes_are_placed_from_the_face_centre():
+    holes = [
+        CircularHole.create(
+            position=CircularHole.get_corner_offset_position((100, 50), 10, i),
+            diameter=5,
+        )
+        for i in range(4)
+    ]
+    params = BoxParameters(length=100, width=50, height=10, centered=True, features=holes)
+
+    result = await BoxHandler().build(params)
+
+    assert_holes_placed(result, holes, 100, 50, 10)
+
+
+@pytest.mark.asyncio
+async def test_perforated_panel_is_cut_in_one_batch(monkeypatch):
+    holes = [
+        CircularHole(position=(x * 10 - 45, y * 10 - 15), diameter=4)
+        for x in range(10)
+        for y in range(4)
+    ]
+    params = BoxParameters(length=100, width=40, height=2, centered=True, features=holes)
+
+    calls = []
+    original_hole = cq.Workplane.hole
+
+    def counting_hole(self, *args, **kwargs):
+        calls.append(len(self.vals()))
+        return original_hole(self, *args, **kwargs)
+
+    monkeypatch.setattr(cq.Workplane, "hole", counting_hole)
+
+    result = await BoxHandler().build(params)
+
+    assert calls == [40]
+    assert len(result.faces("%CYLINDER").vals()) == 40
+
+
+def test_holes_are_grouped_by_face_and_size():
+    features = [
+        CircularHole(position=(0, 0), diameter=5),
+        CircularHole(position=(10, 0), diameter=5),
+        CircularHole(position=(0, 0), diameter=8),
+        CircularHole(position=(0, 0), diameter=5, face="<Z"),
+    ]
+
+    groups = BoxHandler._group_holes(features)
+
+    assert [len(holes) for holes in groups.values()] == [2, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_mixed_holes_on_several_faces_keep_their_positions(monkeypatch):
+    # Interleaved so each group is gathered from across the list
+    holes = [
+        CircularHole(position=(-30, -15), diameter=5),
+        CircularHole(position=(-40, 0), diameter=6, depth=4, face="<Z"),
+        CircularHole(position=(-30, 15), diameter=8, depth=6),
+        CircularHole(position=(15, 0), diameter=4, depth=10, face=">X"),
+        CircularHole(position=(30, -15), diameter=5),
+        CircularHole(position=(0, 20), diameter=3, depth=8, face="<Z"),
+        CircularHole(position=(0, 0), diameter=5, depth=6),
+        CircularHole(position=(40, 0), diameter=6, depth=4, face="<Z"),
+        CircularHole(position=(30, 15), diameter=8, depth=6),
+        CircularHole(position=(-15, 0), diameter=4, depth=10, face=">X"),
+        CircularHole(position=(0, -20), diameter=3, depth=8, face="<Z"),
+        CircularHole(position=(0, 0), diameter=4, depth=10, face="<X"),
+    ]
+    params = BoxParameters(length=100, width=60, height=20, centered=True, features=holes)
+
+    calls = []
+    original_hole = cq.Workplane.hole
+
+    def counting_hole(self, *args, **kwargs):
+        calls.append(len(self.vals()))
+        return original_hole(self, *args, **kwargs)
+
+    monkeypatch.setattr(cq.Workplane, "hole", counting_hole)
+
+    result = await BoxHandler().build(params)
+
+    assert sorted(calls) == [1, 1, 2, 2, 2, 2, 2]
+    assert_holes_placed(result, holes, 100, 60, 20)
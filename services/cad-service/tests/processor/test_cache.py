@@ -0,0 +1,76 @@
+import os
+from unittest.mock import patch
+
+from processor.cache import LRUCache, ExportCache
+
+KEY_A = "a" * 64
+KEY_B = "b" * 64
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_items=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(max_items=2)
+
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_export_cache_evicts_oldest_files_over_budget(tmp_path):
+    cache = ExportCache(str(tmp_path), max_bytes=150)
+
+    old_path = cache.path_for(KEY_A, "gltf")
+    with open(old_path, "wb") as f:
+        f.write(b"0" * 100)
+    os.utime(old_path, (1, 1))
+    cache.register(old_path)
+
+    new_path = cache.path_for(KEY_B, "gltf")
+    with open(new_path, "wb") as f:
+        f.write(b"0" * 100)
+    cache.register(new_path)
+
+    assert cache.get(KEY_A, "gltf") is None
+    assert cache.get(KEY_B, "gltf") == new_path
+
+
+def test_export_cache_ignores_unrelated_files(tmp_path):
+    cache = ExportCache(str(tmp_path), max_bytes=0)
+
+    unrelated = tmp_path / "logo.png"
+    unrelated.write_bytes(b"0" * 100)
+    cache.evict()
+
+    assert unrelated.exists()
+
+
+def test_export_cache_only_scans_when_over_budget(tmp_path):
+    cache = ExportCache(str(tmp_path), max_bytes=1000)
+
+    with patch.object(cache, "_scan", wraps=cache._scan) as scan:
+        for key in (KEY_A, KEY_B):
+            path = cache.path_for(key, "gltf")
+            with open(path, "wb") as f:
+                f.write(b"0" * 100)
+            cache.register(path)
+
+    # One scan to learn the starting size, then a running total
+    assert scan.call_count == 1
@@ -0,0 +1,133 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+from cadquery import cq
+
+from processor import CADProcessor
+from processor.utils.booleans import fuse_all
+from shared.models.base import CADConfiguration, Export, OutputMode
+from shared.models.exceptions import ExportError
+from shared.models.helpers import create_box
+
+
+@pytest.mark.asyncio
+async def test_identical_shapes_are_built_once():
+    processor = CADProcessor(cache=True, execution_mode="inline")
+    handler = processor.shape_handlers["box"]
+
+    config = CADConfiguration(
+        shapes=[
+            create_box(10, 10, 10, centered=True, features=[], id="a"),
+            create_box(10, 10, 10, centered=True, features=[], id="b", position=[20, 0, 0]),
+        ]
+    )
+
+    with patch.object(handler, "build", wraps=handler.build) as build:
+        result = await processor.process_configuration(config)
+
+    assert build.call_count == 1
+    assert result.val().Volume() == pytest.approx(2000)
+
+
+@pytest.mark.asyncio
+async def test_shapes_are_rebuilt_without_cache():
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    handler = processor.shape_handlers["box"]
+
+    config = CADConfiguration(
+        shapes=[
+            create_box(10, 10, 10, centered=True, features=[], id="a"),
+            create_box(10, 10, 10, centered=True, features=[], id="b", position=[20, 0, 0]),
+        ]
+    )
+
+    with patch.object(handler, "build", wraps=handler.build) as build:
+        await processor.process_configuration(config)
+
+    assert build.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_levels_of_detail_are_exported_coarse_first(tmp_path, monkeypatch):
+    monkeypatch.setattr("processor.core.settings.MODEL_EXPORT_PATH", str(tmp_path))
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    config = CADConfiguration(
+        shapes=[create_box(10, 10, 10, centered=True, features=[], id="a")]
+    )
+
+    with patch.object(processor, "_process_components", wraps=processor._process_components) as build:
+        events = [
+            event
+            async for event in processor.generate_lods(config, ["fine", "preview"])
+        ]
+
+    assert build.call_count == 1
+    assert [event["lod"] for event in events[:2]] == ["preview", "fine"]
+    assert events[-1]["levels"] == events[:2]
+    assert all((tmp_path / event["model_path"]).exists() for event in events[:2])
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_build(tmp_path, monkeypatch):
+    monkeypatch.setattr("processor.core.settings.MODEL_EXPORT_PATH", str(tmp_path))
+    processor = CADProcessor(cache=False, execution_mode="inline", coalesce=True)
+    configs = [
+        CADConfiguration(
+            shapes=[create_box(10, 10, 10, centered=True, features=[], id=shape_id)]
+        )
+        for shape_id in ("a", "b", "c")
+    ]
+
+    with patch.object(processor, "_process_components", wraps=processor._process_components) as build:
+        paths = await asyncio.gather(
+            *(processor.generate(config, "gltf") for config in configs)
+        )
+
+    assert build.call_count == 1
+    assert len(set(paths)) == 1
+    assert processor.flights.stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_assembly_mode_keeps_identical_parts_as_instances():
+    processor = CADProcessor(cache=True, execution_mode="inline")
+    shapes = [
+        create_box(10, 10, 10, centered=True, features=[], id=f"b{i}", position=[i * 20, 0, 0])
+        for i in range(3)
+    ]
+    fused = CADConfiguration(shapes=shapes)
+    assembly = fused.model_copy(update={"export": Export(mode=OutputMode.ASSEMBLY)})
+
+    with patch("processor.core.fuse_all", wraps=fuse_all) as fuse:
+        parts = (await processor.process_configuration(assembly)).vals()
+
+    fuse.assert_not_called()
+    assert len(parts) == 3
+    assert all(part.wrapped.IsPartner(parts[0].wrapped) for part in parts)
+    assert len((await processor.process_configuration(fused)).vals()) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_export_leaves_nothing_at_the_cached_path(tmp_path, monkeypatch):
+    monkeypatch.setattr("processor.core.settings.MODEL_EXPORT_PATH", str(tmp_path))
+    processor = CADProcessor(cache=True, execution_mode="inline")
+    processor.cache.exports.directory = str(tmp_path)
+    model = cq.Workplane("XY").box(1, 1, 1)
+    exporter = processor.get_exporter("stl")
+
+    async def partial_export(target, output_path, **kwargs):
+        output_path.write_bytes(b"solid half")
+        raise RuntimeError("worker died")
+
+    with patch.object(exporter, "export", side_effect=partial_export):
+        with pytest.raises(ExportError):
+            await processor.export_model(model, "stl", cache_key="c" * 64)
+
+    assert list(tmp_path.iterdir()) == []
+
+    path = await processor.export_model(model, "stl", cache_key="c" * 64)
+    assert path == processor.cache.export_path("c" * 64, "stl")
+    assert os.path.getsize(path) > 0
+    assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(path)]
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+from cadquery import importers
+
+from processor import CADProcessor
+from processor.graph import OperationGraph
+from processor.utils.brep import brep_to_workplane
+from shared.models.base import (
+    ArrayParameters,
+    BooleanParameters,
+    CADConfiguration,
+    FilletParameters,
+    Operation,
+)
+from shared.models.exceptions import ValidationError
+from shared.models.helpers import create_box
+
+
+def box(id: str, x: float = 0, size: float = 10):
+    return create_box(size, size, size, True, id=id, position=[x, 0, 0])
+
+
+def cut(target: str, tool: str) -> Operation:
+    return Operation(type="cut", targets=[target], parameters=BooleanParameters(tool=tool))
+
+
+def two_branches() -> CADConfiguration:
+    """Two cut plates unioned together, plus a box nothing touches"""
+    return CADConfiguration(
+        shapes=[
+            box("a"), box("a_tool", 5, 4),
+            box("b", 8), box("b_tool", 13, 4),
+            box("loose", 50),
+        ],
+        operations=[
+            cut("a", "a_tool"),
+            cut("b", "b_tool"),
+            Operation(type="union", targets=["a", "b"]),
+        ],
+    )
+
+
+class ThreadExecutor:
+    """Runs worker tasks on threads, recording each one"""
+
+    max_workers = 4
+
+    def __init__(self):
+        self.tasks = []
+
+    async def run(self, fn, *args):
+        self.tasks.append(fn.__name__)
+        return await asyncio.to_thread(fn, *args)
+
+
+def test_graph_roots_and_branches():
+    graph = OperationGraph(two_branches())
+
+    assert [root.component for root in graph.trees()] == ["a"]
+    assert [root.component for root in graph.leaves()] == ["loose"]
+
+    union = graph.trees()[0]
+    assert [branch.operation.type for branch in union.branches()] == ["cut", "cut"]
+    assert [node.component for node in union.branches()[0].inputs] == ["a", "a_tool"]
+
+
+def test_subconfiguration_leaves_out_branches_built_elsewhere():
+    graph = OperationGraph(two_branches())
+    union = graph.trees()[0]
+
+    config = graph.subconfiguration([union], stop=frozenset(union.branches()))
+
+    assert config.shapes == []
+    assert [operation.type for operation in config.operations] == ["union"]
+
+    config = graph.subconfiguration([union.branches()[1]])
+    assert [shape.id for shape in config.shapes] == ["b", "b_tool"]
+    assert [operation.type for operation in config.operations] == ["cut"]
+
+
+def test_graph_rejects_unknown_components():
+    config = CADConfiguration(shapes=[box("a")], operations=[cut("a", "missing")])
+
+    with pytest.raises(ValidationError):
+        OperationGraph(config)
+
+
+@pytest.mark.asyncio
+async def test_pool_builds_independent_branches_apart():
+    inline = CADProcessor(cache=False, execution_mode="inline")
+    expected = (await inline.process_configuration(two_branches())).val().Volume()
+
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    processor.executor = ThreadExecutor()
+    model = brep_to_workplane(await processor._build_in_pool(two_branches()))
+
+    assert sorted(processor.executor.tasks) == [
+        "build_brep", "build_parts_brep", "build_parts_brep", "build_parts_brep", "fuse_breps",
+    ]
+    assert len(model.vals()) == 1
+    assert model.val().Volume() == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_pool_builds_a_single_chain_in_one_worker():
+    config = CADConfiguration(
+        shapes=[box("fin", size=2)],
+        operations=[
+            Operation(
+                type="array",
+                targets=["fin"],
+                parameters=ArrayParameters(count=3, spacing=[5, 0, 0]),
+            ),
+            Operation(type="fillet", targets=["fin"], parameters=FilletParameters(radius=0.2)),
+        ],
+    )
+
+    processor = CADProcessor(cache=False, execution_mode="inline")
+    processor.executor = ThreadExecutor()
+    model = brep_to_workplane(await processor._build_in_pool(config))
+
+    assert processor.executor.tasks == ["build_brep"]
+    assert len(model.val().Solids()) == 3
+
+
+@pytest.mark.asyncio
+async def test_process_mode_generates_large_unions_across_workers(tmp_path, monkeypatch):
+    # Spawned workers read their settings from the environment
+    monkeypatch.setenv("MODEL_EXPORT_PATH", str(tmp_path))
+    monkeypatch.setenv("GEOMETRY_CACHE_ENABLED", "false")
+    monkeypatch.setattr("processor.core.settings.MODEL_EXPORT_PATH", str(tmp_path))
+    monkeypatch.setattr("processor.core.settings.CAD_POOL_WORKERS", 2)
+    monkeypatch.setattr("processor.core.settings.CAD_PARALLEL_UNION_THRESHOLD", 64)
+
+    config = CADConfiguration(shapes=[box(f"b{i}", i * 8) for i in range(70)])
+    processor = CADProcessor(cache=False, execution_mode="process", coalesce=False)
+    try:
+        assert processor.executor.max_workers == 2
+        assert processor._plan_pool_build(config) is not None
+
+        path = await processor.generate(config, "step")
+        model = importers.importStep(path)
+    finally:
+        processor.shutdown()
+
+    assert len(model.val().Solids()) == 1
+    assert model.val().Volume() == pytest.approx(1000 + 69 * 800)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from cadquery import cq
+
+from processor.placement import place, placement_matrix, rotation_matrix
+
+
+def bounds(obj: cq.Workplane) -> tuple:
+    box = obj.val().BoundingBox()
+    return tuple(round(v, 6) for v in (box.xmin, box.xmax, box.ymin, box.ymax, box.zmin, box.zmax))
+
+
+@pytest.fixture
+def bar() -> cq.Workplane:
+    """A 10 x 2 x 1 bar with a corner on the origin"""
+    return cq.Workplane("XY").box(10, 2, 1, centered=False)
+
+
+def test_identity_placement_returns_the_shape(bar):
+    assert place(bar, [0, 0, 0], [0, 0, 0]) is bar
+
+
+def test_rotation_is_right_handed_about_each_axis():
+    x, y, z = np.eye(3)
+
+    assert rotation_matrix([90, 0, 0]) @ y == pytest.approx(z)
+    assert rotation_matrix([0, 90, 0]) @ z == pytest.approx(x)
+    assert rotation_matrix([0, 0, 90]) @ x == pytest.approx(y)
+
+
+def test_rotations_apply_x_then_y_then_z_about_fixed_axes(bar):
+    # X by 90 stands the bar's width up along Z, then Y by 90 lays its length down along -Z
+    assert bounds(place(bar, [0, 0, 0], [90, 0, 0])) == (0, 10, -1, 0, 0, 2)
+    assert bounds(place(bar, [0, 0, 0], [90, 90, 0])) == (0, 2, -1, 0, -10, 0)
+    assert rotation_matrix([30, 45, 60]) == pytest.approx(
+        rotation_matrix([0, 0, 60]) @ rotation_matrix([0, 45, 0]) @ rotation_matrix([30, 0, 0])
+    )
+
+
+def test_shape_rotates_about_its_own_origin_before_moving(bar):
+    # Rotating first keeps the bar next to its new position rather than swinging it about the world origin
+    assert bounds(place(bar, [100, 0, 0], [0, 0, 90])) == (98, 100, 0, 10, 0, 1)
+    assert placement_matrix([100, 0, 0], [0, 0, 90]) @ [10, 0, 0, 1] == pytest.approx([100, 10, 0, 1])
+
+
+def test_placement_shares_geometry_and_leaves_the_original(bar):
+    placed = place(bar, [5, 5, 5], [0, 0, 45])
+
+    assert bounds(bar) == (0, 10, 0, 2, 0, 1)
+    assert placed.val().wrapped.IsPartner(bar.val().wrapped)
+    assert placed.val().Volume() == pytest.approx(20)
@@ -0,0 +1,27 @@
+import pytest
+from cadquery import cq
+
+from processor.utils.booleans import UNION_STRATEGIES, fuse_all
+
+
+def _row_of_boxes(count: int) -> list[cq.Workplane]:
+    # 10mm cubes overlapping their neighbours by 5mm
+    return [cq.Workplane("XY").box(10, 10, 10).translate((i * 5, 0, 0)) for i in range(count)]
+
+
+@pytest.mark.parametrize("strategy", UNION_STRATEGIES)
+def test_strategies_produce_the_same_solid(strategy):
+    result = fuse_all(_row_of_boxes(7), strategy)
+
+    assert len(result.solids().vals()) == 1
+    assert result.val().Volume() == pytest.approx(40 * 10 * 10)
+
+
+def test_single_shape_is_returned_unchanged():
+    box = cq.Workplane("XY").box(1, 1, 1)
+    assert fuse_all([box]) is box
+
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError):
+        fuse_all(_row_of_boxes(2), "random")
@@ -0,0 +1,28 @@
+import pytest
+from cadquery import cq
+
+from processor.utils.brep import workplane_to_brep, brep_to_workplane
+
+
+def test_brep_round_trip_preserves_geometry():
+    original = cq.Workplane("XY").box(10, 20, 30)
+
+    restored = brep_to_workplane(workplane_to_brep(original))
+
+    assert restored.val().Volume() == pytest.approx(6000)
+
+
+def test_empty_workplane_round_trip():
+    assert workplane_to_brep(cq.Workplane("XY")) == b""
+    assert brep_to_workplane(b"").vals() == []
+
+
+def test_round_trip_keeps_separate_shapes_and_shared_geometry():
+    solid = cq.Workplane("XY").box(1, 2, 3).val()
+    original = cq.Workplane("XY").newObject([solid, solid.moved(cq.Location((10, 0, 0)))])
+
+    restored = brep_to_workplane(workplane_to_brep(original)).vals()
+
+    assert len(restored) == 2
+    assert restored[0].wrapped.IsPartner(restored[1].wrapped)
+    assert restored[1].Center().x == pytest.approx(10)
@@ -0,0 +1,32 @@
+from processor.utils.hashing import geometry_key, export_key
+from shared.models.base import CADConfiguration, Export
+from shared.models.helpers import create_box
+
+
+def _config(shape_id: str, **kwargs) -> CADConfiguration:
+    return CADConfiguration(
+        shapes=[create_box(100, 50, 10, centered=True, features=[], id=shape_id)],
+        **kwargs,
+    )
+
+
+def test_geometry_key_ignores_shape_ids():
+    assert geometry_key(_config("first")) == geometry_key(_config("second"))
+
+
+def test_geometry_key_ignores_export_settings():
+    assert geometry_key(_config("a")) == geometry_key(
+        _config("a", export=Export(precision=0.5))
+    )
+
+
+def test_geometry_key_changes_with_parameters():
+    other = CADConfiguration(
+        shapes=[create_box(100, 50, 20, centered=True, features=[], id="a")]
+    )
+    assert geometry_key(_config("a")) != geometry_key(other)
+
+
+def test_export_key_depends_on_file_type():
+    config = _config("a")
+    assert export_key(config, "gltf") != export_key(config, "step")
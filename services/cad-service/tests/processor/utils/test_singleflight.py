@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from processor.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    calls = 0
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "model.gltf"
+
+    results = await asyncio.gather(
+        *(flights.do("export", "key", build) for _ in range(5))
+    )
+
+    assert results == ["model.gltf"] * 5
+    assert calls == 1
+    assert flights.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    flights = SingleFlight()
+
+    async def build(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        flights.do("export", "a", lambda: build("a")),
+        flights.do("export", "b", lambda: build("b")),
+        flights.do("bytes", "a", lambda: build("bytes")),
+    )
+
+    assert results == ["a", "b", "bytes"]
+    assert flights.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_are_not_remembered():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad geometry")
+
+    results = await asyncio.gather(
+        flights.do("export", "key", fail),
+        flights.do("export", "key", fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await flights.do("export", "key", succeed) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_run():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def build():
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flights.do("export", "key", build))
+    second = asyncio.create_task(flights.do("export", "key", build))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
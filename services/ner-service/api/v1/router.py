@@ -1,17 +1,29 @@
 import logging
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 
 from core.deps import get_ner_model
+from models.executor import InferenceSaturatedError
 from models.spacy_ner import SpacyNERModel
-from shared.models.requests import NERRequest
-from shared.models.responses import NERResponse
+from shared.models.requests import NERRequest, NERBatchRequest
+from shared.models.responses import NERResponse, NERBatchResponse
 
 api_router = APIRouter()
 
 logger = logging.getLogger(__name__)
 
 
+def _saturated_response(error: InferenceSaturatedError, body) -> JSONResponse:
+    """503 response asking the client to retry once the inference queue drains"""
+    logger.warning(str(error))
+    return JSONResponse(
+        status_code=503,
+        content=body.model_dump(),
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @api_router.post("/extract")
 async def extract(
     request: NERRequest, model: SpacyNERModel = Depends(get_ner_model)
@@ -19,7 +31,7 @@ async def extract(
     """Extract and group named entities from the provided request."""
 
     try:
-        entities = model.predict(request.prompt)
+        entities = await model.apredict(request.prompt)
 
         logger.debug(f"Extracted entities: {entities}")
 
@@ -27,6 +39,36 @@ async def extract(
             return NERResponse(error="No entities found")
 
         return NERResponse(entities=entities, error=None)
+    except InferenceSaturatedError as e:
+        return _saturated_response(e, NERResponse(error=str(e)))
     except Exception as e:
         logger.error(f"Error extracting entities: {e}")
         return NERResponse(error=str(e))
+
+
+@api_router.post("/extract/batch")
+async def extract_batch(
+    request: NERBatchRequest, model: SpacyNERModel = Depends(get_ner_model)
+) -> NERBatchResponse:
+    """Extract named entities from many prompts in one pass, preserving their order."""
+
+    try:
+        results = await model.apredict_batch(request.prompts)
+
+        logger.debug(f"Extracted entities for {len(results)} prompts")
+
+        return NERBatchResponse(results=results, error=None)
+    except InferenceSaturatedError as e:
+        return _saturated_response(e, NERBatchResponse(error=str(e)))
+    except Exception as e:
+        logger.error(f"Error extracting entities: {e}")
+        return NERBatchResponse(error=str(e))
+
+
+@api_router.get("/cache/stats")
+async def cache_stats(model: SpacyNERModel = Depends(get_ner_model)) -> dict:
+    """Report size and hit rate of the prompt cache."""
+    if not model.cache:
+        return {"enabled": False}
+
+    return {"enabled": True, "model_version": model.model_version, **model.cache.stats()}
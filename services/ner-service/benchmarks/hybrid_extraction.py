@@ -0,0 +1,96 @@
+"""
+Compare model-only extraction with the hybrid rule + model mode.
+
+Runs every prompt of a labelled training set through SpacyNERModel.predict in
+both modes, reporting latency, how many prompts the rules answered on their own
+and entity-level precision/recall/F1 against the labels, e.g.
+
+    python -m benchmarks.hybrid_extraction --data training/data/latest.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from models.rules import RuleExtractor
+from models.spacy_ner import SpacyNERModel
+
+
+def load_examples(path: str) -> list[tuple[str, set[tuple[int, int, str]]]]:
+    """Prompts and their labelled (start, end, label) spans from a Label Studio export"""
+    with open(path, "r") as f:
+        labeled_data = json.load(f)
+
+    return [
+        (
+            item["value"],
+            {
+                (label["start"], label["end"], label["labels"][0])
+                for label in item["label"]
+            },
+        )
+        for item in labeled_data
+    ]
+
+
+def score(predicted: list[set], gold: list[set]) -> tuple[float, float, float]:
+    """Micro-averaged entity precision, recall and F1"""
+    tp = sum(len(p & g) for p, g in zip(predicted, gold))
+    fp = sum(len(p - g) for p, g in zip(predicted, gold))
+    fn = sum(len(g - p) for p, g in zip(predicted, gold))
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def run(model: SpacyNERModel, prompts: list[str], repeat: int):
+    """Predict every prompt, returning the spans and per-prompt latencies (ms)"""
+    latencies = []
+    spans = []
+    for _ in range(repeat):
+        spans = []
+        for prompt in prompts:
+            start = time.perf_counter()
+            entities = model.predict(prompt)
+            latencies.append((time.perf_counter() - start) * 1000)
+            spans.append({(e.start, e.end, e.label) for e in entities})
+    return spans, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data", default="training/data/latest.json")
+    parser.add_argument("--model", default="training/cad_ner_model")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    examples = load_examples(args.data)
+    prompts = [prompt for prompt, _ in examples]
+    gold = [spans for _, spans in examples]
+
+    rules = RuleExtractor()
+    complete = sum(rules.extract(prompt).complete for prompt in prompts)
+    print(f"{len(prompts)} prompts, {complete} ({complete / len(prompts):.1%}) fully parsed by rules")
+
+    print(f"{'mode':>8} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'total s':>10} "
+          f"{'P':>7} {'R':>7} {'F1':>7}")
+    for mode in ("model", "hybrid"):
+        model = SpacyNERModel(args.model, inference_mode="inline", extraction_mode=mode)
+        model.load_model()
+
+        spans, latencies = run(model, prompts, args.repeat)
+        precision, recall, f1 = score(spans, gold)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+
+        print(
+            f"{mode:>8} {statistics.mean(latencies):>10.3f} {statistics.median(latencies):>10.3f} "
+            f"{p95:>10.3f} {sum(latencies) / 1000 / args.repeat:>10.3f} "
+            f"{precision:>7.3f} {recall:>7.3f} {f1:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
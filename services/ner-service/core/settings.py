@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -19,6 +21,65 @@ class Settings(BaseSettings):
 
     NER_MODEL_PATH: str = Field(default="training/cad_ner_model")
 
+    NER_PIPELINE_TRIM: Literal["none", "disable", "exclude"] = Field(
+        default="exclude",
+        description="Exclude (never load) or disable pipeline components NER does not need",
+    )
+
+    NER_EXTRACTION_MODE: Literal["model", "hybrid"] = Field(
+        default="model",
+        description="Use the model alone, or tag formulaic dimensions, units, counts and "
+        "gear teeth with compiled rules and run the model only when they fall short",
+    )
+
+    NER_BATCH_SIZE: int = Field(
+        default=64, description="Number of prompts spaCy processes per nlp.pipe batch"
+    )
+    NER_N_PROCESS: int = Field(
+        default=1, description="Worker processes used by nlp.pipe for batch extraction"
+    )
+
+    NER_INFERENCE_MODE: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Run inference in a thread pool, or a process pool with one model copy per worker",
+    )
+    NER_INFERENCE_WORKERS: Optional[int] = Field(
+        default=None, description="Inference workers, defaults to the number of CPUs"
+    )
+    NER_INFERENCE_MAX_PENDING: int = Field(
+        default=256,
+        description="Requests admitted for inference before new ones are rejected with 503",
+    )
+    NER_INFERENCE_RETRY_AFTER: int = Field(
+        default=1, description="Retry-After seconds sent when inference is saturated"
+    )
+
+    NER_MICROBATCH_ENABLED: bool = Field(
+        default=True,
+        description="Coalesce concurrent /extract requests into nlp.pipe batches",
+    )
+    NER_MICROBATCH_MAX_SIZE: int = Field(
+        default=32, description="Maximum prompts in one coalesced micro-batch"
+    )
+    NER_MICROBATCH_MAX_WAIT_MS: float = Field(
+        default=5.0,
+        description="Longest a micro-batch waits to fill under concurrent load, in milliseconds",
+    )
+
+    NER_CACHE_ENABLED: bool = Field(
+        default=True, description="Cache extracted entities per normalised prompt"
+    )
+    NER_CACHE_SIZE: int = Field(
+        default=4096, description="Maximum prompts held in the local prompt cache"
+    )
+    NER_CACHE_TTL: float = Field(
+        default=3600, description="Seconds a cached prompt result stays valid"
+    )
+    NER_CACHE_STORE_URL: Optional[str] = Field(
+        default=None,
+        description="Shared prompt cache store (memory:// or redis://), local only when unset",
+    )
+
     class Config:
         """Configuration for Pydantic settings."""
 
@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 from api.v1.router import api_router
 from core.deps import get_ner_model
 from core.settings import settings
-from shared.utils.monitoring import create_monitored_app
+from shared.utils.monitoring import MonitoringSetup, create_monitored_app
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -22,10 +22,16 @@ async def lifespan(_):
     yield
 
     logger.info("Shutting down NER service...")
+    await model.close()
 
 
 app = create_monitored_app(service_name="ner-service", lifespan=lifespan)
 
+# Request and prompt cache metrics on /metrics, when ENABLE_METRICS is set
+monitoring = MonitoringSetup("ner-service")
+monitoring.setup_prometheus(app)
+monitoring.instrumentator.expose(app, include_in_schema=False)
+
 app.include_router(api_router, prefix="/api/v1", tags=["NER Service"])
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from shared.models.misc import Entity
+
+logger = logging.getLogger(__name__)
+
+BatchRunner = Callable[[list[str]], Awaitable[list[list[Entity]]]]
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-prompt predictions into nlp.pipe batches.
+
+    Callers await submit() and get back their own entities. A single consumer task
+    drains the queue and dispatches up to max_concurrency batches at once: requests
+    that arrive while every slot is busy form the next batch, and once concurrent
+    traffic has been seen the consumer also waits up to max_wait_ms for a batch to
+    fill. A lone request on an idle service is dispatched immediately, so
+    single-request latency is unchanged.
+    """
+
+    def __init__(
+        self,
+        run_batch: BatchRunner,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrency: int = 1,
+    ):
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatches: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._concurrent = False
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._consumer and not self._consumer.done():
+            return
+
+        # The queue and consumer belong to one event loop, rebuild them if the loop changes
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._consumer = loop.create_task(self._consume())
+
+    async def submit(self, prompt: str) -> list[Entity]:
+        """Queue a prompt for the next batch and wait for its entities"""
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future]]:
+        batch = [await self._queue.get()]
+
+        # Whatever queued up while the previous batch ran joins this one
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        if not self._concurrent and len(batch) == 1:
+            return batch
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _consume(self):
+        while True:
+            # Hold a slot before collecting so requests keep queueing while all are busy
+            await self._slots.acquire()
+            batch = await self._collect()
+            self._concurrent = len(batch) > 1 or not self._queue.empty()
+
+            # Callers that gave up (e.g. disconnected clients) are not worth predicting
+            batch = [(prompt, future) for prompt, future in batch if not future.done()]
+            if not batch:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]):
+        prompts = [prompt for prompt, _ in batch]
+        logger.debug(f"Dispatching micro-batch of {len(prompts)} prompts")
+
+        try:
+            results = await self.run_batch(prompts)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future), entities in zip(batch, results):
+            if not future.done():
+                future.set_result(entities)
+
+    async def close(self):
+        """Stop the consumer task and fail any requests still waiting"""
+        if self._consumer:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+        for task in list(self._dispatches):
+            task.cancel()
+
+        if self._queue:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from prometheus_client import Counter
+
+from shared.models.adapters import type_adapter
+from shared.models.misc import Entity
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter(
+    "ner_prompt_cache_requests_total",
+    "Prompt cache lookups by tier and result",
+    ["tier", "result"],
+)
+CACHE_EVICTIONS = Counter(
+    "ner_prompt_cache_evictions_total",
+    "Prompt cache entries dropped from the local tier",
+    ["reason"],
+)
+
+_CHARACTERS = re.compile(r"\s+|.", re.DOTALL)
+
+
+def align_prompt(prompt: str) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Normalise a prompt, returning the canonical text with, for each of its
+    characters, the span of the prompt it came from.
+
+    The canonical form is NFC unicode with runs of whitespace collapsed to one
+    space and trimmed. Each character is composed with the combining marks
+    after it on its own, so every output character maps back to one span.
+    """
+    pieces = []
+    for match in _CHARACTERS.finditer(prompt):
+        start, end = match.span()
+        if match.group().isspace():
+            pieces.append([" ", start, end])
+        elif unicodedata.combining(match.group()) and pieces and pieces[-1][0] != " ":
+            pieces[-1][0] += match.group()
+            pieces[-1][2] = end
+        else:
+            pieces.append([match.group(), start, end])
+
+    while pieces and pieces[0][0] == " ":
+        pieces.pop(0)
+    while pieces and pieces[-1][0] == " ":
+        pieces.pop()
+
+    text, spans = [], []
+    for piece, start, end in pieces:
+        piece = unicodedata.normalize("NFC", piece)
+        text.append(piece)
+        spans.extend([(start, end)] * len(piece))
+
+    return "".join(text), spans
+
+
+def normalise_prompt(prompt: str) -> str:
+    """Canonical form of a prompt: NFC unicode with runs of whitespace collapsed"""
+    return align_prompt(prompt)[0]
+
+
+def restore_offsets(
+    entities: list[Entity], prompt: str, spans: list[tuple[int, int]]
+) -> list[Entity]:
+    """Map entities found in a normalised prompt back onto the prompt as sent"""
+    restored = []
+    for entity in entities:
+        if entity.end <= entity.start or entity.end > len(spans):
+            restored.append(entity)
+            continue
+
+        start, end = spans[entity.start][0], spans[entity.end - 1][1]
+        restored.append(
+            entity.model_copy(update={"start": start, "end": end, "text": prompt[start:end]})
+        )
+
+    return restored
+
+
+def prompt_key(prompt: str, model_version: str) -> str:
+    """Cache key for a normalised prompt and the model version that produced its entities"""
+    return hashlib.sha256(f"{model_version}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+class CacheStore(ABC):
+    """Shared key/value store backing the prompt cache across replicas"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None when missing or expired"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float):
+        """Store a value that expires after ttl seconds"""
+        pass
+
+    async def close(self):
+        """Release any connections held by the store"""
+        pass
+
+
+class MemoryStore(CacheStore):
+    """In-process stand-in for a shared store, used for local runs and tests"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    async def set(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+
+class RedisStore(CacheStore):
+    """Redis backed shared store, requires the optional redis package"""
+
+    def __init__(self, url: str, prefix: str = "ner:prompt:"):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise ImportError(
+                "The redis package is required to use a redis:// prompt cache store"
+            ) from e
+
+        self.prefix = prefix
+        self._client = aioredis.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: float):
+        await self._client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def close(self):
+        await self._client.aclose()
+
+
+def create_store(url: Optional[str]) -> Optional[CacheStore]:
+    """Build the shared store for a URL (memory:// or redis://), or None when unset"""
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return MemoryStore()
+    if url.startswith(("redis://", "rediss://")):
+        return RedisStore(url)
+    raise ValueError(f"Unsupported prompt cache store {url}")
+
+
+class PromptCache:
+    """
+    LRU cache of extracted entities with a time to live, keyed on the normalised
+    prompt and the model version. A local tier is always consulted first; an
+    optional shared store lets replicas reuse each other's results.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 4096,
+        ttl: float = 3600,
+        store: Optional[CacheStore] = None,
+    ):
+        self.max_items = max_items
+        self.ttl = ttl
+        self.store = store
+        self._items: OrderedDict[str, tuple[float, list[Entity]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_local(self, key: str) -> Optional[list[Entity]]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, entities = item
+            if expires <= time.monotonic():
+                del self._items[key]
+                CACHE_EVICTIONS.labels(reason="expired").inc()
+                return None
+            self._items.move_to_end(key)
+            return entities
+
+    def _put_local(self, key: str, entities: list[Entity]):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, entities)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+                CACHE_EVICTIONS.labels(reason="size").inc()
+
+    def _record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    async def get(self, key: str) -> Optional[list[Entity]]:
+        """Return cached entities for a key, checking the local tier then the shared store"""
+        entities = self._get_local(key)
+        CACHE_REQUESTS.labels(
+            tier="local", result="hit" if entities is not None else "miss"
+        ).inc()
+
+        if entities is None and self.store:
+            try:
+                value = await self.store.get(key)
+            except Exception as e:
+                logger.warning(f"Shared prompt cache lookup failed: {e}")
+                value = None
+
+            CACHE_REQUESTS.labels(
+                tier="shared", result="hit" if value is not None else "miss"
+            ).inc()
+            if value is not None:
+                entities = type_adapter(list[Entity]).validate_json(value)
+                self._put_local(key, entities)
+
+        self._record(entities is not None)
+        return entities
+
+    async def put(self, key: str, entities: list[Entity]):
+        """Store entities in the local tier and the shared store"""
+        self._put_local(key, entities)
+
+        if self.store:
+            value = type_adapter(list[Entity]).dump_json(entities).decode("utf-8")
+            try:
+                await self.store.set(key, value, self.ttl)
+            except Exception as e:
+                logger.warning(f"Shared prompt cache write failed: {e}")
+
+    def clear(self):
+        """Drop every entry from the local tier"""
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        """Current size and hit rate of the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "items": len(self._items),
+                "max_items": self.max_items,
+                "ttl": self.ttl,
+                "shared_store": type(self.store).__name__ if self.store else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    async def close(self):
+        """Release the shared store"""
+        if self.store:
+            await self.store.close()
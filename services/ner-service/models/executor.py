@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from shared.models.misc import Entity
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_MODES = ("thread", "process")
+
+# Model owned by each worker process, loaded by the pool initialiser
+_worker_model = None
+
+
+def _init_worker(model_path: str):
+    """Load a private copy of the model in a worker process"""
+    global _worker_model
+    from models.spacy_ner import SpacyNERModel
+
+    _worker_model = SpacyNERModel(model_path, inference_mode="inline")
+    _worker_model.load_model()
+
+
+def _predict_batch_in_worker(prompts: list[str]) -> list[list[Entity]]:
+    """Worker task: run a batch of prompts through the worker's model"""
+    return _worker_model.predict_batch(prompts)
+
+
+class InferenceSaturatedError(Exception):
+    """Raised when the inference queue is full and the request should be retried later"""
+
+    def __init__(self, pending: int, retry_after: int):
+        self.pending = pending
+        self.retry_after = retry_after
+        super().__init__(
+            f"Inference queue is full ({pending} requests pending), retry in {retry_after}s"
+        )
+
+
+class InferenceExecutor:
+    """Runs spaCy inference off the event loop with a bounded number of pending requests"""
+
+    def __init__(
+        self,
+        mode: str,
+        model_path: str,
+        predict_batch: Callable[[list[str]], list[list[Entity]]],
+        max_workers: Optional[int] = None,
+        max_pending: int = 256,
+        retry_after: int = 1,
+    ):
+        if mode not in INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        if mode == "process":
+            # Each worker loads its own copy of the model, so CPU bound inference
+            # scales with cores instead of contending for one interpreter's GIL
+            self._pool: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(model_path,),
+            )
+            self._task = _predict_batch_in_worker
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ner-inference"
+            )
+            self._task = predict_batch
+
+        logger.info(
+            f"Inference executor created (mode: {mode}, workers: {self.max_workers}, "
+            f"max pending: {max_pending})"
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of requests admitted and not yet finished"""
+        return self._pending
+
+    @contextmanager
+    def reserve(self):
+        """Admit one request, raising InferenceSaturatedError when the queue is full"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise InferenceSaturatedError(self._pending, self.retry_after)
+            self._pending += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def run(self, prompts: list[str]) -> list[list[Entity]]:
+        """Run a batch of prompts in the pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._task, prompts)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the inference workers"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Inference executor shut down")
@@ -0,0 +1,95 @@
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+import spacy
+from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_TRIM_MODES = ("none", "disable", "exclude")
+
+# Components that produce or post-process doc.ents and must always run
+ENTITY_FACTORIES = {"ner", "beam_ner", "entity_ruler", "merge_entities"}
+
+# Shared embedding components that listener layers may refer to with upstream "*"
+EMBEDDING_FACTORIES = {"tok2vec", "transformer", "curated_transformer"}
+
+
+def _listener_upstreams(model_config: Any) -> set[str]:
+    """Names of the components that listener layers in a model config depend on"""
+    upstreams = set()
+    if isinstance(model_config, dict):
+        if "upstream" in model_config:
+            upstreams.add(model_config["upstream"])
+        for value in model_config.values():
+            upstreams |= _listener_upstreams(value)
+    return upstreams
+
+
+def required_components(config: dict) -> set[str]:
+    """
+    Pipeline components needed to produce entities: the entity components and any
+    embedding components their listeners depend on. The tokenizer is not a
+    pipeline component and is always kept.
+    """
+    components = config.get("components", {})
+    factories = {name: component.get("factory") for name, component in components.items()}
+
+    required = {name for name, factory in factories.items() if factory in ENTITY_FACTORIES}
+
+    for name in list(required):
+        for upstream in _listener_upstreams(components[name].get("model", {})):
+            if upstream == "*":
+                required |= {
+                    other
+                    for other, factory in factories.items()
+                    if factory in EMBEDDING_FACTORIES
+                }
+            else:
+                required.add(upstream)
+
+    return required
+
+
+def _config_path(model_path: str) -> Optional[Path]:
+    path = Path(model_path) / "config.cfg"
+    return path if path.exists() else None
+
+
+def load_ner_pipeline(model_path: str, trim: str = "exclude") -> tuple[Language, list[str]]:
+    """
+    Load a spaCy pipeline keeping only the components entity extraction needs.
+
+    With "exclude" the unused components are never loaded, with "disable" they are
+    loaded but skipped, and "none" loads the pipeline unchanged. Returns the
+    pipeline and the names of the components that were trimmed.
+    """
+    if trim not in PIPELINE_TRIM_MODES:
+        raise ValueError(f"Unknown pipeline trim mode {trim}")
+
+    if trim == "none":
+        return spacy.load(model_path), []
+
+    config_path = _config_path(model_path)
+    if config_path is None:
+        # Installed packages do not expose their config up front, so load and prune
+        nlp = spacy.load(model_path)
+        unused = [
+            name
+            for name in nlp.pipe_names
+            if name not in required_components(nlp.config)
+        ]
+        for name in unused:
+            if trim == "exclude":
+                nlp.remove_pipe(name)
+            else:
+                nlp.disable_pipe(name)
+        return nlp, unused
+
+    config = spacy.util.load_config(config_path)
+    required = required_components(config)
+    unused = [name for name in config["nlp"]["pipeline"] if name not in required]
+
+    logger.info(f"Trimming pipeline components {unused} ({trim})")
+    return spacy.load(model_path, **{trim: unused}), unused
@@ -0,0 +1,193 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from shared.models.misc import Entity
+
+# Words, numbers and single punctuation marks, with their character offsets
+TOKEN = re.compile(r"\d+(?:\.\d+)?|[^\W\d_]+|\S")
+NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+UNITS = {
+    "mm", "millimeter", "millimeters", "millimetre", "millimetres",
+    "cm", "centimeter", "centimeters", "centimetre", "centimetres",
+    "m", "meter", "meters", "metre", "metres",
+    "in", "inch", "inches",
+    "ft", "foot", "feet",
+}
+
+# Shape names the CAD mapper understands, longest first so "spur gear" beats "gear"
+SHAPES = [
+    ("spur", "gear"), ("bevel", "gear"),
+    ("box",), ("cube",), ("cylinder",), ("sphere",), ("cone",), ("torus",),
+    ("wedge",), ("plate",),
+]
+
+FEATURES = {"hole", "holes"}
+TEETH = {"teeth", "tooth"}
+DIAMETER = {"diameter", "dia", "diam"}
+CORNER = {"corner", "corners"}
+
+# Words that carry no entity of their own in a formulaic prompt
+FILLER = {
+    "create", "make", "generate", "design", "build", "draw", "model", "please",
+    "a", "an", "the", "with", "and", "of", "by", "x", "each", "from", "at", "in",
+    "on", "its", "all", "offset", "that", "is", "has", "having",
+    "width", "height", "length", "depth", "thickness", "radius", "size", "side",
+    "sides", "wide", "long", "tall", "high", "deep", "thick", "through",
+}
+
+# Words that may be left untagged in a prompt the rules fully understand
+DESCRIPTIVE = FILLER | DIAMETER | CORNER | TEETH
+
+KNOWN_WORDS = FILLER | FEATURES | TEETH | DIAMETER | CORNER | UNITS | {
+    word for shape in SHAPES for word in shape
+}
+
+
+@dataclass
+class RuleParse:
+    """Entities tagged by the rule layer and whether they account for the whole prompt"""
+
+    entities: list[Entity] = field(default_factory=list)
+    complete: bool = False
+
+
+@dataclass
+class _Token:
+    text: str
+    start: int
+    end: int
+
+    @property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @property
+    def is_number(self) -> bool:
+        return NUMBER.fullmatch(self.text) is not None
+
+    @property
+    def is_word(self) -> bool:
+        return self.text.isalpha()
+
+
+class RuleExtractor:
+    """
+    Compiled rule layer for formulaic prompts such as
+    "create a box 100mm x 50mm x 20mm with 4 holes 5mm diameter".
+
+    Tags shape types, dimensions, units, hole counts, diameters and corner offsets,
+    and gear teeth. A number is only tagged when every word around it is one the
+    rules understand, so anything unusual is left for the statistical model.
+    """
+
+    def extract(self, text: str) -> RuleParse:
+        tokens = [_Token(m.group(), m.start(), m.end()) for m in TOKEN.finditer(text)]
+        entities: list[Entity] = []
+        covered: set[int] = set()
+
+        def tag(first: int, last: int, label: str):
+            entities.append(
+                Entity(
+                    start=tokens[first].start,
+                    end=tokens[last].end,
+                    label=label,
+                    text=text[tokens[first].start : tokens[last].end],
+                )
+            )
+            covered.update(range(first, last + 1))
+
+        i = 0
+        while i < len(tokens):
+            shape = self._match_shape(tokens, i)
+            if shape:
+                tag(i, i + shape - 1, "SHAPE_TYPE")
+                i += shape
+                continue
+
+            if tokens[i].is_number:
+                i = self._tag_number(tokens, i, tag)
+                continue
+
+            if tokens[i].lower in FEATURES and i not in covered:
+                tag(i, i, "FEATURE")
+
+            i += 1
+
+        has_shape = any(entity.label == "SHAPE_TYPE" for entity in entities)
+        leftovers = [
+            token
+            for index, token in enumerate(tokens)
+            if index not in covered
+            and (token.is_number or (token.is_word and token.lower not in DESCRIPTIVE))
+        ]
+
+        entities.sort(key=lambda entity: entity.start)
+        return RuleParse(entities=entities, complete=has_shape and not leftovers)
+
+    @staticmethod
+    def _match_shape(tokens: list[_Token], i: int) -> int:
+        for shape in SHAPES:
+            words = [token.lower for token in tokens[i : i + len(shape)]]
+            if tuple(words) == shape:
+                return len(shape)
+        return 0
+
+    @staticmethod
+    def _word(tokens: list[_Token], i: int) -> Optional[str]:
+        if 0 <= i < len(tokens) and tokens[i].is_word:
+            return tokens[i].lower
+        return None
+
+    def _tag_number(self, tokens: list[_Token], i: int, tag) -> int:
+        """Tag the number at i (and a following unit), returning the next index"""
+        unit = self._word(tokens, i + 1) in UNITS
+        after = i + 2 if unit else i + 1
+
+        previous = self._word(tokens, i - 1)
+        following = self._word(tokens, after)
+        context = [word for word in (previous, following) if word]
+
+        # Leave numbers next to words we do not understand to the model
+        if any(word not in KNOWN_WORDS for word in context):
+            return i + 1
+
+        if not unit and following in TEETH:
+            tag(i, i, "GEAR_TEETH")
+            return after
+
+        if not unit and following in FEATURES:
+            tag(i, i, "FEATURE_COUNT")
+            tag(after, after, "FEATURE")
+            return after + 1
+
+        nearby = {
+            word
+            for word in (
+                self._word(tokens, j) for j in range(i - 3, after + 3) if j != i
+            )
+            if word
+        }
+        if unit and nearby & CORNER:
+            label = "HOLE_CORNER_OFFSET"
+        elif unit and (previous in DIAMETER or following in DIAMETER | FEATURES):
+            label = "HOLE_DIAMETER"
+        else:
+            label = "SHAPE_DIMENSION"
+
+        tag(i, i, label)
+        if unit:
+            tag(i + 1, i + 1, "UNIT")
+        return after
+
+
+def merge_entities(rule_entities: list[Entity], model_entities: list[Entity]) -> list[Entity]:
+    """Combine rule and model entities, keeping the rule entity wherever they overlap"""
+    merged = list(rule_entities)
+    for entity in model_entities:
+        if not any(
+            entity.start < rule.end and rule.start < entity.end for rule in rule_entities
+        ):
+            merged.append(entity)
+    return sorted(merged, key=lambda entity: entity.start)
@@ -1,22 +1,71 @@
 import logging
+from typing import Optional
 
-import spacy
+from spacy.tokens import Doc
 
+from core.settings import settings
+from models.batcher import MicroBatcher
+from models.cache import PromptCache, align_prompt, create_store, prompt_key, restore_offsets
+from models.executor import InferenceExecutor
+from models.pipeline import load_ner_pipeline
+from models.rules import RuleExtractor, merge_entities
 from shared.models.misc import Entity
 
 logger = logging.getLogger(__name__)
 
 
 class SpacyNERModel:
-    def __init__(self, model_path: str):
+    def __init__(
+        self,
+        model_path: str,
+        inference_mode: Optional[str] = None,
+        extraction_mode: Optional[str] = None,
+    ):
         self.model_path = model_path
         self.nlp = None
+        self.trimmed: list[str] = []
+        self.inference_mode = inference_mode or settings.NER_INFERENCE_MODE
+        self.executor = None
+        self.batcher = None
+        self.cache = None
+        self.extraction_mode = extraction_mode or settings.NER_EXTRACTION_MODE
+        self.rules = RuleExtractor() if self.extraction_mode == "hybrid" else None
+
+        # Inline models (used inside inference workers) predict on the calling thread
+        if self.inference_mode == "inline":
+            return
+
+        self.executor = InferenceExecutor(
+            self.inference_mode,
+            model_path,
+            self.predict_batch,
+            max_workers=settings.NER_INFERENCE_WORKERS,
+            max_pending=settings.NER_INFERENCE_MAX_PENDING,
+            retry_after=settings.NER_INFERENCE_RETRY_AFTER,
+        )
+
+        if settings.NER_MICROBATCH_ENABLED:
+            self.batcher = MicroBatcher(
+                self.executor.run,
+                max_batch_size=settings.NER_MICROBATCH_MAX_SIZE,
+                max_wait_ms=settings.NER_MICROBATCH_MAX_WAIT_MS,
+                max_concurrency=self.executor.max_workers,
+            )
+
+        if settings.NER_CACHE_ENABLED:
+            self.cache = PromptCache(
+                max_items=settings.NER_CACHE_SIZE,
+                ttl=settings.NER_CACHE_TTL,
+                store=create_store(settings.NER_CACHE_STORE_URL),
+            )
 
     def load_model(self):
         """Load the trained SpaCy model."""
         try:
             logger.info(f"Loading SpaCy model from {self.model_path}")
-            self.nlp = spacy.load(self.model_path)
+            self.nlp, self.trimmed = load_ner_pipeline(
+                self.model_path, trim=settings.NER_PIPELINE_TRIM
+            )
             logger.info(
                 f"Model loaded successfully. Labels {self.nlp.get_pipe('ner').labels}"
             )
@@ -37,18 +86,150 @@ class SpacyNERModel:
             logger.error("Model not loaded. Call load_model() before predict().")
             return []
 
-        doc = self.nlp(prompt)
-        entities = []
-        for ent in doc.ents:
-            entities.append(
-                Entity(
-                    start=ent.start_char,
-                    end=ent.end_char,
-                    label=ent.label_,
-                    text=ent.text,
-                )
+        if self.rules:
+            return self.predict_batch([prompt])[0]
+        return self._to_entities(self.nlp(prompt))
+
+    @property
+    def model_version(self) -> str:
+        """Name and meta version of the loaded pipeline, used to scope cached results"""
+        info = self.get_model_info()
+        return f"{info.get('model_name')}@{info.get('version')}"
+
+    async def apredict(self, prompt: str) -> list[Entity]:
+        """
+        Predict named entities without blocking the event loop.
+
+        The model sees the normalised prompt (see align_prompt), so the cache can
+        serve every spelling of it, and the entity offsets are then mapped back
+        onto the prompt as sent. Cache misses run in
+        the inference executor, coalesced with concurrent calls into nlp.pipe
+        batches when micro-batching is enabled. Raises InferenceSaturatedError when
+        too many requests are already pending.
+        """
+        return (await self.apredict_batch([prompt], batched=False))[0]
+
+    async def apredict_batch(
+        self, prompts: list[str], batched: bool = True
+    ) -> list[list[Entity]]:
+        """Predict named entities for many prompts, serving repeats from the prompt cache"""
+        originals = prompts
+        alignments = [align_prompt(prompt) for prompt in originals]
+        prompts = [text for text, _ in alignments]
+        use_cache = self.cache is not None and self.nlp is not None
+
+        scope = f"{self.model_version}/{self.extraction_mode}" if use_cache else ""
+        keys = [prompt_key(prompt, scope) for prompt in prompts]
+        if use_cache:
+            results = [await self.cache.get(key) for key in keys]
+        else:
+            results = [None] * len(keys)
+
+        # Predict each distinct missing prompt once
+        missing = {
+            key: prompt
+            for key, prompt, result in zip(keys, prompts, results)
+            if result is None
+        }
+        if missing:
+            predicted = await self._predict_missing(missing, batched)
+            if use_cache:
+                for key, entities in predicted.items():
+                    await self.cache.put(key, entities)
+            results = [
+                predicted[key] if result is None else result
+                for key, result in zip(keys, results)
+            ]
+
+        return [
+            restore_offsets(entities, original, spans)
+            for entities, original, (_, spans) in zip(results, originals, alignments)
+        ]
+
+    async def _predict_missing(
+        self, missing: dict[str, str], batched: bool
+    ) -> dict[str, list[Entity]]:
+        """Predict uncached prompts, answering complete rule parses without the model"""
+        predicted = {}
+        if self.rules:
+            for key, prompt in missing.items():
+                parse = self.rules.extract(prompt)
+                if parse.complete:
+                    predicted[key] = parse.entities
+
+        remaining = {key: prompt for key, prompt in missing.items() if key not in predicted}
+        if remaining:
+            entities = await self._run(list(remaining.values()), batched)
+            predicted.update(zip(remaining, entities))
+
+        return predicted
+
+    async def _run(self, prompts: list[str], batched: bool) -> list[list[Entity]]:
+        """Run prompts through the executor, as one batch or via the micro-batcher"""
+        if self.executor is None:
+            return self.predict_batch(prompts)
+
+        with self.executor.reserve():
+            if batched or self.batcher is None:
+                return await self.executor.run(prompts)
+            return [await self.batcher.submit(prompt) for prompt in prompts]
+
+    def predict_batch(
+        self,
+        prompts: list[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> list[list[Entity]]:
+        """
+        Predict named entities for many prompts with a single nlp.pipe pass.
+
+        Args:
+            prompts: The prompts to extract entities from.
+            batch_size: Number of prompts spaCy processes per batch.
+            n_process: Number of worker processes used by spaCy.
+
+        Returns:
+            One list of entities per prompt, in the same order as the prompts.
+        """
+        if self.nlp is None:
+            logger.error("Model not loaded. Call load_model() before predict_batch().")
+            return [[] for _ in prompts]
+
+        batch_size = batch_size or settings.NER_BATCH_SIZE
+        n_process = n_process or settings.NER_N_PROCESS
+
+        if self.rules is None:
+            docs = self.nlp.pipe(prompts, batch_size=batch_size, n_process=n_process)
+            return [self._to_entities(doc) for doc in docs]
+
+        # Hybrid mode: the model only sees prompts the rules could not fully parse,
+        # and rule entities win wherever the two overlap
+        parses = [self.rules.extract(prompt) for prompt in prompts]
+        results = [parse.entities for parse in parses]
+        pending = [i for i, parse in enumerate(parses) if not parse.complete]
+        if not pending:
+            return results
+
+        docs = self.nlp.pipe(
+            [prompts[i] for i in pending], batch_size=batch_size, n_process=n_process
+        )
+        for i, doc in zip(pending, docs):
+            results[i] = merge_entities(parses[i].entities, self._to_entities(doc))
+
+        return results
+
+    @staticmethod
+    def _to_entities(doc: Doc) -> list[Entity]:
+        """Convert the entities found in a spaCy doc"""
+        return [
+            Entity(
+                start=ent.start_char,
+                end=ent.end_char,
+                label=ent.label_,
+                text=ent.text,
             )
-        return entities
+            for ent in doc.ents
+        ]
 
     def get_model_info(self) -> dict:
         """Get model metadata."""
@@ -61,4 +242,16 @@ class SpacyNERModel:
             "language": self.nlp.meta.get("lang", "Unknown"),
             "labels": list(self.nlp.get_pipe("ner").labels),
             "pipeline": self.nlp.pipe_names,
+            "pipeline_trim": settings.NER_PIPELINE_TRIM,
+            "trimmed_components": self.trimmed,
+            "extraction_mode": self.extraction_mode,
         }
+
+    async def close(self):
+        """Stop background inference work"""
+        if self.batcher:
+            await self.batcher.close()
+        if self.executor:
+            self.executor.shutdown()
+        if self.cache:
+            await self.cache.close()
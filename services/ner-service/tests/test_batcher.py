@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from models.batcher import MicroBatcher
+
+
+class RecordingPredictor:
+    """Batch runner that records each batch it receives"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+
+    async def __call__(self, prompts):
+        self.batches.append(list(prompts))
+        await asyncio.sleep(self.delay)
+        return [[prompt.upper()] for prompt in prompts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched_and_resolved_in_order():
+    predictor = RecordingPredictor(delay=0.02)
+    batcher = MicroBatcher(predictor, max_batch_size=8, max_wait_ms=20)
+
+    prompts = [f"prompt {i}" for i in range(20)]
+    results = await asyncio.gather(*(batcher.submit(prompt) for prompt in prompts))
+    await batcher.close()
+
+    assert results == [[prompt.upper()] for prompt in prompts]
+    assert len(predictor.batches) < len(prompts)
+    assert max(len(batch) for batch in predictor.batches) <= 8
+
+
+@pytest.mark.asyncio
+async def test_single_request_is_not_delayed():
+    predictor = RecordingPredictor()
+    batcher = MicroBatcher(predictor, max_batch_size=8, max_wait_ms=1000)
+
+    result = await asyncio.wait_for(batcher.submit("box"), timeout=0.5)
+    await batcher.close()
+
+    assert result == ["BOX"]
+    assert predictor.batches == [["box"]]
+
+
+@pytest.mark.asyncio
+async def test_prediction_errors_reach_every_caller():
+    async def failing(prompts):
+        raise RuntimeError("model exploded")
+
+    batcher = MicroBatcher(failing, max_batch_size=4, max_wait_ms=5)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+    )
+    await batcher.close()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_up_to_the_limit():
+    running = 0
+    peak = 0
+
+    async def run(prompts):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return [[] for _ in prompts]
+
+    batcher = MicroBatcher(run, max_batch_size=2, max_wait_ms=1, max_concurrency=3)
+
+    await asyncio.gather(*(batcher.submit(str(i)) for i in range(20)))
+    await batcher.close()
+
+    assert peak == 3
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+import spacy
+
+from models.cache import (
+    MemoryStore,
+    PromptCache,
+    align_prompt,
+    normalise_prompt,
+    prompt_key,
+    restore_offsets,
+)
+from models.spacy_ner import SpacyNERModel
+from shared.models.misc import Entity
+
+BOX = [Entity(start=2, end=5, label="SHAPE_TYPE", text="box")]
+
+
+def test_normalise_prompt_collapses_whitespace():
+    assert normalise_prompt("  a   box\n 10mm ") == "a box 10mm"
+    assert prompt_key("a box", "ner@1.0") != prompt_key("a box", "ner@1.1")
+
+
+def test_offsets_map_back_to_the_prompt_as_sent():
+    prompt = "  Cafe\u0301 \t box\n\n10 mm "
+    text, spans = align_prompt(prompt)
+    assert text == "Caf\u00e9 box 10 mm"
+
+    found = [
+        Entity(start=0, end=4, label="NAME", text="Caf\u00e9"),
+        Entity(start=5, end=8, label="SHAPE_TYPE", text="box"),
+        Entity(start=9, end=14, label="DIMENSION", text="10 mm"),
+    ]
+    restored = restore_offsets(found, prompt, spans)
+
+    assert [prompt[e.start:e.end] for e in restored] == ["Cafe\u0301", "box", "10 mm"]
+    assert [e.text for e in restored] == ["Cafe\u0301", "box", "10 mm"]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_evict():
+    cache = PromptCache(max_items=2, ttl=0.05)
+
+    await cache.put("a", BOX)
+    assert await cache.get("a") == BOX
+
+    time.sleep(0.06)
+    assert await cache.get("a") is None
+
+    for key in ("a", "b", "c"):
+        await cache.put(key, BOX)
+    assert await cache.get("a") is None
+    assert cache.stats()["items"] == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_store_serves_other_replicas():
+    store = MemoryStore()
+    first = PromptCache(store=store)
+    second = PromptCache(store=store)
+
+    await first.put("key", BOX)
+
+    assert await second.get("key") == BOX
+    assert second.stats()["hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_model_serves_repeats_from_cache_until_reloaded():
+    model = SpacyNERModel("unused")
+    model.nlp = spacy.blank("en")
+    model.nlp.add_pipe("entity_ruler", name="ner").add_patterns(
+        [{"label": "SHAPE_TYPE", "pattern": "box"}]
+    )
+
+    calls = []
+    predict_batch = model.predict_batch
+
+    def counting(prompts):
+        calls.append(prompts)
+        return predict_batch(prompts)
+
+    model.executor._task = counting
+
+    first = await model.apredict("a box")
+    second = await model.apredict("  a   box ")
+    assert [(e.start, e.end, e.text) for e in first] == [(2, 5, "box")]
+    assert [(e.start, e.end, e.text) for e in second] == [(6, 9, "box")]
+    assert len(calls) == 1
+
+    # A reloaded model with a new version must not reuse the old results
+    model.nlp.meta["version"] = "0.0.2"
+    await model.apredict("a box")
+    assert len(calls) == 2
+
+    await model.close()
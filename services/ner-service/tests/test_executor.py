@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+import spacy
+
+from models.executor import InferenceExecutor, InferenceSaturatedError
+from models.spacy_ner import SpacyNERModel
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns([{"label": "SHAPE_TYPE", "pattern": "box"}])
+    nlp.to_disk(tmp_path / "model")
+    return str(tmp_path / "model")
+
+
+def test_reserve_rejects_requests_beyond_the_pending_limit():
+    executor = InferenceExecutor("thread", "unused", lambda prompts: [], max_pending=2)
+
+    with executor.reserve(), executor.reserve():
+        with pytest.raises(InferenceSaturatedError) as error:
+            with executor.reserve():
+                pass
+
+    assert error.value.pending == 2
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_executor_modes_match_inline_prediction(model_path, mode):
+    inline = SpacyNERModel(model_path, inference_mode="inline")
+    inline.load_model()
+
+    executor = InferenceExecutor(mode, model_path, inline.predict_batch, max_workers=2)
+    prompts = ["a box", "a cylinder", "two box"]
+
+    results = await asyncio.gather(*(executor.run([prompt]) for prompt in prompts))
+    executor.shutdown()
+
+    assert [result[0] for result in results] == inline.predict_batch(prompts)
@@ -1,5 +1,5 @@
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from main import app
 from core.deps import get_ner_model
 
@@ -7,7 +7,7 @@ client = TestClient(app)
 
 def override_ner_model(predict_return):
     mock_model = MagicMock()
-    mock_model.predict.return_value = predict_return
+    mock_model.apredict = AsyncMock(return_value=predict_return)
     app.dependency_overrides[get_ner_model] = lambda: mock_model
 
 
@@ -45,3 +45,89 @@ def test_extract_entities_invalid_payload():
     # Optionally assert validation error structure
     errors = response.json()["detail"]
     assert any(err["loc"][-1] == "prompt" for err in errors)
+
+
+def test_extract_batch_preserves_order():
+    """Test that batch extraction returns one entity list per prompt, in order."""
+    mock_model = MagicMock()
+    mock_model.apredict_batch = AsyncMock(
+        return_value=[
+            [{"start": 0, "end": 3, "label": "SHAPE_TYPE", "text": "box"}],
+            [],
+        ]
+    )
+    app.dependency_overrides[get_ner_model] = lambda: mock_model
+
+    response = client.post(
+        "/api/v1/extract/batch", json={"prompts": ["box 10mm", "nothing"]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    mock_model.apredict_batch.assert_awaited_once_with(["box 10mm", "nothing"])
+    assert data["results"] == [
+        [{"start": 0, "end": 3, "label": "SHAPE_TYPE", "text": "box"}],
+        [],
+    ]
+    assert data["error"] is None
+
+
+def test_predict_batch_matches_predict():
+    """Test that nlp.pipe batching gives the same entities as per-prompt prediction."""
+    import spacy
+
+    from models.spacy_ner import SpacyNERModel
+
+    model = SpacyNERModel("unused", inference_mode="inline")
+    model.nlp = spacy.blank("en")
+    ruler = model.nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [
+            {"label": "SHAPE_TYPE", "pattern": "box"},
+            {"label": "SHAPE_TYPE", "pattern": "cylinder"},
+        ]
+    )
+
+    prompts = ["a box 10mm wide", "a tall cylinder", "nothing here"] * 5
+
+    batched = model.predict_batch(prompts, batch_size=4)
+
+    assert batched == [model.predict(prompt) for prompt in prompts]
+    assert [len(entities) for entities in batched[:3]] == [1, 1, 0]
+
+
+def test_extract_returns_503_when_inference_is_saturated():
+    """Test that a full inference queue asks the client to retry later."""
+    from models.executor import InferenceSaturatedError
+
+    mock_model = MagicMock()
+    mock_model.apredict = AsyncMock(side_effect=InferenceSaturatedError(256, 2))
+    app.dependency_overrides[get_ner_model] = lambda: mock_model
+
+    response = client.post("/api/v1/extract", json={"prompt": "a box"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert "Inference queue is full" in response.json()["error"]
+
+
+def test_metrics_are_off_unless_enabled():
+    """Test that /metrics stays opt-in through ENABLE_METRICS."""
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_expose_prompt_cache_counters(monkeypatch):
+    """Test that prompt cache hit/miss counters are published on /metrics."""
+    from fastapi import FastAPI
+    from shared.utils.monitoring import MonitoringSetup
+
+    monkeypatch.setenv("ENABLE_METRICS", "true")
+    metrics_app = FastAPI()
+    monitoring = MonitoringSetup("ner-service")
+    monitoring.setup_prometheus(metrics_app)
+    monitoring.instrumentator.expose(metrics_app, include_in_schema=False)
+
+    response = TestClient(metrics_app).get("/metrics")
+
+    assert response.status_code == 200
+    assert "ner_prompt_cache_requests_total" in response.text
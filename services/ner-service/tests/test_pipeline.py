@@ -0,0 +1,75 @@
+import pytest
+import spacy
+
+from core.settings import settings
+from models.pipeline import load_ner_pipeline, required_components
+from models.spacy_ner import SpacyNERModel
+
+
+def listener(upstream):
+    return {"@architectures": "spacy.Tok2VecListener.v1", "upstream": upstream}
+
+
+def test_required_components_follow_listeners():
+    config = {
+        "components": {
+            "tok2vec": {"factory": "tok2vec"},
+            "tagger": {"factory": "tagger", "model": {"tok2vec": listener("tok2vec")}},
+            "parser": {"factory": "parser", "model": {"tok2vec": listener("*")}},
+            "ner": {"factory": "ner", "model": {"tok2vec": listener("tok2vec")}},
+            "lemmatizer": {"factory": "lemmatizer"},
+        }
+    }
+
+    assert required_components(config) == {"tok2vec", "ner"}
+
+
+def test_required_components_with_wildcard_listener():
+    config = {
+        "components": {
+            "transformer": {"factory": "transformer"},
+            "ner": {"factory": "ner", "model": {"tok2vec": listener("*")}},
+            "tagger": {"factory": "tagger"},
+        }
+    }
+
+    assert required_components(config) == {"transformer", "ner"}
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("entity_ruler", name="ner").add_patterns(
+        [{"label": "SHAPE_TYPE", "pattern": "box"}]
+    )
+    nlp.to_disk(tmp_path / "model")
+    return str(tmp_path / "model")
+
+
+@pytest.mark.parametrize(
+    "trim, pipeline, components",
+    [
+        ("none", ["sentencizer", "ner"], ["sentencizer", "ner"]),
+        ("disable", ["ner"], ["sentencizer", "ner"]),
+        ("exclude", ["ner"], ["ner"]),
+    ],
+)
+def test_load_modes(model_path, trim, pipeline, components):
+    nlp, trimmed = load_ner_pipeline(model_path, trim)
+
+    assert nlp.pipe_names == pipeline
+    assert nlp.component_names == components
+    assert trimmed == ([] if trim == "none" else ["sentencizer"])
+    assert [ent.text for ent in nlp("a box").ents] == ["box"]
+
+
+def test_model_info_reports_trimmed_pipeline(model_path, monkeypatch):
+    monkeypatch.setattr(settings, "NER_PIPELINE_TRIM", "exclude")
+
+    model = SpacyNERModel(model_path, inference_mode="inline")
+    model.load_model()
+    info = model.get_model_info()
+
+    assert info["pipeline"] == ["ner"]
+    assert info["trimmed_components"] == ["sentencizer"]
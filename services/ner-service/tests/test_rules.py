@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from models.rules import RuleExtractor, merge_entities
+from models.spacy_ner import SpacyNERModel
+from shared.models.misc import Entity
+
+rules = RuleExtractor()
+
+
+def labelled(parse):
+    return [(entity.text, entity.label) for entity in parse.entities]
+
+
+def test_formulaic_prompt_is_fully_parsed():
+    parse = rules.extract("create a box 100mm x 50mm x 20mm with 4 holes 5mm diameter")
+
+    assert parse.complete
+    assert labelled(parse) == [
+        ("box", "SHAPE_TYPE"),
+        ("100", "SHAPE_DIMENSION"), ("mm", "UNIT"),
+        ("50", "SHAPE_DIMENSION"), ("mm", "UNIT"),
+        ("20", "SHAPE_DIMENSION"), ("mm", "UNIT"),
+        ("4", "FEATURE_COUNT"), ("holes", "FEATURE"),
+        ("5", "HOLE_DIAMETER"), ("mm", "UNIT"),
+    ]
+
+
+def test_offsets_point_into_the_prompt():
+    prompt = "make a plate 200 x 100 x 5 mm with 4 holes 10mm from the corners"
+    parse = rules.extract(prompt)
+
+    assert parse.complete
+    assert all(prompt[e.start : e.end] == e.text for e in parse.entities)
+    assert ("10", "HOLE_CORNER_OFFSET") in labelled(parse)
+
+
+def test_unknown_context_is_left_to_the_model():
+    parse = rules.extract("Generate a spur gear with 13 teeth, 1.0 module and 5 mm width")
+
+    assert not parse.complete
+    assert ("13", "GEAR_TEETH") in labelled(parse)
+    assert "1.0" not in [entity.text for entity in parse.entities]
+
+
+def test_rule_entities_win_overlaps():
+    rule = [Entity(start=0, end=3, label="SHAPE_DIMENSION", text="100")]
+    model = [
+        Entity(start=0, end=5, label="UNIT", text="100mm"),
+        Entity(start=10, end=13, label="GEAR_MODULE", text="1.0"),
+    ]
+
+    assert merge_entities(rule, model) == [rule[0], model[1]]
+
+
+def test_hybrid_model_only_runs_spacy_on_incomplete_parses():
+    model = SpacyNERModel("unused", inference_mode="inline", extraction_mode="hybrid")
+    model.nlp = MagicMock()
+    model.nlp.pipe.return_value = [MagicMock(ents=[])]
+
+    entities = model.predict_batch(["create a cube 10 mm", "a vase 20 cm tall"])
+
+    assert [entity.text for entity in entities[0]] == ["cube", "10", "mm"]
+    assert model.nlp.pipe.call_args.args[0] == ["a vase 20 cm tall"]
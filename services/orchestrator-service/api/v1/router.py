@@ -1,10 +1,15 @@
+import asyncio
+import json
 import logging
+from contextlib import aclosing
 
 from core.mapping import CADMapper
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from clients.client_factory import ServiceClientFactory
 from core.deps import get_client_factory
+from shared.models.base import LevelOfDetail
 from shared.models.requests import OrchestratorRequest, CADRequest
 
 api_router = APIRouter()
@@ -12,6 +17,10 @@ cad_mapper = CADMapper()
 
 logger = logging.getLogger(__name__)
 
+# Levels of detail produced by the streaming pipeline: a quick preview, then the model
+PIPELINE_PREVIEW_LOD = LevelOfDetail.PREVIEW
+PIPELINE_MODEL_LOD = LevelOfDetail.STANDARD
+
 
 @api_router.get("/health")
 async def health_check(
@@ -19,22 +28,32 @@ async def health_check(
 ):
     """Health check endpoint to verify each service is running."""
 
-    # Check all configured services
-    for service_name in client_factory.configs.keys():
+    async def check(service_name: str) -> bool:
         try:
             client = getattr(client_factory, f"get_{service_name}_client")()
-            if not client.health_check():
-                logger.error(f"Service {service_name} is not healthy")
-                return {
-                    "status": "error",
-                    "message": f"{service_name} service is not running",
-                }
+            return await client.health_check()
         except Exception as e:
             logger.error(f"Failed to check {service_name} service: {e}")
+            raise
+
+    # Check all configured services concurrently
+    service_names = list(client_factory.configs.keys())
+    results = await asyncio.gather(
+        *(check(name) for name in service_names), return_exceptions=True
+    )
+
+    for service_name, healthy in zip(service_names, results):
+        if isinstance(healthy, Exception):
             return {
                 "status": "error",
                 "message": f"Failed to check {service_name} service",
             }
+        if not healthy:
+            logger.error(f"Service {service_name} is not healthy")
+            return {
+                "status": "error",
+                "message": f"{service_name} service is not running",
+            }
 
     return {"status": "ok", "message": "Orchestrator service is running"}
 
@@ -54,7 +73,7 @@ async def run_pipeline(
 
     # Send the request to the NER service and process the response
     try:
-        ner_response = ner_client.extract_entities(request.prompt)
+        ner_response = await ner_client.extract_entities(request.prompt)
         logger.debug(f"NER response: {ner_response}")
     except Exception as e:
         logger.error(f"Error during processing: {e}")
@@ -71,7 +90,7 @@ async def run_pipeline(
 
     # Send the NER response to the CAD service to generate geometry
     try:
-        cad_response = cad_client.generate_geometry(CADRequest(prompt=request.prompt, config=config))
+        cad_response = await cad_client.generate_geometry(CADRequest(prompt=request.prompt, config=config))
         logger.debug(f"CAD response: {cad_response}")
     except Exception as e:
         logger.error(f"Error during processing: {e}")
@@ -82,3 +101,55 @@ async def run_pipeline(
         "message": "Orchestrator pipeline completed",
         "file_path": cad_response.model_path,
     }
+
+
+@api_router.post("/pipeline/stream")
+async def run_pipeline_stream(
+        request: OrchestratorRequest,
+        client_factory: ServiceClientFactory = Depends(get_client_factory),
+):
+    """Run the pipeline, streaming each stage's result as NDJSON as soon as it is ready.
+
+    Emits ``entities`` after NER, ``configuration`` after mapping, ``preview`` with a
+    coarse mesh and finally ``model`` with the full model path. Disconnecting stops
+    the pipeline and cancels the CAD request.
+    """
+
+    logger.info(f"Starting streaming orchestrator pipeline with request: {request.prompt}")
+
+    ner_client = client_factory.get_nlp_client()
+    cad_client = client_factory.get_cad_client()
+
+    def event(name: str, **data) -> str:
+        return json.dumps({"event": name, **data}) + "\n"
+
+    async def events():
+        try:
+            ner_response = await ner_client.extract_entities(request.prompt)
+            entities_dict = [entity.model_dump() for entity in ner_response.entities]
+            yield event("entities", entities=entities_dict)
+
+            config = cad_mapper.process_entities(entities_dict)
+            # Splice the model's own JSON in rather than round-tripping it through a dict
+            yield f'{{"event": "configuration", "config": {config.model_dump_json()}}}\n'
+
+            cad_request = CADRequest(prompt=request.prompt, config=config)
+            levels = [PIPELINE_PREVIEW_LOD, PIPELINE_MODEL_LOD]
+
+            async with aclosing(cad_client.generate_levels(cad_request, levels)) as stream:
+                async for cad_event in stream:
+                    if "error" in cad_event:
+                        yield event("error", message=cad_event["error"])
+                        return
+                    if cad_event.get("lod") == PIPELINE_PREVIEW_LOD.value:
+                        yield event("preview", model_path=cad_event["model_path"])
+                    elif cad_event.get("lod") == PIPELINE_MODEL_LOD.value:
+                        yield event("model", file_path=cad_event["model_path"])
+        except asyncio.CancelledError:
+            logger.info("Streaming pipeline cancelled by the client")
+            raise
+        except Exception as e:
+            logger.error(f"Error during streaming pipeline: {e}")
+            yield event("error", message=str(e))
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
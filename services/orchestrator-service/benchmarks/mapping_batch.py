@@ -0,0 +1,100 @@
+"""
+Compare per-prompt CADMapper.process_entities with process_entities_batch.
+
+Maps a synthetic corpus of stored NER outputs both ways and reports the
+throughput of each path, e.g.
+
+    python -m benchmarks.mapping_batch --prompts 100000
+"""
+
+import argparse
+import gc
+import random
+import time
+
+from core.mapping import CADMapper, EntityColumns
+
+
+def entity(label: str, text: str) -> dict:
+    return {"start": 0, "end": len(text), "label": label, "text": text}
+
+
+def dimension(value: float, unit: str) -> list[dict]:
+    return [entity("SHAPE_DIMENSION", f"{value:g}"), entity("UNIT", unit)]
+
+
+def random_prompt(rng: random.Random) -> list[dict]:
+    """Entities for one prompt, drawn from the shapes the mapper supports"""
+    unit = rng.choice(["mm", "cm", "in"])
+    size = lambda: rng.randint(1, 200)
+
+    kind = rng.choice(["box", "plate", "cube", "cylinder", "sphere", "torus", "spur gear"])
+    entities = [entity("SHAPE_TYPE", kind)]
+
+    if kind in ("box", "plate"):
+        for _ in range(3):
+            entities += dimension(size(), unit)
+        if kind == "plate":
+            entities += [
+                entity("FEATURE_COUNT", "4"),
+                entity("FEATURE", "holes"),
+                entity("HOLE_DIAMETER", "5"),
+                entity("UNIT", "mm"),
+                entity("HOLE_CORNER_OFFSET", "10"),
+                entity("UNIT", "mm"),
+            ]
+    elif kind in ("cylinder", "torus"):
+        entities += dimension(size() + 50, unit) + dimension(size(), unit)
+    elif kind == "spur gear":
+        entities.append(entity("GEAR_TEETH", str(rng.randint(8, 60))))
+    else:
+        entities += dimension(size(), unit)
+
+    return entities
+
+
+def best_of(repeat: int, fn) -> float:
+    """Fastest of several timed runs, each starting from a collected heap"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--prompts", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    documents = [random_prompt(rng) for _ in range(args.prompts)]
+    mapper = CADMapper()
+    columns = EntityColumns.from_documents(documents)
+
+    timings = {
+        "process_entities": best_of(
+            args.repeat, lambda: [mapper.process_entities(entities) for entities in documents]
+        ),
+        "batch": best_of(args.repeat, lambda: mapper.process_entities_batch(columns)),
+        "batch + columns": best_of(
+            args.repeat,
+            lambda: mapper.process_entities_batch(EntityColumns.from_documents(documents)),
+        ),
+    }
+
+    print(f"{len(columns)} prompts, {len(columns.labels)} entities")
+    print(f"{'path':>18} {'total s':>10} {'us/prompt':>10} {'speedup':>8}")
+    for name, seconds in timings.items():
+        print(
+            f"{name:>18} {seconds:>10.3f} {seconds / len(columns) * 1e6:>10.1f} "
+            f"{timings['process_entities'] / seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
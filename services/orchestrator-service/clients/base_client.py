@@ -1,45 +1,106 @@
 import httpx
+import json
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional, TypeVar, Union
 from dataclasses import dataclass
 
+from pydantic import BaseModel
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+M = TypeVar("M", bound=BaseModel)
+
 
 @dataclass
 class ServiceConfig:
     """Service configuration"""
 
     base_url: str
-    timeout: int = 30
+    timeout: float = 30
+    connect_timeout: float = 5
     api_version: str = "v1"
     api_key: Optional[str] = None
     headers: Optional[dict[str, str]] = None
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    http2: bool = False
 
 
 class BaseClient:
-    """Base HTTP client for services"""
+    """Base asynchronous HTTP client for services, backed by a shared connection pool"""
 
     def __init__(self, config: ServiceConfig, service_name: str = "Unknown"):
         self.config = config
         self.service_name = service_name
         self.logger = logging.getLogger(f"services.{service_name}")
 
-        headers = config.headers or {}
+        headers = dict(config.headers or {})
         if config.api_key:
             headers["Authorization"] = f"Bearer {config.api_key}"
 
-        self.client = httpx.Client(
+        http2 = config.http2
+        if http2 and not HTTP2_AVAILABLE:
+            self.logger.warning(
+                f"HTTP/2 requested for {service_name} but the h2 package is not installed, "
+                f"falling back to HTTP/1.1"
+            )
+            http2 = False
+
+        self.client = httpx.AsyncClient(
             base_url=config.base_url,
-            timeout=config.timeout,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
             headers=headers,
+            http2=http2,
         )
 
-    def post(self, endpoint: str, params: Optional[dict] = None) -> dict[str, Any]:
-        """Make POST request"""
+    def _timeout(self, timeout: Optional[float]) -> Any:
+        """Per-call timeout, falling back to the client default"""
+        if timeout is None:
+            return httpx.USE_CLIENT_DEFAULT
+        return httpx.Timeout(timeout, connect=self.config.connect_timeout)
+
+    @staticmethod
+    def _body(params: Union[dict, BaseModel, None]) -> dict[str, Any]:
+        """Request body arguments, serialising models straight to JSON bytes"""
+        if isinstance(params, BaseModel):
+            return {
+                "content": params.model_dump_json(),
+                "headers": {"Content-Type": "application/json"},
+            }
+        return {"json": params}
+
+    async def post(
+        self,
+        endpoint: str,
+        params: Union[dict, BaseModel, None] = None,
+        timeout: Optional[float] = None,
+        response_model: Optional[type[M]] = None,
+    ) -> Union[dict[str, Any], M]:
+        """Make POST request
+
+        With a response_model the JSON response is validated straight into that model
+        rather than being decoded to a dict first.
+        """
         try:
-            response = self.client.post(
-                f"{self.config.api_version}/{endpoint}", json=params
+            response = await self.client.post(
+                f"{self.config.api_version}/{endpoint}",
+                timeout=self._timeout(timeout),
+                **self._body(params),
             )
             response.raise_for_status()
+            if response_model:
+                return response_model.model_validate_json(response.content)
             return response.json()
         except httpx.HTTPStatusError as e:
             self.logger.error(
@@ -47,11 +108,18 @@ class BaseClient:
             )
             raise
 
-    def get(self, endpoint: str, params: Optional[dict] = None) -> dict[str, Any]:
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
         """Make GET request"""
         try:
-            response = self.client.get(
-                f"{self.config.api_version}/{endpoint}", params=params
+            response = await self.client.get(
+                f"{self.config.api_version}/{endpoint}",
+                params=params,
+                timeout=self._timeout(timeout),
             )
             response.raise_for_status()
             return response.json()
@@ -61,15 +129,47 @@ class BaseClient:
             )
             raise
 
-    def health_check(self) -> bool:
+    async def stream(
+        self,
+        endpoint: str,
+        params: Union[dict, BaseModel, None] = None,
+        query: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Make a POST request and yield each line of an NDJSON response as it arrives
+
+        Closing the iterator early closes the connection, which tells the service
+        to stop work on the request.
+        """
+        async with self.client.stream(
+            "POST",
+            f"{self.config.api_version}/{endpoint}",
+            params=query,
+            timeout=self._timeout(timeout),
+            **self._body(params),
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                self.logger.error(
+                    f"POST {endpoint} failed: {response.status_code} - {response.text}"
+                )
+                response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if line:
+                    yield json.loads(line)
+
+    async def health_check(self, timeout: Optional[float] = None) -> bool:
         """Check if the service is healthy"""
         try:
-            response = self.client.get(f"{self.config.api_version}/health")
+            response = await self.client.get(
+                f"{self.config.api_version}/health", timeout=self._timeout(timeout)
+            )
             return response.status_code == 200
-        except:
+        except httpx.HTTPError:
             return False
 
-    def close(self):
-        """Close the client"""
-        self.client.close()
+    async def close(self):
+        """Close the client and its pooled connections"""
+        await self.client.aclose()
         self.logger.info(f"{self.service_name} client closed")
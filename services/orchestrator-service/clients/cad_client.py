@@ -1,3 +1,6 @@
+from typing import Any, AsyncIterator, Optional
+
+from shared.models.base import LevelOfDetail
 from shared.models.requests import CADRequest
 from shared.models.responses import CADResponse
 from .base_client import BaseClient, ServiceConfig
@@ -9,7 +12,25 @@ class CADClient(BaseClient):
     def __init__(self, config: ServiceConfig):
         super().__init__(config, service_name="cad")
 
-    def generate_geometry(self, data: CADRequest):
+    async def generate_geometry(
+        self, data: CADRequest, timeout: Optional[float] = None
+    ) -> CADResponse:
         """Generate CAD geometry based on the provided configuration."""
-        res = self.post("generate", params=data.model_dump())
-        return CADResponse(**res)
+        return await self.post(
+            "generate", params=data, timeout=timeout, response_model=CADResponse
+        )
+
+    async def generate_levels(
+        self,
+        data: CADRequest,
+        levels: list[LevelOfDetail],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Generate CAD geometry and yield each level of detail as soon as it is exported."""
+        async for event in self.stream(
+            "generate/lods",
+            params=data,
+            query={"levels": [LevelOfDetail(level).value for level in levels]},
+            timeout=timeout,
+        ):
+            yield event
@@ -14,8 +14,18 @@ class ServiceClientFactory:
             self._clients["ner"] = NERClient(self.configs["ner"])
         return self._clients["ner"]
 
+    def get_ner_client(self) -> NERClient:
+        """Get or create ner client, named after its service configuration"""
+        return self.get_nlp_client()
+
     def get_cad_client(self) -> CADClient:
         """Get or create CAD client"""
         if "cad" not in self._clients:
             self._clients["cad"] = CADClient(self.configs["cad"])
         return self._clients["cad"]
+
+    async def close(self):
+        """Close every client created by the factory"""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
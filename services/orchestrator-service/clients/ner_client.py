@@ -1,3 +1,6 @@
+from typing import Optional
+
+from shared.models.requests import NERRequest
 from shared.models.responses import NERResponse
 from .base_client import BaseClient, ServiceConfig
 
@@ -8,8 +11,13 @@ class NERClient(BaseClient):
     def __init__(self, config: ServiceConfig):
         super().__init__(config, service_name="ner")
 
-    def extract_entities(self, prompt: str) -> NERResponse:
+    async def extract_entities(
+        self, prompt: str, timeout: Optional[float] = None
+    ) -> NERResponse:
         """Extract entities from the provided prompt."""
-        data = {"prompt": prompt}
-        res = self.post("extract", params=data)
-        return NERResponse(**res)
+        return await self.post(
+            "extract",
+            params=NERRequest(prompt=prompt),
+            timeout=timeout,
+            response_model=NERResponse,
+        )
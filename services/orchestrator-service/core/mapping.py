@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
 
 from shared.models.base import (
@@ -7,12 +8,77 @@ from shared.models.base import (
     SphereParameters, ConeParameters, TorusParameters, WedgeParameters,
     Units, Metadata, SpurGearParameters
 )
+from shared.models.misc import Entity
 
 CANONICAL_TYPE_MAPPING = {
     "plate": "box",
     "spur gear": "spur_gear",
 }
 
+# Spellings of each unit, used to pick the units recorded in a model's metadata
+PRIMARY_UNITS = {
+    spelling: unit
+    for unit, spellings in {
+        Units.MM: ("mm", "millimeter", "millimeters"),
+        Units.CM: ("cm", "centimeter", "centimeters"),
+        Units.M: ("m", "meter", "meters"),
+        Units.IN: ("in", "inch", "inches"),
+        Units.FT: ("ft", "foot", "feet"),
+    }.items()
+    for spelling in spellings
+}
+
+# Integer codes for the entity labels the mapper understands, used by the batch path
+(
+    SHAPE_TYPE, SHAPE_DIMENSION, FEATURE_COUNT, FEATURE,
+    HOLE_DIAMETER, HOLE_CORNER_OFFSET, GEAR_TEETH, UNIT,
+) = range(8)
+
+LABEL_CODES = {
+    "SHAPE_TYPE": SHAPE_TYPE,
+    "SHAPE_DIMENSION": SHAPE_DIMENSION,
+    "FEATURE_COUNT": FEATURE_COUNT,
+    "FEATURE": FEATURE,
+    "HOLE_DIAMETER": HOLE_DIAMETER,
+    "HOLE_CORNER_OFFSET": HOLE_CORNER_OFFSET,
+    "GEAR_TEETH": GEAR_TEETH,
+    "UNIT": UNIT,
+}
+
+
+@dataclass
+class EntityColumns:
+    """
+    NER output for many prompts stored column-wise. The entities of prompt i are
+    rows offsets[i] to offsets[i + 1] of the label, text, start and end columns.
+    """
+
+    labels: List[str] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    starts: List[int] = field(default_factory=list)
+    ends: List[int] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=lambda: [0])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @classmethod
+    def from_documents(
+        cls, documents: Iterable[Iterable[Union[Dict, Entity]]]
+    ) -> "EntityColumns":
+        """Build columns from per-prompt lists of entity dicts or Entity models"""
+        columns = cls()
+        for entities in documents:
+            for entity in entities:
+                if isinstance(entity, Entity):
+                    entity = entity.model_dump()
+                columns.labels.append(entity["label"])
+                columns.texts.append(entity["text"])
+                columns.starts.append(entity["start"])
+                columns.ends.append(entity["end"])
+            columns.offsets.append(len(columns.labels))
+        return columns
+
 
 class CADConfigurationMapper:
     """Maps processed NLP entities to CADConfiguration objects."""
@@ -34,7 +100,9 @@ class CADConfigurationMapper:
     def map_to_configuration(self, processed_entities: Dict[str, Any]) -> CADConfiguration:
         """Convert processed entities to CADConfiguration."""
         self.logger.debug(f"Mapping entities: {processed_entities}")
+        return self._build_configuration(processed_entities)
 
+    def _build_configuration(self, processed_entities: Dict[str, Any]) -> CADConfiguration:
         metadata = Metadata(
             name=f"Generated CAD Model",
             description="Auto-generated from NLP processing",
@@ -61,23 +129,12 @@ class CADConfigurationMapper:
 
     def _get_primary_unit(self, dimensions: List[Dict[str, Any]]) -> Units:
         """Determine the primary unit from dimensions."""
-        if not dimensions:
-            return Units.MM
-
         for dim in dimensions:
             unit = dim.get("unit")
             if unit:
-                unit_lower = unit.lower()
-                if unit_lower in ["mm", "millimeter", "millimeters"]:
-                    return Units.MM
-                elif unit_lower in ["cm", "centimeter", "centimeters"]:
-                    return Units.CM
-                elif unit_lower in ["m", "meter", "meters"]:
-                    return Units.M
-                elif unit_lower in ["in", "inch", "inches"]:
-                    return Units.IN
-                elif unit_lower in ["ft", "foot", "feet"]:
-                    return Units.FT
+                primary = PRIMARY_UNITS.get(unit.lower())
+                if primary:
+                    return primary
 
         return Units.MM
 
@@ -271,6 +328,67 @@ class CADMapper:
 
         return self.config_mapper.map_to_configuration(raw_config)
 
+    def process_entities_batch(
+        self, columns: EntityColumns, skip_errors: bool = False
+    ) -> List[Optional[CADConfiguration]]:
+        """
+        Map the entities of many prompts, stored as EntityColumns, to one
+        CADConfiguration per prompt.
+
+        Produces the same configurations as calling process_entities on each prompt,
+        but translates labels through a precomputed code table in a single pass and
+        skips the per-entity dispatch and logging. With skip_errors a prompt that
+        cannot be mapped yields None instead of failing the whole batch.
+        """
+        codes = list(map(LABEL_CODES.get, columns.labels))
+        texts = columns.texts
+        offsets = columns.offsets
+        configurations = []
+
+        for index, (start, end) in enumerate(zip(offsets, offsets[1:])):
+            raw_config = self._collect_columns(codes, texts, start, end)
+            try:
+                configurations.append(self.config_mapper._build_configuration(raw_config))
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                self.logger.warning(f"Failed to map prompt {index} of batch: {e}")
+                configurations.append(None)
+
+        self.logger.debug(f"Mapped {len(configurations)} prompts in batch")
+        return configurations
+
+    @staticmethod
+    def _collect_columns(codes: List[Optional[int]], texts: List[str], start: int, end: int) -> Dict:
+        """Gather one prompt's rows into the raw configuration process_entities builds"""
+        raw_config = {"shape_type": None, "dimensions": [], "features": {}}
+        features = raw_config["features"]
+
+        for i in range(start, end):
+            code = codes[i]
+            if code is None or code == UNIT:
+                continue
+
+            text = texts[i]
+            if code == SHAPE_TYPE:
+                raw_config["shape_type"] = text
+            elif code == FEATURE_COUNT:
+                features["count"] = text
+            elif code == FEATURE:
+                features["type"] = text
+            elif code == GEAR_TEETH:
+                features["teeth"] = float(text)
+            else:
+                unit = texts[i + 1] if i + 1 < end and codes[i + 1] == UNIT else None
+                if code == SHAPE_DIMENSION:
+                    raw_config["dimensions"].append({"dimension": text, "unit": unit})
+                elif code == HOLE_DIAMETER:
+                    features["diameter"] = {"value": text, "unit": unit}
+                else:
+                    features["corner_offset"] = {"value": text, "unit": unit}
+
+        return raw_config
+
     def _get_next_unit(self, entities: List[Dict], index: int) -> Optional[str]:
         """Get unit following current entity if it exists."""
         next_idx = index + 1
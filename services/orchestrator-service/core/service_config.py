@@ -2,6 +2,17 @@ from clients import ServiceConfig
 from core.settings import settings
 
 
+def _pool_options() -> dict:
+    """Connection pool options shared by every service client"""
+    return {
+        "connect_timeout": settings.SERVICE_CONNECT_TIMEOUT,
+        "max_connections": settings.SERVICE_MAX_CONNECTIONS,
+        "max_keepalive_connections": settings.SERVICE_MAX_KEEPALIVE_CONNECTIONS,
+        "keepalive_expiry": settings.SERVICE_KEEPALIVE_EXPIRY,
+        "http2": settings.SERVICE_HTTP2,
+    }
+
+
 def get_service_configs() -> dict[str, ServiceConfig]:
     """Get the service configurations for the orchestrator service."""
     return {
@@ -10,11 +21,13 @@ def get_service_configs() -> dict[str, ServiceConfig]:
             timeout=settings.SERVICE_TIMEOUT,
             api_version="v1",
             headers={"Content-Type": "application/json"},
+            **_pool_options(),
         ),
         "cad": ServiceConfig(
             base_url=settings.CAD_SERVICE_URL,
-            timeout=settings.SERVICE_TIMEOUT,
+            timeout=settings.CAD_SERVICE_TIMEOUT,
             api_version="v1",
             headers={"Content-Type": "application/json"},
+            **_pool_options(),
         ),
     }
@@ -25,10 +25,36 @@ class Settings(BaseSettings):
         default="http://cad-service:8000/api/", description="URL for the CAD service"
     )
 
-    SERVICE_TIMEOUT: int = Field(
+    SERVICE_TIMEOUT: float = Field(
         default=5, description="Timeout for service requests in seconds"
     )
 
+    CAD_SERVICE_TIMEOUT: float = Field(
+        default=60,
+        description="Timeout for CAD service requests in seconds, geometry generation can be slow",
+    )
+
+    SERVICE_CONNECT_TIMEOUT: float = Field(
+        default=2, description="Timeout for opening a connection to a service in seconds"
+    )
+
+    SERVICE_MAX_CONNECTIONS: int = Field(
+        default=100, description="Maximum concurrent connections per service client"
+    )
+
+    SERVICE_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, description="Maximum idle connections kept open per service client"
+    )
+
+    SERVICE_KEEPALIVE_EXPIRY: float = Field(
+        default=30, description="Seconds an idle pooled connection is kept open"
+    )
+
+    SERVICE_HTTP2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for service requests (requires the h2 package)",
+    )
+
     class Config:
         """Configuration for Pydantic settings."""
 
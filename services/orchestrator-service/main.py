@@ -1,13 +1,26 @@
 import logging
+from contextlib import asynccontextmanager
 
 from api.v1.router import api_router
+from core.deps import get_client_factory
 from core.settings import settings
 from shared.utils.monitoring import create_monitored_app
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = create_monitored_app(service_name="orchestrator-service")
+
+@asynccontextmanager
+async def lifespan(_):
+    """Create the service clients at startup and close their connection pools at shutdown."""
+    client_factory = get_client_factory()
+    yield
+
+    logger.info("Shutting down orchestrator service...")
+    await client_factory.close()
+
+
+app = create_monitored_app(service_name="orchestrator-service", lifespan=lifespan)
 
 app.include_router(api_router, prefix="/api/v1", tags=["Orchestrator Service"])
 
@@ -0,0 +1,73 @@
+import pytest
+
+from core.mapping import CADMapper, EntityColumns
+from shared.models.misc import Entity
+
+
+def entity(label: str, text: str) -> dict:
+    return {"start": 0, "end": len(text), "label": label, "text": text}
+
+
+DOCUMENTS = [
+    [
+        entity("SHAPE_TYPE", "box"),
+        entity("SHAPE_DIMENSION", "100"), entity("UNIT", "mm"),
+        entity("SHAPE_DIMENSION", "5"), entity("UNIT", "cm"),
+        entity("SHAPE_DIMENSION", "2"), entity("UNIT", "in"),
+    ],
+    [
+        entity("SHAPE_TYPE", "cylinder"),
+        entity("SHAPE_DIMENSION", "10"), entity("UNIT", "mm"),
+        entity("SHAPE_DIMENSION", "3"), entity("UNIT", "cm"),
+    ],
+    [],
+    [
+        entity("SHAPE_TYPE", "spur gear"),
+        entity("GEAR_TEETH", "24"),
+        entity("UNKNOWN", "ignored"),
+    ],
+    [entity("SHAPE_TYPE", "cube"), entity("SHAPE_DIMENSION", "2"), entity("UNIT", "ft")],
+]
+
+
+def without_ids(config) -> dict:
+    payload = config.model_dump()
+    for shape in payload["shapes"]:
+        shape.pop("id")
+    return payload
+
+
+def test_columns_group_entities_by_prompt():
+    columns = EntityColumns.from_documents(
+        [[Entity(**e) for e in document] for document in DOCUMENTS]
+    )
+
+    assert len(columns) == len(DOCUMENTS)
+    assert columns.offsets == [0, 7, 12, 12, 15, 18]
+    assert columns.labels[7:12] == [e["label"] for e in DOCUMENTS[1]]
+
+
+def test_batch_matches_per_prompt_mapping():
+    mapper = CADMapper()
+
+    batched = mapper.process_entities_batch(EntityColumns.from_documents(DOCUMENTS))
+    single = [mapper.process_entities(document) for document in DOCUMENTS]
+
+    assert [without_ids(c) for c in batched] == [without_ids(c) for c in single]
+    assert batched[0].shapes[0].parameters.width == pytest.approx(50)
+    assert batched[0].metadata.units == "mm"
+    assert batched[4].metadata.units == "ft"
+
+
+def test_batch_errors_can_be_skipped():
+    mapper = CADMapper()
+    columns = EntityColumns.from_documents(
+        [[entity("SHAPE_TYPE", "cylinder"), entity("SHAPE_DIMENSION", "10")], DOCUMENTS[0]]
+    )
+
+    with pytest.raises(ValueError):
+        mapper.process_entities_batch(columns)
+
+    configurations = mapper.process_entities_batch(columns, skip_errors=True)
+    assert configurations[0] is None
+    assert configurations[1].shapes[0].type == "box"
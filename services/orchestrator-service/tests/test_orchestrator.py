@@ -1,20 +1,26 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 
 from core.deps import get_client_factory
 from main import app
+from shared.models.misc import Entity
+from shared.models.responses import NERResponse, CADResponse
 
 
 def test_pipeline_success():
     mock_get_client_factory = MagicMock()
 
-    mock_nlp_client = MagicMock()
-    mock_nlp_client.extract_entities.return_value = {
-        "entities": [{"type": "shape", "value": "rectangle", "dimensions": [10, 5]}]
-    }
+    mock_nlp_client = AsyncMock()
+    mock_nlp_client.extract_entities.return_value = NERResponse(
+        entities=[
+            Entity(start=7, end=16, label="SHAPE_TYPE", text="rectangle"),
+            Entity(start=17, end=19, label="SHAPE_DIMENSION", text="10"),
+            Entity(start=20, end=21, label="SHAPE_DIMENSION", text="5"),
+        ]
+    )
 
-    mock_cad_client = MagicMock()
-    mock_cad_client.generate_geometry.return_value = MagicMock(model_path="/fake/path/to/model.stl")
+    mock_cad_client = AsyncMock()
+    mock_cad_client.generate_geometry.return_value = CADResponse(model_path="/fake/path/to/model.stl")
 
     mock_get_client_factory.return_value.get_nlp_client.return_value = mock_nlp_client
     mock_get_client_factory.return_value.get_cad_client.return_value = mock_cad_client
@@ -45,9 +51,9 @@ def test_pipeline_missing_prompt():
 
 def test_pipeline_ner_client_failure():
     mock_get_client_factory = MagicMock()
-    mock_nlp_client = MagicMock()
+    mock_nlp_client = AsyncMock()
     mock_nlp_client.extract_entities.side_effect = Exception("NER service failed")
-    mock_cad_client = MagicMock()
+    mock_cad_client = AsyncMock()
 
     mock_get_client_factory.return_value.get_nlp_client.return_value = mock_nlp_client
     mock_get_client_factory.return_value.get_cad_client.return_value = mock_cad_client
@@ -67,10 +73,10 @@ def test_pipeline_ner_client_failure():
 
 def test_pipeline_cad_client_failure():
     mock_get_client_factory = MagicMock()
-    mock_nlp_client = MagicMock()
-    mock_nlp_client.extract_entities.return_value = {"entities": []}
+    mock_nlp_client = AsyncMock()
+    mock_nlp_client.extract_entities.return_value = NERResponse(entities=[])
 
-    mock_cad_client = MagicMock()
+    mock_cad_client = AsyncMock()
     mock_cad_client.generate_geometry.side_effect = Exception("CAD service failed")
 
     mock_get_client_factory.return_value.get_nlp_client.return_value = mock_nlp_client
@@ -93,7 +99,7 @@ def test_health_check_success():
     mock_get_client_factory = MagicMock()
 
     # Each service client returns healthy True
-    mock_client = MagicMock()
+    mock_client = AsyncMock()
     mock_client.health_check.return_value = True
 
     # Configure factory to have two services for example
@@ -112,3 +118,250 @@ def test_health_check_success():
     assert "Orchestrator service is running" in data["message"]
 
     app.dependency_overrides = {}
+
+
+def test_client_applies_per_call_timeouts():
+    import asyncio
+    import httpx
+
+    from clients import NERClient, ServiceConfig
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"entities": []})
+
+    async def run():
+        client = NERClient(ServiceConfig(base_url="http://ner/api/", timeout=5))
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(
+            base_url="http://ner/api/",
+            transport=httpx.MockTransport(handler),
+            timeout=client.client.timeout,
+        )
+
+        results = await asyncio.gather(
+            client.extract_entities("a box"),
+            client.extract_entities("a cylinder", timeout=30),
+        )
+        await client.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, NERResponse) for result in results)
+    assert seen[0]["read"] == 5
+    assert seen[1]["read"] == 30
+
+
+def test_client_pool_runs_requests_concurrently_and_reuses_connections():
+    import asyncio
+
+    from clients import NERClient, ServiceConfig
+
+    connections = 0
+    in_flight = 0
+    peak = 0
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        nonlocal connections, in_flight, peak
+        connections += 1
+        body = b'{"entities": []}'
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = next(
+                int(line.split(b":")[1])
+                for line in head.split(b"\r\n")
+                if line.lower().startswith(b"content-length:")
+            )
+            await reader.readexactly(length)
+
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = NERClient(
+            ServiceConfig(
+                base_url=f"http://127.0.0.1:{port}/api/",
+                max_connections=2,
+                max_keepalive_connections=2,
+            )
+        )
+        async with server:
+            results = await asyncio.gather(
+                *(client.extract_entities(f"box {i}") for i in range(6))
+            )
+            await client.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(results) == 6
+    assert all(isinstance(result, NERResponse) for result in results)
+    # Requests overlap up to the pool limit, over connections kept alive between them
+    assert peak == 2
+    assert connections == 2
+
+
+def test_pipeline_stream_emits_progressive_events():
+    import json
+
+    mock_get_client_factory = MagicMock()
+
+    mock_nlp_client = AsyncMock()
+    mock_nlp_client.extract_entities.return_value = NERResponse(
+        entities=[
+            Entity(start=7, end=10, label="SHAPE_TYPE", text="box"),
+            Entity(start=11, end=13, label="SHAPE_DIMENSION", text="10"),
+        ]
+    )
+
+    levels_requested = []
+
+    async def generate_levels(cad_request, levels):
+        levels_requested.extend(level.value for level in levels)
+        yield {"lod": "preview", "model_path": "/models/preview.gltf"}
+        yield {"lod": "standard", "model_path": "/models/standard.gltf"}
+        yield {"levels": [], "manifest_path": "/models/model.lods.json"}
+
+    mock_cad_client = MagicMock()
+    mock_cad_client.generate_levels = generate_levels
+
+    mock_get_client_factory.return_value.get_nlp_client.return_value = mock_nlp_client
+    mock_get_client_factory.return_value.get_cad_client.return_value = mock_cad_client
+
+    app.dependency_overrides[get_client_factory] = lambda: mock_get_client_factory()
+
+    client = TestClient(app)
+    response = client.post("/api/v1/pipeline/stream", json={"prompt": "Create box 10"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == [
+        "entities", "configuration", "preview", "model"
+    ]
+    assert events[0]["entities"][0]["text"] == "box"
+    assert events[2]["model_path"] == "/models/preview.gltf"
+    assert events[3]["file_path"] == "/models/standard.gltf"
+    assert levels_requested == ["preview", "standard"]
+
+    app.dependency_overrides = {}
+
+
+def test_pipeline_stream_reports_cad_errors():
+    import json
+
+    mock_get_client_factory = MagicMock()
+    mock_nlp_client = AsyncMock()
+    mock_nlp_client.extract_entities.return_value = NERResponse(entities=[])
+
+    async def generate_levels(cad_request, levels):
+        yield {"error": "CAD service failed"}
+
+    mock_cad_client = MagicMock()
+    mock_cad_client.generate_levels = generate_levels
+
+    mock_get_client_factory.return_value.get_nlp_client.return_value = mock_nlp_client
+    mock_get_client_factory.return_value.get_cad_client.return_value = mock_cad_client
+
+    app.dependency_overrides[get_client_factory] = lambda: mock_get_client_factory()
+
+    client = TestClient(app)
+    response = client.post("/api/v1/pipeline/stream", json={"prompt": "test prompt"})
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1] == {"event": "error", "message": "CAD service failed"}
+
+    app.dependency_overrides = {}
+
+
+def test_cad_client_streams_levels_and_closes_early():
+    import asyncio
+    import httpx
+    from contextlib import aclosing
+
+    from clients import CADClient, ServiceConfig
+    from shared.models.base import LevelOfDetail
+    from shared.models.requests import CADRequest
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = (
+            b'{"lod": "preview", "model_path": "/models/preview.gltf"}\n'
+            b'{"lod": "standard", "model_path": "/models/standard.gltf"}\n'
+        )
+        return httpx.Response(200, content=body)
+
+    async def run():
+        client = CADClient(ServiceConfig(base_url="http://cad/api/"))
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(
+            base_url="http://cad/api/", transport=httpx.MockTransport(handler)
+        )
+
+        levels = [LevelOfDetail.PREVIEW, LevelOfDetail.STANDARD]
+        stream = client.generate_levels(CADRequest(prompt="box"), levels)
+        async with aclosing(stream):
+            first = await anext(stream)
+        await client.close()
+        return first
+
+    first = asyncio.run(run())
+
+    assert first == {"lod": "preview", "model_path": "/models/preview.gltf"}
+    assert requests[0].url.path == "/api/v1/generate/lods"
+    assert requests[0].url.params.get_list("levels") == ["preview", "standard"]
+
+
+def test_cad_client_sends_and_parses_model_json():
+    import asyncio
+    import httpx
+
+    from clients import CADClient, ServiceConfig
+    from shared.models.base import CADConfiguration
+    from shared.models.helpers import create_box
+    from shared.models.requests import CADRequest
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=b'{"model_path": "/models/box.gltf"}')
+
+    async def run():
+        client = CADClient(ServiceConfig(base_url="http://cad/api/"))
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(
+            base_url="http://cad/api/", transport=httpx.MockTransport(handler)
+        )
+
+        config = CADConfiguration(shapes=[create_box(10, 10, 10, centered=True, id="a")])
+        response = await client.generate_geometry(CADRequest(prompt="box", config=config))
+        await client.close()
+        return response, config
+
+    response, config = asyncio.run(run())
+
+    assert isinstance(response, CADResponse)
+    assert response.model_path == "/models/box.gltf"
+    assert requests[0].headers["content-type"] == "application/json"
+    assert CADRequest.model_validate_json(requests[0].content).config == config
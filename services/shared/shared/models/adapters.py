@@ -0,0 +1,15 @@
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Return a TypeAdapter for a type, building its validator and serializer only once.
+
+    Only bare types need this, such as list[Entity]. A BaseModel compiles its
+    validator, including unions like Shape.parameters and FeatureUnion, when
+    the class is defined, and Model.model_validate_json already reuses it.
+    """
+    return TypeAdapter(tp)
@@ -6,6 +6,16 @@ from pydantic import BaseModel, Field
 from shared.models.features import FeatureUnion, CircularHole
 
 
+# Millimetres per unit, built once rather than on every conversion
+UNIT_CONVERSION_FACTORS = {
+    "mm": 1.0,
+    "cm": 10.0,
+    "m": 1000.0,
+    "in": 25.4,
+    "ft": 304.8,
+}
+
+
 class Units(str, Enum):
     MM = "mm"
     CM = "cm"
@@ -15,15 +25,7 @@ class Units(str, Enum):
 
     @staticmethod
     def get_conversion_factor(unit: str) -> float:
-        conversions = {
-            "mm": 1.0,
-            "cm": 10.0,
-            "m": 1000.0,
-            "in": 25.4,
-            "ft": 304.8,
-        }
-
-        return conversions.get(unit.lower(), 1.0)
+        return UNIT_CONVERSION_FACTORS.get(unit.lower(), 1.0)
 
     @staticmethod
     def convert_to_mm(value: float, from_unit: str) -> float:
@@ -44,6 +46,19 @@ class ExportFormat(str, Enum):
     PLY = "ply"
     AMF = "amf"
     THREE_MF = "3mf"
+    GLTF = "gltf"
+    GLB = "glb"
+
+
+class OutputMode(str, Enum):
+    FUSED = "fused"
+    ASSEMBLY = "assembly"
+
+
+class LevelOfDetail(str, Enum):
+    PREVIEW = "preview"
+    STANDARD = "standard"
+    FINE = "fine"
 
 
 class Metadata(BaseModel):
@@ -337,6 +352,13 @@ class PatternParameters(BaseModel):
     center: Optional[List[float]] = Field(None, min_length=3, max_length=3)
 
 
+class MirrorParameters(BaseModel):
+    type: Literal["mirror"] = "mirror"
+    plane: Plane = Plane.YZ
+    base_point: List[float] = Field([0, 0, 0], min_length=3, max_length=3)
+    keep_original: bool = True
+
+
 class BooleanParameters(BaseModel):
     type: Literal["boolean"] = "boolean"
     tool: str
@@ -361,6 +383,7 @@ class Operation(BaseModel):
             FilletParameters,
             ChamferParameters,
             ShellParameters,
+            MirrorParameters,
             ArrayParameters,
             PatternParameters,
         ]
@@ -435,7 +458,9 @@ class Export(BaseModel):
     filename: Optional[str] = None
     precision: float = Field(0.1, gt=0)
     angular_tolerance: float = Field(0.1, gt=0)
+    lod: Optional[LevelOfDetail] = None
     binary: bool = True
+    mode: OutputMode = OutputMode.FUSED
 
 
 class CADConfiguration(BaseModel):
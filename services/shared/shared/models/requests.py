@@ -15,6 +15,12 @@ class NERRequest(BaseModel):
     prompt: str = Field(..., description="Prompt text")
 
 
+class NERBatchRequest(BaseModel):
+    """Request model for batched Named Entity Recognition (NER)."""
+
+    prompts: list[str] = Field(..., description="Prompt texts")
+
+
 class CADRequest(BaseModel):
     """Request model for the CAD service."""
 
@@ -1,3 +1,5 @@
+from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -12,9 +14,38 @@ class NERResponse(BaseModel):
     )
 
 
+class NERBatchResponse(BaseModel):
+    error: Optional[str] = Field(None, description="Error message if any")
+    results: list[list[Entity]] = Field(
+        default_factory=list,
+        description="Extracted entities for each prompt, in request order",
+    )
+
+
 class CADResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if any")
     warnings: Optional[list[str]] = Field(None, description="Warnings if any")
     model_path: Optional[str] = Field(
         None, description="Path to the generated CAD model"
     )
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobResponse(BaseModel):
+    id: str = Field(..., description="Job identifier")
+    status: JobStatus = Field(..., description="Current job status")
+    progress: float = Field(0.0, description="Fraction of the job completed (0 to 1)")
+    stage: Optional[str] = Field(None, description="Current stage of the job")
+    model_path: Optional[str] = Field(
+        None, description="Path to the generated CAD model once the job succeeds"
+    )
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    updated_at: datetime = Field(..., description="When the job last changed")